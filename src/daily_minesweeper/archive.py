@@ -0,0 +1,336 @@
+"""Module to store many puzzles in one compact binary archive, read through mmap.
+
+Layout, all integers little endian:
+
+- header: magic `MSPZ`, version (u8), 3 padding bytes, puzzle count (u32)
+- index: offset of each puzzle from the start of the file (u64 each)
+- each puzzle: rows (u16), columns (u16), flags (u8), padding (u8), metadata
+  length (u16), metadata as utf-8 JSON, the clue plane and, when flag
+  `HAS_SOLUTION` is set, the solution plane.
+
+The clue plane holds 4 bits per cell in row-major order, the first cell of a byte in
+the high nibble: the number, or `NO_NUMBER`. The solution plane holds 2 bits per
+cell, the first cell of a byte in the two highest bits, see `SOLUTION_CODES`.
+
+Run `python -m daily_minesweeper.archive pack OUTPUT PATH...` to pack saved html
+and grid files, `python -m daily_minesweeper.archive info ARCHIVE` to time loading.
+"""
+
+import argparse
+import json
+import mmap
+import struct
+import sys
+import time
+import weakref
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from rich.console import Console
+
+from . import batch, solver
+
+console = Console()
+
+MAGIC = b"MSPZ"
+VERSION = 1
+SUFFIX = ".mspz"
+FILE_HEADER = struct.Struct("<4sB3xI")
+PUZZLE_HEADER = struct.Struct("<HHBxH")
+OFFSET_SIZE = 8
+
+# flags of a puzzle.
+HAS_SOLUTION = 1
+
+# clue nibble of a cell without number, decoded as value -1.
+NO_NUMBER = 15
+# 2-bit solution codes.
+SOLUTION_UNKNOWN = 0
+SOLUTION_MINE = 1
+SOLUTION_SAFE = 2
+SOLUTION_CODES = (SOLUTION_UNKNOWN, SOLUTION_MINE, SOLUTION_SAFE)
+
+# value byte of each nibble, `NO_NUMBER` is 255 which reads as -1 in a signed array.
+_NIBBLE_VALUE = bytes(255 if n == NO_NUMBER else n for n in range(16))
+# value of the high and low nibble of every byte.
+_HIGH_NIBBLE = bytes(_NIBBLE_VALUE[b >> 4] for b in range(256))
+_LOW_NIBBLE = bytes(_NIBBLE_VALUE[b & 15] for b in range(256))
+# 2-bit code at each position of a solution byte, from the highest bits.
+_SOLUTION_CODE = [bytes(b >> shift & 3 for b in range(256)) for shift in (6, 4, 2, 0)]
+
+
+@dataclass
+class ArchiveEntry:
+    """Puzzle to write, the mines are optional."""
+
+    clues: list[list[str]]
+    mines: set[tuple[int, int]] | None = None
+    metadata: dict = field(default_factory=dict)
+
+
+def pack_clues(clues: list[list[str]]) -> bytes:
+    """Clue plane, 4 bits per cell."""
+    nibbles = [int(v) if v else NO_NUMBER for row in clues for v in row]
+    if len(nibbles) % 2:
+        nibbles.append(NO_NUMBER)
+    return bytes(nibbles[k] << 4 | nibbles[k + 1] for k in range(0, len(nibbles), 2))
+
+
+def pack_solution(clues: list[list[str]], mines: set[tuple[int, int]]) -> bytes:
+    """Solution plane, 2 bits per cell."""
+    codes = [
+        SOLUTION_MINE if (r, c) in mines else SOLUTION_SAFE
+        for r, row in enumerate(clues)
+        for c in range(len(row))
+    ]
+    codes.extend([SOLUTION_UNKNOWN] * (-len(codes) % 4))
+    return bytes(
+        codes[k] << 6 | codes[k + 1] << 4 | codes[k + 2] << 2 | codes[k + 3]
+        for k in range(0, len(codes), 4)
+    )
+
+
+def encode_entry(entry: ArchiveEntry) -> bytes:
+    """Header, metadata and planes of one puzzle."""
+    rows, columns = len(entry.clues), len(entry.clues[0])
+    metadata = json.dumps(entry.metadata).encode("utf-8") if entry.metadata else b""
+    flags = HAS_SOLUTION if entry.mines is not None else 0
+    parts = [
+        PUZZLE_HEADER.pack(rows, columns, flags, len(metadata)),
+        metadata,
+        pack_clues(entry.clues),
+    ]
+    if entry.mines is not None:
+        parts.append(pack_solution(entry.clues, entry.mines))
+    return b"".join(parts)
+
+
+def write_archive(path: str | Path, entries: Iterable[ArchiveEntry]) -> int:
+    """Write puzzles into an archive.
+
+    Returns:
+        int: number of puzzles written.
+    """
+    records = [encode_entry(entry) for entry in entries]
+    offsets = array("Q")
+    offset = FILE_HEADER.size + OFFSET_SIZE * len(records)
+    for record in records:
+        offsets.append(offset)
+        offset += len(record)
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    with Path(path).open("wb") as f:
+        f.write(FILE_HEADER.pack(MAGIC, VERSION, len(records)))
+        f.write(offsets.tobytes())
+        for record in records:
+            f.write(record)
+    return len(records)
+
+
+class ArchivedPuzzleView:
+    """Puzzle of an archive, its planes are views into the mapped file."""
+
+    __slots__ = (
+        "__weakref__",
+        "clue_plane",
+        "columns",
+        "metadata",
+        "rows",
+        "solution_plane",
+    )
+
+    def __init__(self, buffer: memoryview, offset: int) -> None:
+        """Read the header of the puzzle at `offset`."""
+        self.rows, self.columns, flags, metadata_size = PUZZLE_HEADER.unpack_from(
+            buffer, offset
+        )
+        offset += PUZZLE_HEADER.size
+        metadata = bytes(buffer[offset : offset + metadata_size])
+        self.metadata: dict = json.loads(metadata) if metadata else {}
+        offset += metadata_size
+
+        size = self.rows * self.columns
+        clue_end = offset + (size + 1) // 2
+        self.clue_plane = buffer[offset:clue_end]
+        self.solution_plane = (
+            buffer[clue_end : clue_end + (size + 3) // 4]
+            if flags & HAS_SOLUTION
+            else None
+        )
+
+    def release(self) -> None:
+        """Release the planes, the view can not be decoded afterwards."""
+        self.clue_plane.release()
+        if self.solution_plane is not None:
+            self.solution_plane.release()
+
+    def values(self) -> array:
+        """Flat values in row-major order, -1 for a cell without number."""
+        plane = self.clue_plane.tobytes()
+        unpacked = bytearray(2 * len(plane))
+        unpacked[0::2] = plane.translate(_HIGH_NIBBLE)
+        unpacked[1::2] = plane.translate(_LOW_NIBBLE)
+        del unpacked[self.rows * self.columns :]
+        return array("b", unpacked)
+
+    def board(self, total_mines: int | None = None) -> solver.Board:
+        """Compact board of the puzzle, see `solver.Board.from_values`.
+
+        `total_mines` defaults to the mines of the solution, when the archive has one.
+        """
+        if total_mines is None and self.solution_plane is not None:
+            total_mines = self.solution_codes().count(1)
+        return solver.Board.from_values(
+            self.rows, self.columns, self.values(), total_mines
+        )
+
+    def to_array(self) -> list[list[str]]:
+        """2d array list of list with numbers or "", as from `parser`."""
+        values = self.values()
+        columns = self.columns
+        return [
+            ["" if v < 0 else str(v) for v in values[r * columns : (r + 1) * columns]]
+            for r in range(self.rows)
+        ]
+
+    def solution_codes(self) -> bytes | None:
+        """2-bit solution code of every cell, None if the archive has no solution."""
+        if self.solution_plane is None:
+            return None
+        plane = self.solution_plane.tobytes()
+        codes = bytearray(4 * len(plane))
+        for k, table in enumerate(_SOLUTION_CODE):
+            codes[k::4] = plane.translate(table)
+        return bytes(codes[: self.rows * self.columns])
+
+    def mines(self) -> set[tuple[int, int]] | None:
+        """Mine positions, None if the archive has no solution."""
+        codes = self.solution_codes()
+        if codes is None:
+            return None
+        columns = self.columns
+        return {divmod(i, columns) for i, code in enumerate(codes) if code == 1}
+
+
+class PuzzleArchive:
+    """Read-only archive mapped into memory, puzzles are decoded on access.
+
+    Use as a context manager to unmap the file, the puzzle views still referenced
+    are released then.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Map the file and read its index.
+
+        Raises:
+            Exception: if the file is not an archive of this version.
+        """
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+        # views handed out, released by `close` so the file can be unmapped.
+        self._views: weakref.WeakSet[ArchivedPuzzleView] = weakref.WeakSet()
+        self._offsets: memoryview | array = array("Q")
+
+        magic, version, count = FILE_HEADER.unpack_from(self._buffer)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise Exception(
+                f"expecting {MAGIC!r} archive version {VERSION}, "
+                f"received {magic!r} version {version}"
+            )
+        offsets = self._buffer[FILE_HEADER.size : FILE_HEADER.size + 8 * count]
+        self._offsets = offsets.cast("Q") if sys.byteorder == "little" else None
+        if self._offsets is None:
+            swapped = array("Q", offsets.tobytes())
+            swapped.byteswap()
+            self._offsets = swapped
+
+    def __len__(self) -> int:
+        """Number of puzzles."""
+        return len(self._offsets)
+
+    def __getitem__(self, idx: int) -> ArchivedPuzzleView:
+        """Puzzle at position `idx`."""
+        view = ArchivedPuzzleView(self._buffer, self._offsets[idx])
+        self._views.add(view)
+        return view
+
+    def __iter__(self) -> Iterator[ArchivedPuzzleView]:
+        """Every puzzle, in order."""
+        for offset in self._offsets:
+            view = ArchivedPuzzleView(self._buffer, offset)
+            self._views.add(view)
+            yield view
+
+    def close(self) -> None:
+        """Release the puzzle views and unmap the file.
+
+        Views still referenced can not be decoded afterwards, boards built from them
+        never refer to the file.
+
+        Raises:
+            BufferError: if a slice taken from a plane of a view is still referenced.
+        """
+        for view in list(self._views):
+            view.release()
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._buffer.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "PuzzleArchive":
+        """Use the archive for the block."""
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Unmap the file."""
+        self.close()
+
+
+def main(args: list[str]) -> int:
+    """Pack saved puzzles into an archive, or time loading one."""
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+    pack = commands.add_parser("pack", help="pack html and grid files")
+    pack.add_argument("output")
+    pack.add_argument("paths", nargs="+", help="files or directories")
+    info = commands.add_parser("info", help="time decoding every puzzle")
+    info.add_argument("archive")
+    options = arg_parser.parse_args(args[1:])
+
+    if options.command == "pack":
+        paths = []
+        for path in map(Path, options.paths):
+            paths.extend(batch.find_puzzles(path) if path.is_dir() else [path])
+        count = write_archive(
+            options.output,
+            (
+                ArchiveEntry(batch.load_puzzle(path), metadata={"name": path.name})
+                for path in paths
+            ),
+        )
+        size = Path(options.output).stat().st_size
+        console.print(f"{count} puzzles packed into {options.output}, {size} bytes")
+        return 0
+
+    start = time.perf_counter()
+    cells = 0
+    with PuzzleArchive(options.archive) as puzzles:
+        count = len(puzzles)
+        for puzzle in puzzles:
+            puzzle.board()
+            cells += puzzle.rows * puzzle.columns
+    console.print(
+        f"{count} puzzles, {cells} cells decoded into boards "
+        f"in {(time.perf_counter() - start) * 1000:.1f}ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,264 @@
+"""Module to solve saved puzzles in parallel processes, without any display.
+
+Run with `python -m daily_minesweeper.batch DIRECTORY` or `src/solve_batch.py`.
+Every puzzle gives one JSONL record, in the order of the sorted file names.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from pathlib import Path
+
+from rich.console import Console
+
+from . import cache, parser, profiling, registry, sat, scheduler, solver
+from .data_model import CellState
+
+console = Console(stderr=True)
+
+HTML_SUFFIXES = (".html", ".htm")
+GRID_SUFFIXES = (".grid", ".txt")
+
+# same strategies as `main.logical_strategy`.
+BATCH_STRATEGIES: list[scheduler.Strategy] = registry.select()
+
+
+def find_puzzles(directory: str | Path) -> list[Path]:
+    """Saved game html and grid files of a directory, sorted by name."""
+    return sorted(
+        path
+        for path in Path(directory).iterdir()
+        if path.suffix in HTML_SUFFIXES + GRID_SUFFIXES
+    )
+
+
+def load_puzzle(path: str | Path) -> list[list[str]]:
+    """Read a saved game html or text grid into 2d array.
+
+    Raises:
+        Exception: if the file is neither html nor grid.
+    """
+    path = Path(path)
+    with path.open("r", encoding="utf-8") as f:
+        return parse_puzzle(f.read(), path.suffix)
+
+
+def parse_puzzle(text: str, suffix: str) -> list[list[str]]:
+    """Parse the text of a saved game html or text grid, by its file suffix.
+
+    Raises:
+        Exception: if the suffix is neither html nor grid.
+    """
+    if suffix in HTML_SUFFIXES:
+        return parser.parse_page_into_array(text)
+    if suffix in GRID_SUFFIXES:
+        return parser.parse_grid_into_array(text)
+
+    raise Exception(
+        f"expecting one of {HTML_SUFFIXES + GRID_SUFFIXES}, received {suffix}"
+    )
+
+
+def solve_headless(
+    board: solver.Board, strategies: list[scheduler.Strategy], sat_fallback: bool = True
+) -> scheduler.SolveStats:
+    """Run the strategies, then the SAT backend each time they stall, as `main.solve`."""
+    stats = scheduler.solve(board, strategies)
+    while sat_fallback and board.get_all_cells_by_state(CellState.unmarked):
+        if not sat.solve_board(board):
+            break
+        stats.add(scheduler.solve(board, strategies))
+    return stats
+
+
+def cached_record(
+    record: dict, array: list[list[str]], cached: cache.CachedSolution
+) -> dict:
+    """Record of a cached solve, with the same fields as a new one."""
+    # only full solves are cached.
+    cells = sum(value == "" for row in array for value in row)
+    return {
+        **record,
+        "rows": cached.rows,
+        "columns": cached.columns,
+        "cells": cells,
+        "solved": cells,
+        "solved_fraction": 1.0,
+        "time_ms": None,
+        "invocations": None,
+        "deductions": None,
+        "strategies": {},
+        **{k: v for k, v in cached.stats.items() if k != "file"},
+        "cached": True,
+    }
+
+
+def solve_file(
+    path: str | Path,
+    sat_fallback: bool = True,
+    cache_path: str | Path | None = None,
+    strategies: list[str] | None = None,
+) -> dict:
+    """Solve a single saved puzzle.
+
+    Errors are recorded instead of raised, so that one bad file does not stop the
+    batch. With `cache_path`, a puzzle solved before with the same strategies and
+    SAT setting gives back the record stored by that solve with `"cached": true`.
+    Its time and counters are those of the first solve, None if it was stored by
+    `main`. New full solves are stored, see `cache.SolveCache`. `strategies` are
+    registered names, `BATCH_STRATEGIES` if None.
+
+    Returns:
+        dict: record with the size, the solved fraction, the time in milliseconds
+            and the counters of each strategy.
+    """
+    record = {"file": str(path)}
+    try:
+        array = load_puzzle(path)
+        specs = BATCH_STRATEGIES if strategies is None else registry.select(strategies)
+        key = cache.solve_key(array, (spec.name for spec in specs), sat_fallback)
+        if cache_path is not None:
+            with cache.SolveCache(cache_path) as solve_cache:
+                cached = solve_cache.get(key)
+            if cached is not None:
+                return cached_record(record, array, cached)
+
+        start = time.perf_counter()
+        board = solver.Board(array)
+        cells = len(board.get_all_cells_by_state(CellState.unmarked))
+
+        profiler = profiling.StrategyProfiler()
+        stats = solve_headless(board, profiler.wrap_all(specs), sat_fallback)
+        elapsed = time.perf_counter() - start
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+        return record
+
+    solved = cells - len(board.get_all_cells_by_state(CellState.unmarked))
+    record.update(
+        {
+            "rows": board.rows,
+            "columns": board.columns,
+            "cells": cells,
+            "solved": solved,
+            "solved_fraction": solved / cells if cells else 1.0,
+            "time_ms": elapsed * 1000,
+            "invocations": stats.invocations,
+            "deductions": stats.deductions,
+            "strategies": {
+                name: {
+                    "invocations": profile.invocations,
+                    "deductions": profile.deductions,
+                    "cells_changed": profile.cells_changed,
+                    "time_ms": profile.time_ns / 1e6,
+                }
+                for name, profile in profiler.profiles.items()
+            },
+            "cached": False,
+        }
+    )
+    if cache_path is not None:
+        with cache.SolveCache(cache_path) as solve_cache:
+            solve_cache.store(key, board, record)
+    return record
+
+
+def run_batch(
+    paths: list[Path],
+    workers: int | None = None,
+    sat_fallback: bool = True,
+    cache_path: str | Path | None = None,
+    strategies: list[str] | None = None,
+) -> Iterator[dict]:
+    """Solve puzzles across a process pool, yielding records in the order of paths.
+
+    Args:
+        paths (list[Path]): saved puzzles
+        workers (int | None, optional): number of processes, all cores if None
+        sat_fallback (bool, optional): run the SAT backend when strategies stall
+        cache_path (str | Path | None, optional): sqlite file of solved puzzles
+            shared by the workers, no cache if None
+        strategies (list[str] | None, optional): registered names of the
+            strategies, `BATCH_STRATEGIES` if None
+
+    Yields:
+        dict: record of each puzzle, see `solve_file`.
+    """
+    workers = workers or os.cpu_count() or 1
+    # a few chunks per worker, so thousands of small puzzles are not sent one by
+    # one while large puzzles still spread evenly.
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(
+            partial(
+                solve_file,
+                sat_fallback=sat_fallback,
+                cache_path=cache_path,
+                strategies=strategies,
+            ),
+            paths,
+            chunksize=chunksize,
+        )
+
+
+def main(args: list[str]) -> int:
+    """Solve every puzzle of a directory and write JSONL records.
+
+    Returns:
+        int: exit code, 1 if any puzzle failed with an error.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("directory", help="directory of game html or grid files")
+    arg_parser.add_argument("-o", "--output", help="JSONL file, stdout if not given")
+    arg_parser.add_argument("-j", "--workers", type=int, default=None)
+    arg_parser.add_argument("--no-sat", action="store_true", help="strategies only")
+    arg_parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help="sqlite file of solved puzzles, none if not given",
+    )
+    arg_parser.add_argument(
+        "--strategies",
+        nargs="+",
+        choices=list(registry.REGISTRY),
+        metavar="NAME",
+        help=f"strategies to run, cheapest first, from {', '.join(registry.REGISTRY)}",
+    )
+    options = arg_parser.parse_args(args[1:])
+
+    paths = find_puzzles(options.directory)
+
+    start = time.perf_counter()
+    solved = errors = 0
+    with (
+        Path(options.output).open("w", encoding="utf-8")
+        if options.output
+        else nullcontext(sys.stdout)
+    ) as out:
+        records = run_batch(
+            paths,
+            options.workers,
+            not options.no_sat,
+            options.cache,
+            options.strategies,
+        )
+        for record in records:
+            out.write(json.dumps(record) + "\n")
+            errors += "error" in record
+            solved += record.get("solved_fraction") == 1.0
+
+    console.print(
+        f"{len(paths)} puzzles, {solved} fully solved, {errors} errors "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
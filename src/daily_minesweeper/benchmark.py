@@ -0,0 +1,515 @@
+"""Micro benchmarks for the solver, run with `python -m daily_minesweeper.benchmark`."""
+
+import io
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from functools import partial
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+from rich.console import Console, Group
+from rich.table import Table
+
+from . import (
+    archive,
+    constants,
+    display,
+    gaussian,
+    parallel,
+    parser,
+    profiling,
+    registry,
+    scheduler,
+    solver,
+)
+from .data_model import CellState
+from .generator import generate_puzzle
+from .solver import STORAGE_CELLS, STORAGE_COMPACT, Board
+
+console = Console()
+
+
+def _clamped_adjacent_cells(board: Board, row: int, col: int) -> list[tuple[int, int]]:
+    """Compute neighbors with min/max clamping on every call, as a reference."""
+    result = []
+    max_height = min(row + 1, board.rows - 1)
+    min_height = max(row - 1, 0)
+    max_width = min(col + 1, board.columns - 1)
+    min_width = max(col - 1, 0)
+
+    for i in range(min_height, max_height + 1):
+        for j in range(min_width, max_width + 1):
+            if i == row and j == col:
+                continue
+            result.append((i, j))
+
+    return result
+
+
+def _clamped_adjacent_cell_state(
+    board: Board, row: int, col: int, state: CellState
+) -> list[tuple[int, int]]:
+    """Filter the clamped neighbors by state, as a reference."""
+    neighbors = _clamped_adjacent_cells(board, row, col)
+    return [(r, c) for r, c in neighbors if board[r][c].state == state]
+
+
+def bench_neighbors(sizes: tuple[int, ...] = (20, 200), repeat: int = 3) -> Table:
+    """Compare per-call neighbor computation against the precomputed table."""
+    table = Table(title="neighbor lookup, full board sweep (best of runs, ms)")
+    for column in ("size", "function", "clamped", "table", "speedup"):
+        table.add_column(column, justify="right")
+
+    for size in sizes:
+        board = Board(generate_puzzle(size, size, seed=size).clues)
+        cells = [(r, c) for r in range(board.rows) for c in range(board.columns)]
+
+        cases = {
+            "get_adjacent_cells": (
+                lambda: [_clamped_adjacent_cells(board, r, c) for r, c in cells],
+                lambda: [board.get_adjacent_cells(r, c) for r, c in cells],
+            ),
+            "get_adjacent_cell_state": (
+                lambda: [
+                    _clamped_adjacent_cell_state(board, r, c, CellState.unmarked)
+                    for r, c in cells
+                ],
+                lambda: [
+                    board.get_adjacent_cell_state(r, c, CellState.unmarked)
+                    for r, c in cells
+                ],
+            ),
+        }
+        for name, (reference, candidate) in cases.items():
+            assert reference() == candidate()
+            before = min(timeit.repeat(reference, number=1, repeat=repeat)) * 1000
+            after = min(timeit.repeat(candidate, number=1, repeat=repeat)) * 1000
+            table.add_row(
+                f"{size}x{size}",
+                name,
+                f"{before:.2f}",
+                f"{after:.2f}",
+                f"{before / after:.2f}x",
+            )
+
+    return table
+
+
+def bench_memory(sizes: tuple[int, ...] = (20, 200, 500)) -> Table:
+    """Compare the memory allocated by `Board` for each storage mode.
+
+    The neighbor table is shared by the boards of the same size and left out of
+    the allocation of a board, it is measured on its own and added to both modes
+    for the last ratio.
+    """
+    table = Table(title="board memory (bytes per cell)")
+    for column in (
+        "size",
+        STORAGE_CELLS,
+        STORAGE_COMPACT,
+        "ratio",
+        "neighbor table",
+        "ratio with table",
+    ):
+        table.add_column(column, justify="right")
+
+    for size in sizes:
+        clues = generate_puzzle(size, size, seed=size).clues
+        cells = size * size
+        per_cell = {}
+        for storage in (STORAGE_CELLS, STORAGE_COMPACT):
+            # the neighbor table is shared by boards of the same size, warm it up.
+            Board(clues, storage=storage)
+            tracemalloc.start()
+            board = Board(clues, storage=storage)
+            allocated, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            per_cell[storage] = allocated / cells
+            del board
+
+        neighbors = sum(
+            len(a) * a.itemsize for a in solver.build_neighbor_table(size, size)
+        )
+        neighbors /= cells
+        cells_total = per_cell[STORAGE_CELLS] + neighbors
+        compact_total = per_cell[STORAGE_COMPACT] + neighbors
+        table.add_row(
+            f"{size}x{size}",
+            f"{per_cell[STORAGE_CELLS]:.1f}",
+            f"{per_cell[STORAGE_COMPACT]:.1f}",
+            f"{per_cell[STORAGE_CELLS] / per_cell[STORAGE_COMPACT]:.1f}x",
+            f"{neighbors:.1f}",
+            f"{cells_total / compact_total:.1f}x",
+        )
+
+    return table
+
+
+LOGICAL_STRATEGY = registry.select(
+    [
+        "flag_all_numbers",
+        "flag_remaining_unmarked",
+        "deduce_from_neighbors_and_flag",
+        "suspect_adjacent_candidates_and_mark_neighbor_empty",
+    ]
+)
+# same strategies without their radius, checked again within `RECHECK_RADIUS`.
+PLAIN_STRATEGY = [spec.function for spec in LOGICAL_STRATEGY]
+
+
+def bench_scheduler(sizes: tuple[int, ...] = (20, 60)) -> Table:
+    """Compare the worklist scheduler against restarting after each change.
+
+    Invocations saved are measured against the exact count of `solve_naive`.
+    """
+    table = Table(title="solve loop (ms, strategy invocations)")
+    for column in (
+        "size",
+        "loop",
+        "time",
+        "invocations",
+        "saved vs naive",
+        "deductions",
+        "updates",
+    ):
+        table.add_column(column, justify="right")
+
+    for size in sizes:
+        clues = generate_puzzle(size, size, clue_density=0.5, seed=size).clues
+        for name, solve, strategies in (
+            ("naive", scheduler.solve_naive, LOGICAL_STRATEGY),
+            ("worklist, one radius", scheduler.solve, PLAIN_STRATEGY),
+            ("worklist", scheduler.solve, LOGICAL_STRATEGY),
+            (
+                "worklist, batched",
+                partial(scheduler.solve, batched=True),
+                LOGICAL_STRATEGY,
+            ),
+        ):
+            board = Board(clues)
+            start = timeit.default_timer()
+            stats = solve(board, strategies)
+            elapsed = (timeit.default_timer() - start) * 1000
+            if name == "naive":
+                naive_invocations = stats.invocations
+            table.add_row(
+                f"{size}x{size}",
+                name,
+                f"{elapsed:.1f}",
+                str(stats.invocations),
+                str(naive_invocations - stats.invocations),
+                str(stats.deductions),
+                str(stats.commits),
+            )
+
+    return table
+
+
+def bench_subset(sizes: tuple[int, ...] = (20, 60, 120)) -> Table:
+    """Compare the bitmask subset engine against the neighbor pattern strategies."""
+    table = Table(title="subset reasoning vs pattern strategies (worklist solve)")
+    for column in ("size", "strategies", "time (ms)", "cells solved"):
+        table.add_column(column, justify="right")
+
+    candidates = {
+        "patterns": LOGICAL_STRATEGY,
+        "subset": [solver.subset_reasoning],
+    }
+    for size in sizes:
+        clues = generate_puzzle(size, size, clue_density=0.5, seed=size).clues
+        for name, strategies in candidates.items():
+            board = Board(clues)
+            start = timeit.default_timer()
+            stats = scheduler.solve(board, strategies)
+            elapsed = (timeit.default_timer() - start) * 1000
+            table.add_row(
+                f"{size}x{size}", name, f"{elapsed:.1f}", str(stats.cells_changed)
+            )
+
+    return table
+
+
+def bench_gaussian() -> Table:
+    """Compare batched Gaussian elimination against the strategy list on the 20x20 sample."""
+    table = Table(title="gaussian elimination on constants.SAMPLE_BOARD_20")
+    for column in ("method", "time (ms)", "passes", "unmarked left"):
+        table.add_column(column, justify="right")
+
+    def patterns(board: Board) -> int:
+        """Worklist solve with the pattern strategies."""
+        scheduler.solve(board, LOGICAL_STRATEGY)
+        return 1
+
+    def elimination(board: Board) -> int:
+        """Whole board elimination passes until nothing changes."""
+        passes = 1
+        while gaussian.eliminate_board(board):
+            passes += 1
+        return passes
+
+    def combined(board: Board) -> int:
+        """Pattern strategies, with an elimination pass each time they stall."""
+        passes = patterns(board)
+        while gaussian.eliminate_board(board):
+            passes += patterns(board)
+        return passes
+
+    for name, method in (
+        ("patterns", patterns),
+        ("elimination", elimination),
+        ("patterns + elimination", combined),
+    ):
+        board = Board(constants.SAMPLE_BOARD_20)
+        start = timeit.default_timer()
+        passes = method(board)
+        elapsed = (timeit.default_timer() - start) * 1000
+        unmarked = len(board.get_all_cells_by_state(CellState.unmarked))
+        table.add_row(name, f"{elapsed:.1f}", str(passes), str(unmarked))
+
+    return table
+
+
+def bench_profiling(size: int = 120, repeat: int = 10) -> Group:
+    """Measure the overhead of profiling the strategies, and show the profile.
+
+    The whole solve varies by a few percent between runs, so the overhead is also
+    estimated from the cost of the wrapper around a strategy doing nothing.
+    """
+    table = Table(title=f"profiling overhead, worklist solve {size}x{size}")
+    for column in ("profiling", "time (ms)", "overhead", "ns per call", "estimated"):
+        table.add_column(column, justify="right")
+
+    clues = generate_puzzle(size, size, clue_density=0.5, seed=size).clues
+    profilers = {}
+
+    def run(sample_every: int | None) -> None:
+        """Solve a fresh board, with strategies wrapped unless None."""
+        strategies = LOGICAL_STRATEGY
+        if sample_every is not None:
+            profilers[sample_every] = profiling.StrategyProfiler(sample_every)
+            strategies = profilers[sample_every].wrap_all(strategies)
+        scheduler.solve(Board(clues), strategies)
+
+    # interleave the runs, so that noise spreads evenly between them.
+    cases = {"off": None, "sampled": profiling.SAMPLE_EVERY, "every call": 1}
+    timings = {name: [] for name in cases}
+    for _ in range(repeat):
+        for name, sample_every in cases.items():
+            timings[name].append(timeit.timeit(lambda: run(sample_every), number=1))
+
+    def noop(row: int, col: int, board: Board) -> bool:
+        """Strategy that finds nothing."""
+        return False
+
+    board = Board(clues)
+    calls = 100_000
+    noop_ns = {}
+    for name, sample_every in cases.items():
+        wrapped = (
+            noop
+            if sample_every is None
+            else profiling.StrategyProfiler(sample_every).wrap(noop)
+        )
+        best = min(
+            timeit.repeat(lambda f=wrapped: f(0, 0, board), number=calls, repeat=5)
+        )
+        noop_ns[name] = best * 1e9 / calls
+
+    invocations = sum(p.invocations for p in profilers[1].profiles.values())
+    baseline = min(timings["off"])
+    for name, runs in timings.items():
+        best = min(runs)
+        per_call = noop_ns[name] - noop_ns["off"]
+        table.add_row(
+            name,
+            f"{best * 1000:.1f}",
+            f"{best / baseline - 1:+.1%}",
+            f"{per_call:.0f}",
+            f"{per_call * invocations / 1e9 / baseline:+.1%}",
+        )
+
+    profiler = profilers[profiling.SAMPLE_EVERY]
+    return Group(table, display.draw_profile(profiler.ranked()))
+
+
+def bench_display(sizes: tuple[int, ...] = (30, 100), frames: int = 10) -> Table:
+    """Compare full table redraws against the kept rows of `BoardView`.
+
+    Each frame follows a few deductions, as the render thread would see them.
+    """
+    table = Table(title=f"console frames, {frames} frames over a solve (ms)")
+    for column in ("size", "full redraw", "dirty rows", "speedup"):
+        table.add_column(column, justify="right")
+
+    for size in sizes:
+        clues = generate_puzzle(size, size, clue_density=0.5, seed=size).clues
+        timings = {}
+        for name in ("full redraw", "dirty rows"):
+            board = Board(clues)
+            board.drain_dirty_rows()
+            view = display.BoardView(board)
+            sink = Console(file=io.StringIO(), width=4 * size + 10)
+            number_cells = board.get_all_cells_by_state(CellState.is_number)
+            step = max(1, len(number_cells) // frames)
+
+            start = timeit.default_timer()
+            for k in range(0, len(number_cells), step):
+                for r, c in number_cells[k : k + step]:
+                    for strategy in LOGICAL_STRATEGY:
+                        strategy(r, c, board)
+                if name == "full redraw":
+                    sink.print(display.draw_board(board))
+                else:
+                    view.update(board.drain_dirty_rows())
+                    sink.print(view)
+            timings[name] = (timeit.default_timer() - start) * 1000
+
+        table.add_row(
+            f"{size}x{size}",
+            f"{timings['full redraw']:.1f}",
+            f"{timings['dirty rows']:.1f}",
+            f"{timings['full redraw'] / timings['dirty rows']:.1f}x",
+        )
+
+    return table
+
+
+def bench_parser(sizes: tuple[int, ...] = (30, 100), repeat: int = 3) -> Table:
+    """Compare BeautifulSoup parsing of a page against the regex tokenizer."""
+    table = Table(title="page source to grid (best of runs, ms)")
+    for column in ("size", "beautifulsoup", "regex", "speedup"):
+        table.add_column(column, justify="right")
+
+    for size in sizes:
+        clues = generate_puzzle(size, size, seed=size).clues
+        # the game div inside some unrelated markup, as in the page source.
+        page = (
+            "<html><body><div id='header'>"
+            + "<p class='cell'>menu</p>" * 2000
+            + "</div>"
+            + parser.format_array_as_html(clues)
+            + "</body></html>"
+        )
+
+        def soup() -> list[list[str]]:
+            """Find the game div in the page, then parse its cells."""
+            bs = BeautifulSoup(page, "html.parser")
+            return parser.parse_html_into_array(str(bs.find(id=constants.GAME_ID)))
+
+        def regex() -> list[list[str]]:
+            """Parse the page source directly."""
+            return parser.parse_page_into_array(page)
+
+        assert soup() == regex() == clues
+        before = min(timeit.repeat(soup, number=1, repeat=repeat)) * 1000
+        after = min(timeit.repeat(regex, number=1, repeat=repeat)) * 1000
+        table.add_row(
+            f"{size}x{size}", f"{before:.1f}", f"{after:.1f}", f"{before / after:.1f}x"
+        )
+
+    return table
+
+
+def bench_archive(count: int = 200, size: int = 30, repeat: int = 3) -> Table:
+    """Compare building boards of a corpus from html pages against an archive."""
+    table = Table(title=f"{count} puzzles {size}x{size} to boards (best of runs, ms)")
+    for column in ("source", "bytes", "load", "speedup"):
+        table.add_column(column, justify="right")
+
+    puzzles = [generate_puzzle(size, size, seed=seed) for seed in range(count)]
+    pages = [parser.format_array_as_html(puzzle.clues) for puzzle in puzzles]
+    with tempfile.TemporaryDirectory() as folder:
+        path = f"{folder}/corpus{archive.SUFFIX}"
+        archive.write_archive(
+            path, (archive.ArchiveEntry(p.clues, p.mines) for p in puzzles)
+        )
+
+        def from_html() -> list[Board]:
+            """Parse every page into a compact board."""
+            return [
+                Board(parser.parse_page_into_array(page), STORAGE_COMPACT)
+                for page in pages
+            ]
+
+        def from_archive() -> list[Board]:
+            """Map the archive and decode every puzzle into a compact board."""
+            with archive.PuzzleArchive(path) as corpus:
+                return [puzzle.board() for puzzle in corpus]
+
+        assert [b.snapshot() for b in from_html()] == [
+            b.snapshot() for b in from_archive()
+        ]
+        before = min(timeit.repeat(from_html, number=1, repeat=repeat)) * 1000
+        after = min(timeit.repeat(from_archive, number=1, repeat=repeat)) * 1000
+        archive_bytes = Path(path).stat().st_size
+
+    table.add_row("html", str(sum(map(len, pages))), f"{before:.1f}", "1.0x")
+    table.add_row(
+        "archive", str(archive_bytes), f"{after:.1f}", f"{before / after:.1f}x"
+    )
+    return table
+
+
+def bench_parallel(
+    size: int = 300, workers: tuple[int, ...] = (1, 2, 4), tile_size: int = 64
+) -> Table:
+    """Compare solving by tiles across processes against one core."""
+    table = Table(
+        title=f"{size}x{size} solve by tiles of {tile_size} "
+        f"({os.cpu_count()} cores, seconds)"
+    )
+    for column in ("workers", "time", "speedup", "rounds", "tiles solved"):
+        table.add_column(column, justify="right")
+
+    clues = generate_puzzle(size, size, clue_density=0.5, seed=size).clues
+    board = Board(clues)
+    start = timeit.default_timer()
+    scheduler.solve(board, LOGICAL_STRATEGY)
+    single = timeit.default_timer() - start
+    table.add_row("single core", f"{single:.2f}", "1.0x", "-", "-")
+
+    for count in workers:
+        tiled = Board(clues)
+        start = timeit.default_timer()
+        stats = parallel.solve_parallel(tiled, LOGICAL_STRATEGY, count, tile_size)
+        elapsed = timeit.default_timer() - start
+        assert tiled.snapshot() == board.snapshot()
+        table.add_row(
+            str(count),
+            f"{elapsed:.2f}",
+            f"{single / elapsed:.2f}x",
+            str(stats.rounds),
+            str(stats.tiles_solved),
+        )
+
+    return table
+
+
+BENCHMARKS = {
+    "neighbors": bench_neighbors,
+    "memory": bench_memory,
+    "scheduler": bench_scheduler,
+    "subset": bench_subset,
+    "gaussian": bench_gaussian,
+    "profiling": bench_profiling,
+    "display": bench_display,
+    "parser": bench_parser,
+    "archive": bench_archive,
+    "parallel": bench_parallel,
+}
+
+
+def main(args: list[str]) -> None:
+    """Run the selected benchmarks, or all of them if none is given."""
+    selected = args[1:] or list(BENCHMARKS)
+    for name in selected:
+        if name not in BENCHMARKS:
+            raise Exception(f"expecting one of {list(BENCHMARKS)}, received {name}")
+        console.print(BENCHMARKS[name]())
+
+
+if __name__ == "__main__":
+    main(sys.argv)
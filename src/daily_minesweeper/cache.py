@@ -0,0 +1,180 @@
+"""Module to cache solved puzzles on disk, keyed by a fingerprint of the clue grid.
+
+The daily puzzle is the same all day, so a second run after a crash or a failed
+click pass reads the flags back instead of solving again. Entries live in a sqlite
+file and the least recently used ones are evicted beyond `MAX_ENTRIES`.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from . import parser, planner
+from .data_model import CellState
+from .solver import Board
+
+DEFAULT_PATH = ".minesweeper_cache.sqlite"
+MAX_ENTRIES = 1000
+# seconds to wait on another process writing the same file, e.g. batch workers.
+LOCK_TIMEOUT = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS solutions (
+    key TEXT PRIMARY KEY,
+    rows INTEGER NOT NULL,
+    columns INTEGER NOT NULL,
+    flags BLOB NOT NULL,
+    stats TEXT NOT NULL,
+    last_used INTEGER NOT NULL
+)
+"""
+
+
+def fingerprint(array: list[list[str]], settings: str = "") -> str:
+    """Hash of the clue grid, the same for the html, text grid or DOM of a puzzle.
+
+    Args:
+        array (list[list[str]]): clue grid
+        settings (str, optional): hashed with the grid, e.g. the strategies of a
+            batch, so that other settings do not share the entry.
+    """
+    grid = parser.format_array_as_grid(array)
+    if settings:
+        grid += f"\n{settings}"
+    return hashlib.sha256(grid.encode("utf-8")).hexdigest()
+
+
+def solve_key(
+    array: list[list[str]], strategies: Iterable[str], sat_fallback: bool
+) -> str:
+    """Fingerprint of a puzzle solved with the named strategies and SAT setting.
+
+    `main` and `batch` build their keys here, so they share the entries of the same
+    settings and never read a solve made with other strategies.
+    """
+    settings = json.dumps({"strategies": sorted(strategies), "sat": sat_fallback})
+    return fingerprint(array, settings)
+
+
+@dataclass
+class CachedSolution:
+    """Flags of a solved board, with the stats of the solve that found them."""
+
+    rows: int
+    columns: int
+    # one byte per cell in row-major order, see `planner.flag_bitmap`.
+    flags: bytes
+    stats: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_board(cls, board: Board, stats: dict | None = None) -> "CachedSolution":
+        """Record the flags of a board."""
+        return cls(
+            board.rows, board.columns, bytes(planner.flag_bitmap(board)), stats or {}
+        )
+
+    def apply(self, board: Board) -> None:
+        """Flag the cached cells on a board of the same puzzle.
+
+        Raises:
+            Exception: if the board size differs.
+        """
+        if (board.rows, board.columns) != (self.rows, self.columns):
+            raise Exception(
+                f"expecting {self.rows} x {self.columns} board, "
+                f"received {board.rows} x {board.columns}"
+            )
+        columns = self.columns
+        for index, flag in enumerate(self.flags):
+            if flag:
+                board.set_state(index // columns, index % columns, CellState.flag)
+
+
+class SolveCache:
+    """Solved puzzles in a sqlite file, with least recently used eviction."""
+
+    def __init__(
+        self, path: str | Path = DEFAULT_PATH, max_entries: int = MAX_ENTRIES
+    ) -> None:
+        """Open or create the cache file.
+
+        Args:
+            path (str | Path, optional): sqlite file
+            max_entries (int, optional): puzzles kept, the least recently used are
+                evicted beyond
+        """
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path, timeout=LOCK_TIMEOUT)
+        with self.connection:
+            self.connection.execute(SCHEMA)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> CachedSolution | None:
+        """Return the solution of a fingerprint, marking it as recently used."""
+        with self.connection:
+            row = self.connection.execute(
+                "SELECT rows, columns, flags, stats FROM solutions WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.connection.execute(
+                "UPDATE solutions SET last_used = ? WHERE key = ?",
+                (time.time_ns(), key),
+            )
+        self.hits += 1
+        rows, columns, flags, stats = row
+        return CachedSolution(rows, columns, flags, json.loads(stats))
+
+    def put(self, key: str, solution: CachedSolution) -> None:
+        """Store the solution of a fingerprint, then evict beyond `max_entries`."""
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    solution.rows,
+                    solution.columns,
+                    solution.flags,
+                    json.dumps(solution.stats),
+                    time.time_ns(),
+                ),
+            )
+            self.connection.execute(
+                "DELETE FROM solutions WHERE key NOT IN "
+                "(SELECT key FROM solutions ORDER BY last_used DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def store(self, key: str, board: Board, stats: dict) -> bool:
+        """Store the flags of a board if it is fully solved.
+
+        Returns:
+            bool: whether the board was stored.
+        """
+        if board.get_all_cells_by_state(CellState.unmarked):
+            return False
+        self.put(key, CachedSolution.from_board(board, stats))
+        return True
+
+    def __len__(self) -> int:
+        """Number of cached puzzles."""
+        return self.connection.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the file."""
+        self.connection.close()
+
+    def __enter__(self) -> "SolveCache":
+        """Use the cache for the block."""
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Close the file."""
+        self.close()
@@ -32,3 +32,30 @@ DIFFICULTY = [
 GAME_ID = "game"
 CELL_CLASS = "cell"
 NUMBER_CLASS = "number"
+
+## SAMPLE BOARDS
+# 20x20 hard board, used by `display` and the benchmarks.
+# fmt: off
+SAMPLE_BOARD_20 = [
+    ['', '', '', '2', '', '', '', '', '', '', '', '', '1', '', '', '', '', '3', '', ''],
+    ['2', '', '', '', '', '2', '', '1', '', '0', '', '', '2', '', '1', '1', '', '', '', '2'],
+    ['', '', '4', '', '3', '', '', '2', '', '', '', '2', '', '', '1', '', '3', '', '', '1'],
+    ['', '', '', '', '2', '', '', '2', '1', '1', '', '', '', '', '1', '', '2', '', '2', ''],
+    ['', '1', '1', '', '', '', '1', '2', '', '', '', '2', '', '2', '', '', '', '', '3', ''],
+    ['', '1', '0', '2', '', '', '', '', '', '', '', '', '0', '1', '', '1', '', '', '', ''],
+    ['', '2', '', '', '4', '4', '', '2', '', '1', '', '', '1', '', '', '', '', '3', '4', ''],
+    ['', '', '2', '', '', '', '4', '', '', '', '', '', '', '3', '', '1', '', '', '', '2'],
+    ['3', '', '4', '', '', '', '', '3', '2', '2', '3', '', '', '', '3', '', '1', '', '', '2'],
+    ['', '', '2', '', '', '4', '', '', '', '', '', '', '4', '', '', '', '3', '', '1', '1'],
+    ['', '2', '', '', '3', '', '', '', '', '', '2', '', '', '', '', '', '', '', '', ''],
+    ['0', '', '', '2', '2', '3', '', '2', '', '1', '', '2', '2', '', '', '5', '', '4', '', '1'],
+    ['1', '', '4', '', '', '', '', '', '', '1', '', '', '', '', '', '', '', '', '', ''],
+    ['1', '', '', '', '2', '1', '2', '', '', '', '3', '', '', '2', '', '2', '', '4', '5', ''],
+    ['', '', '', '3', '', '', '', '', '2', '', '', '', '', '', '3', '4', '', '', '', ''],
+    ['', '', '2', '', '', '', '', '2', '', '', '0', '', '2', '', '', '3', '', '3', '3', ''],
+    ['3', '', '', '', '', '1', '1', '1', '', '', '1', '2', '', '', '3', '', '', '3', '', ''],
+    ['', '', '1', '1', '', '3', '', '2', '', '3', '', '', '3', '', '3', '3', '', '', '', '1'],
+    ['3', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '3', '3', ''],
+    ['', '', '1', '1', '', '', '3', '2', '', '4', '', '2', '1', '', '1', '', '', '', '', '']
+]
+# fmt: on
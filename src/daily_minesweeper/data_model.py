@@ -23,3 +23,95 @@ class Cell:
 
     x: int
     y: int
+
+
+# small integer codes for compact storage, in the order of `CellState`.
+CELL_STATES: tuple[CellState, ...] = tuple(CellState)
+CELL_STATE_CODES: dict[CellState, int] = {
+    state: code for code, state in enumerate(CELL_STATES)
+}
+
+
+class CellView:
+    """Lightweight view of a cell in a compact board, behaves like `Cell`.
+
+    The state and value live in the flat `_states` and `_values` arrays of the
+    board, the view only keeps the board and the linear index of the cell.
+    Setting the state goes through `Board.set_state`.
+    """
+
+    __slots__ = ("_board", "_index")
+
+    def __init__(self, board: object, index: int) -> None:
+        """Point the view to a linear index of the board."""
+        self._board = board
+        self._index = index
+
+    @property
+    def state(self) -> CellState:
+        """State of the cell."""
+        return CELL_STATES[self._board._states[self._index]]
+
+    @state.setter
+    def state(self, state: CellState) -> None:
+        self._board.set_state(self.y, self.x, state)
+
+    @property
+    def value(self) -> int:
+        """Number of the cell, -1 if it is not a number."""
+        return self._board._values[self._index]
+
+    @property
+    def x(self) -> int:
+        """Column of the cell."""
+        return self._index % self._board.columns
+
+    @property
+    def y(self) -> int:
+        """Row of the cell."""
+        return self._index // self._board.columns
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another cell or view by content."""
+        if not isinstance(other, (Cell, CellView)):
+            return NotImplemented
+        return (self.state, self.value, self.x, self.y) == (
+            other.state,
+            other.value,
+            other.x,
+            other.y,
+        )
+
+    def __repr__(self) -> str:
+        """Print like the `Cell` dataclass."""
+        return (
+            f"CellView(state={self.state!r}, value={self.value}, "
+            f"x={self.x}, y={self.y})"
+        )
+
+
+class CellViews:
+    """Sequence of `CellView` over a contiguous range of a compact board.
+
+    Used both for a single row (`board[r]`) and for the flat list of all cells.
+    """
+
+    __slots__ = ("_board", "_length", "_start")
+
+    def __init__(self, board: object, start: int, length: int) -> None:
+        """Cover `length` cells of the board starting at linear index `start`."""
+        self._board = board
+        self._start = start
+        self._length = length
+
+    def __len__(self) -> int:
+        """Number of cells covered."""
+        return self._length
+
+    def __getitem__(self, idx: int) -> CellView:
+        """Return a view of the cell at position `idx`."""
+        if idx < 0:
+            idx += self._length
+        if not 0 <= idx < self._length:
+            raise IndexError(f"cell index out of range, {idx=}")
+        return CellView(self._board, self._start + idx)
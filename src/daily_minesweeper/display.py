@@ -1,17 +1,38 @@
 """Module for updating console cli on minesweeper board state."""
 
+import threading
 import time
+from collections.abc import Iterator
+from functools import cache
 
 from rich import box
-from rich.console import Console
+from rich.console import Console, ConsoleOptions
 from rich.live import Live
+from rich.segment import Segment
+from rich.style import Style
 from rich.table import Table
+from rich.text import Text
 
 from .data_model import Cell, CellState
+from .profiling import StrategyProfile
 from .solver import Board
 
 console = Console()
 
+FRAMES_PER_SECOND = 4
+
+NUMBER_COLORS = {
+    0: "bright_white",
+    1: "cyan",
+    2: "green",
+    3: "red",
+    4: "blue",
+    5: "magenta",
+    6: "bright_cyan",
+    7: "bright_black",
+    8: "dark_red",
+}
+
 MINE_ICON = [
     "⬤",
     "●",
@@ -22,34 +43,44 @@ MINE_ICON = [
 
 def create_cell_value(cell: Cell) -> str:
     """Update the cell according to its value and state."""
-    colors = {
-        0: "bright_white",
-        1: "cyan",
-        2: "green",
-        3: "red",
-        4: "blue",
-        5: "magenta",
-        6: "bright_cyan",
-        7: "bright_black",
-        8: "dark_red",
-    }
-
-    if cell.state == CellState.is_number:
-        color = colors.get(cell.value)
-        return f"[{color}]{cell.value}[/{color}]"
-
-    if cell.state == CellState.flag:
+    return format_cell(cell.state, cell.value)
+
+
+@cache
+def format_cell(state: CellState, value: int) -> str:
+    """Markup of a cell with a state and value, cached as there are few of them.
+
+    Raises:
+        Exception: if the state has no markup.
+    """
+    if state == CellState.is_number:
+        color = NUMBER_COLORS.get(value)
+        return f"[{color}]{value}[/{color}]"
+
+    if state == CellState.flag:
         return f"[red]{MINE_ICON[0]}[/red]"
 
-    if cell.state == CellState.suspect:
+    if state == CellState.suspect:
         return "[yellow]?[/yellow]"
 
-    if cell.state == CellState.unmarked:
+    if state == CellState.unmarked:
         return "[grey50]·[/grey50]"
 
-    if cell.state == CellState.empty:
+    if state == CellState.empty:
         return "[grey50]X[/grey50]"
 
+    raise Exception(
+        f"expecting a state from {[s.value for s in CellState]}, received {state}"
+    )
+
+
+@cache
+def cell_segment(state: CellState, value: int) -> Segment:
+    """Styled text of a cell with a state and value, parsed once."""
+    text = Text.from_markup(format_cell(state, value))
+    style = text.spans[0].style if text.spans else ""
+    return Segment(text.plain, Style.parse(style) if isinstance(style, str) else style)
+
 
 def draw_board(board: Board) -> Table:
     """Draw table with board information."""
@@ -69,41 +100,153 @@ def draw_board(board: Board) -> Table:
     return table
 
 
+# borders of a row, as drawn by `draw_board` with `box.ASCII2`.
+_LEFT = Segment("| ")
+_SEPARATOR = Segment(" | ")
+_RIGHT = Segment(" |")
+
+
+class BoardView:
+    """Board renderable that keeps its rendered rows between frames.
+
+    Looks like `draw_board`, but each row is kept as styled segments, built from
+    `cell_segment`, and only the rows passed to `update` are rendered again.
+    """
+
+    def __init__(self, board: Board) -> None:
+        """Render every row of the board."""
+        self.board = board
+        self.rows_rendered = 0
+        self._rows = [self._render_row(r) for r in range(board.rows)]
+        self._border = Segment("+" + "---+" * board.columns)
+
+    def _render_row(self, row: int) -> list[Segment]:
+        """Segments of a row, from the current states."""
+        self.rows_rendered += 1
+        segments = [_LEFT]
+        for cell in self.board[row]:
+            segments += [cell_segment(cell.state, cell.value), _SEPARATOR]
+        segments[-1] = _RIGHT
+        return segments
+
+    def update(self, rows: list[int]) -> None:
+        """Render the given rows again, e.g. from `Board.drain_dirty_rows`."""
+        for r in rows:
+            self._rows[r] = self._render_row(r)
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Iterator[Segment]:
+        """Yield the kept rows between borders."""
+        newline = Segment.line()
+        yield self._border
+        yield newline
+        for row in self._rows:
+            yield from row
+            yield newline
+        yield self._border
+        yield newline
+
+
+class BoardRenderer:
+    """Draw the board from a separate thread, at most `fps` frames per second.
+
+    The solver only calls `publish` after a change, which bumps a version number.
+    When the version moved since the last frame, the render thread renders again
+    the rows reported by `Board.drain_dirty_rows` in its `BoardView`, so the
+    solver never waits on rendering and a frame costs the changed rows only.
+    """
+
+    def __init__(
+        self, board: Board, console: Console = console, fps: float = FRAMES_PER_SECOND
+    ) -> None:
+        """Prepare the live display, started on `__enter__`."""
+        self.board = board
+        self.interval = 1 / fps
+        self.frames = 0
+        self._version = 0
+        self._drawn = -1
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._live = Live(console=console, auto_refresh=False)
+        board.drain_dirty_rows()
+        self.view = BoardView(board)
+
+    def publish(self, changes: list[int] | None = None) -> None:
+        """Mark the board as changed, usable as `scheduler.solve` `on_update`."""
+        self._version += 1
+
+    def draw(self) -> None:
+        """Draw a frame with the rows changed since the last one, if any."""
+        version = self._version
+        if version == self._drawn:
+            return
+        self.view.update(self.board.drain_dirty_rows())
+        self._live.update(self.view, refresh=True)
+        self._drawn = version
+        self.frames += 1
+
+    def _run(self) -> None:
+        """Draw frames until stopped."""
+        while not self._stop.wait(self.interval):
+            self.draw()
+
+    def __enter__(self) -> "BoardRenderer":
+        """Start the live display and the render thread."""
+        self._live.start()
+        self.draw()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop the render thread and draw the final board."""
+        self._stop.set()
+        self._thread.join()
+        self.publish()
+        self.draw()
+        self._live.stop()
+
+
+def draw_profile(profiles: list[StrategyProfile]) -> Table:
+    """Draw table with the counters of each strategy."""
+    table = Table(title="strategy profile", box=box.ASCII2, expand=False)
+    for column in (
+        "strategy",
+        "calls",
+        "deductions",
+        "hit rate",
+        "cells",
+        "time (ms)",
+        "cells/ms",
+    ):
+        table.add_column(column, justify="left" if column == "strategy" else "right")
+
+    for profile in profiles:
+        table.add_row(
+            profile.name,
+            str(profile.invocations),
+            str(profile.deductions),
+            f"{profile.hit_rate:.1%}",
+            str(profile.cells_changed),
+            f"{profile.time_ns / 1e6:.1f}",
+            f"{profile.cells_per_us * 1000:.1f}",
+        )
+
+    return table
+
+
 if __name__ == "__main__":
-    from . import solver
-
-    # fmt: off
-    sample_board = [
-        ['', '', '', '2', '', '', '', '', '', '', '', '', '1', '', '', '', '', '3', '', ''], 
-        ['2', '', '', '', '', '2', '', '1', '', '0', '', '', '2', '', '1', '1', '', '', '', '2'], 
-        ['', '', '4', '', '3', '', '', '2', '', '', '', '2', '', '', '1', '', '3', '', '', '1'], 
-        ['', '', '', '', '2', '', '', '2', '1', '1', '', '', '', '', '1', '', '2', '', '2', ''], 
-        ['', '1', '1', '', '', '', '1', '2', '', '', '', '2', '', '2', '', '', '', '', '3', ''], 
-        ['', '1', '0', '2', '', '', '', '', '', '', '', '', '0', '1', '', '1', '', '', '', ''], 
-        ['', '2', '', '', '4', '4', '', '2', '', '1', '', '', '1', '', '', '', '', '3', '4', ''], 
-        ['', '', '2', '', '', '', '4', '', '', '', '', '', '', '3', '', '1', '', '', '', '2'], 
-        ['3', '', '4', '', '', '', '', '3', '2', '2', '3', '', '', '', '3', '', '1', '', '', '2'], 
-        ['', '', '2', '', '', '4', '', '', '', '', '', '', '4', '', '', '', '3', '', '1', '1'], 
-        ['', '2', '', '', '3', '', '', '', '', '', '2', '', '', '', '', '', '', '', '', ''],
-        ['0', '', '', '2', '2', '3', '', '2', '', '1', '', '2', '2', '', '', '5', '', '4', '', '1'], 
-        ['1', '', '4', '', '', '', '', '', '', '1', '', '', '', '', '', '', '', '', '', ''],
-        ['1', '', '', '', '2', '1', '2', '', '', '', '3', '', '', '2', '', '2', '', '4', '5', ''], 
-        ['', '', '', '3', '', '', '', '', '2', '', '', '', '', '', '3', '4', '', '', '', ''], 
-        ['', '', '2', '', '', '', '', '2', '', '', '0', '', '2', '', '', '3', '', '3', '3', ''], 
-        ['3', '', '', '', '', '1', '1', '1', '', '', '1', '2', '', '', '3', '', '', '3', '', ''], 
-        ['', '', '1', '1', '', '3', '', '2', '', '3', '', '', '3', '', '3', '3', '', '', '', '1'], 
-        ['3', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '3', '3', ''], 
-        ['', '', '1', '1', '', '', '3', '2', '', '4', '', '2', '1', '', '1', '', '', '', '', '']
-    ]
-    # fmt: on
-
-    board = Board(sample_board)
-
-    logical_strategy = [
-        solver.flag_remaining_unmarked,
-        solver.flag_all_numbers,
-        solver.deduce_from_neighbors_and_flag,
-    ]
+    from . import constants, registry
+
+    board = Board(constants.SAMPLE_BOARD_20)
+
+    logical_strategy = registry.select(
+        [
+            "flag_remaining_unmarked",
+            "flag_all_numbers",
+            "deduce_from_neighbors_and_flag",
+        ]
+    )
     with Live(draw_board(board), console=console, refresh_per_second=4) as live:
         number_cells = [
             (r, c)
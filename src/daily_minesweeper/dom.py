@@ -0,0 +1,116 @@
+"""Module to extract the grid from the browser with a single JavaScript call.
+
+Instead of sending `page_source` over the WebDriver wire and parsing it in Python,
+the script reads the game cells in the page and returns a compact payload: the
+dimensions, one character per cell and the position of every cell element.
+"""
+
+from dataclasses import dataclass
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from . import constants
+
+# cell without a number in the clue string, as `parser.GRID_UNKNOWN`.
+UNKNOWN = "."
+
+# rows and columns are ordered by the `top` and `left` px of the cells, as in
+# `parser.parse_page_into_array`. `order` is the linear index of each cell element
+# in document order.
+EXTRACT_SCRIPT = """
+const game = document.getElementById(arguments[0]);
+if (!game) {
+    return null;
+}
+const cells = game.querySelectorAll(".cell");
+const tops = [];
+const lefts = [];
+const numbers = [];
+for (const cell of cells) {
+    tops.push(parseInt(cell.style.top, 10));
+    lefts.push(parseInt(cell.style.left, 10));
+    const number = cell.querySelector(".number");
+    numbers.push(number ? number.textContent.trim() : "");
+}
+const byValue = (a, b) => a - b;
+const rowOf = new Map([...new Set(tops)].sort(byValue).map((v, i) => [v, i]));
+const colOf = new Map([...new Set(lefts)].sort(byValue).map((v, i) => [v, i]));
+const cols = colOf.size;
+const clues = new Array(rowOf.size * cols).fill(arguments[1]);
+const order = [];
+for (let k = 0; k < cells.length; k++) {
+    const index = rowOf.get(tops[k]) * cols + colOf.get(lefts[k]);
+    order.push(index);
+    if (numbers[k]) {
+        clues[index] = numbers[k];
+    }
+}
+return {rows: rowOf.size, cols: cols, clues: clues.join(""), order: order};
+"""
+
+
+@dataclass
+class GridPayload:
+    """Grid returned by `EXTRACT_SCRIPT`."""
+
+    rows: int
+    columns: int
+    # one character per cell in row-major order, a digit or `UNKNOWN`.
+    clues: str
+    # linear index of each cell element, in document order.
+    order: list[int]
+
+    @classmethod
+    def from_script(cls, payload: dict | None) -> "GridPayload":
+        """Check and convert the value returned by the script.
+
+        Raises:
+            Exception: if the game was not found or cells are missing.
+        """
+        if payload is None:
+            raise Exception("game element not found in the page")
+
+        grid = cls(
+            rows=payload["rows"],
+            columns=payload["cols"],
+            clues=payload["clues"],
+            order=list(payload["order"]),
+        )
+        size = grid.rows * grid.columns
+        if len(grid.order) != size or len(set(grid.order)) != size:
+            raise Exception(
+                f"expecting {grid.rows} x {grid.columns} cells, "
+                f"received {len(grid.order)}"
+            )
+        return grid
+
+    def to_array(self) -> list[list[str]]:
+        """2d array list of list with numbers or "", as from `parser`."""
+        columns = self.columns
+        return [
+            [
+                "" if value == UNKNOWN else value
+                for value in self.clues[r * columns : (r + 1) * columns]
+            ]
+            for r in range(self.rows)
+        ]
+
+    def element_positions(self) -> dict[int, int]:
+        """Position in document order of the element of each linear index."""
+        return {index: position for position, index in enumerate(self.order)}
+
+
+def extract_grid(driver: WebDriver, game_id: str = constants.GAME_ID) -> GridPayload:
+    """Read the grid of the page with one `execute_script` call."""
+    return GridPayload.from_script(
+        driver.execute_script(EXTRACT_SCRIPT, game_id, UNKNOWN)
+    )
+
+
+def find_cell_elements(
+    driver: WebDriver, game_id: str = constants.GAME_ID
+) -> list[WebElement]:
+    """All cell elements of the game in document order, see `GridPayload.order`."""
+    return driver.find_elements(By.CSS_SELECTOR, f"#{game_id} .cell")
@@ -0,0 +1,368 @@
+"""Module to solve the unmarked frontier exactly, one connected component at a time.
+
+The frontier is made of the unmarked cells next to a number. Numbers that share
+unmarked cells interact, and the connected components of that interaction are
+independent of each other. A component is solved by backtracking over all
+consistent mine assignments, and a cell is marked only when it takes the same
+value in every one of them.
+
+When the board knows its total mine count, `solve_mine_count` also uses it across
+all components and the interior cells next to no number.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+
+from .data_model import CellState
+from .solver import Board
+
+# bound the variables of a component explored from a single number. Dropping
+# constraints keeps the deductions sound, every full solution satisfies a subset.
+MAX_COMPONENT_VARIABLES = 40
+# the mine count solves every component of the board for each of its mine counts,
+# only worth it once the frontier is small.
+MAX_MINE_COUNT_VARIABLES = 30
+
+
+class InconsistentComponentError(Exception):
+    """No mine assignment satisfies the constraints of a component."""
+
+
+@dataclass
+class Component:
+    """Connected constraints with their unmarked cells as variables."""
+
+    variables: list[tuple[int, int]]
+    # remaining mines of each number and the variable ids of its unmarked cells.
+    constraints: list[tuple[int, tuple[int, ...]]]
+
+    @property
+    def signature(self) -> tuple[int, tuple[tuple[int, tuple[int, ...]], ...]]:
+        """Hashable description of the constraints, used as cache key."""
+        return len(self.variables), tuple(self.constraints)
+
+
+def _add_constraint(
+    board: Board,
+    row: int,
+    col: int,
+    variables: dict[tuple[int, int], int],
+    constraints: list[tuple[int, tuple[int, ...]]],
+) -> None:
+    """Register the constraint of a number, numbering its unmarked cells."""
+    remaining, unmarked = board.constraint(row, col)
+    ids = []
+    for cell in sorted(unmarked):
+        if cell not in variables:
+            variables[cell] = len(variables)
+        ids.append(variables[cell])
+    constraints.append((remaining, tuple(ids)))
+
+
+def collect_component(
+    board: Board, row: int, col: int, max_variables: int | None = None
+) -> Component:
+    """Collect the component of interacting numbers around a number.
+
+    Numbers are added in breadth first order, through the unmarked cells they
+    share, as long as the component stays within `max_variables`.
+
+    Args:
+        board (Board): board to read from
+        row (int): row of the starting number
+        col (int): column of the starting number
+        max_variables (int | None, optional): bound on unmarked cells, None for
+            the whole connected component.
+
+    Returns:
+        Component: variables and constraints of the component.
+    """
+    variables: dict[tuple[int, int], int] = {}
+    constraints: list[tuple[int, tuple[int, ...]]] = []
+    visited = {(row, col)}
+    queue = deque([(row, col)])
+
+    while queue:
+        r, c = queue.popleft()
+        unmarked = board.constraint(r, c).unknown
+        new_cells = [cell for cell in unmarked if cell not in variables]
+        if (
+            constraints
+            and max_variables is not None
+            and len(variables) + len(new_cells) > max_variables
+        ):
+            continue
+
+        _add_constraint(board, r, c, variables, constraints)
+        for ur, uc in sorted(unmarked):
+            for number in board.get_adjacent_cell_state(ur, uc, CellState.is_number):
+                if number not in visited:
+                    visited.add(number)
+                    queue.append(number)
+
+    return Component(variables=list(variables), constraints=constraints)
+
+
+def find_components(board: Board) -> list[Component]:
+    """Split all numbers with unmarked neighbors into independent components."""
+    components = []
+    visited = set()
+    for r, c in board.get_all_cells_by_state(CellState.is_number):
+        if (r, c) in visited or not board.constraint(r, c).unknown:
+            continue
+        component = collect_component(board, r, c)
+        visited.update(
+            number
+            for cell in component.variables
+            for number in board.get_adjacent_cell_state(*cell, CellState.is_number)
+        )
+        components.append(component)
+    return components
+
+
+@lru_cache(maxsize=4096)
+def solve_component(
+    signature: tuple[int, tuple[tuple[int, tuple[int, ...]], ...]],
+) -> tuple[int | None, ...]:
+    """Find the value each variable takes in every consistent assignment.
+
+    Backtracks on the most constrained variable, propagating after every assignment:
+    a constraint with all its mines placed empties the rest, a constraint with
+    exactly as many unassigned cells as missing mines flags them. After a first
+    assignment, each variable not seen with both values is searched again with
+    the other value, and is forced if no assignment exists.
+
+    Args:
+        signature (tuple): `Component.signature`
+
+    Raises:
+        InconsistentComponentError: if no assignment satisfies all constraints.
+
+    Returns:
+        tuple[int | None, ...]: 1 for mine, 0 for empty, None if undetermined.
+    """
+    size, constraints = signature
+    watchers: list[list[int]] = [[] for _ in range(size)]
+    for i, (_, ids) in enumerate(constraints):
+        for v in ids:
+            watchers[v].append(i)
+
+    assignment = [-1] * size
+    mines = [0] * len(constraints)
+    unassigned = [len(ids) for _, ids in constraints]
+    trail: list[int] = []
+    everything = (1 << size) - 1
+    seen = {"mine": 0, "empty": 0}
+
+    def assign(v: int, value: int) -> bool:
+        """Assign a variable and propagate, False on a conflict."""
+        pending = [(v, value)]
+        while pending:
+            v, value = pending.pop()
+            if assignment[v] != -1:
+                if assignment[v] != value:
+                    return False
+                continue
+            assignment[v] = value
+            trail.append(v)
+            # update every counter first, `undo` reverts them all.
+            for i in watchers[v]:
+                unassigned[i] -= 1
+                mines[i] += value
+            for i in watchers[v]:
+                remaining, ids = constraints[i]
+                missing = remaining - mines[i]
+                if missing < 0 or missing > unassigned[i]:
+                    return False
+                if unassigned[i] and missing in (0, unassigned[i]):
+                    forced = 1 if missing else 0
+                    pending.extend((u, forced) for u in ids if assignment[u] == -1)
+        return True
+
+    def undo(mark: int) -> None:
+        """Unassign variables back to a trail position."""
+        while len(trail) > mark:
+            v = trail.pop()
+            for i in watchers[v]:
+                unassigned[i] += 1
+                mines[i] -= assignment[v]
+            assignment[v] = -1
+
+    def pick() -> int:
+        """Unassigned variable of the constraint with the fewest unassigned cells."""
+        best = None
+        for i, count in enumerate(unassigned):
+            if count and (best is None or count < unassigned[best]):
+                best = i
+        if best is not None:
+            return next(u for u in constraints[best][1] if assignment[u] == -1)
+        return next((u for u in range(size) if assignment[u] == -1), size)
+
+    def search() -> bool:
+        """Extend the assignment to the first consistent one and record it."""
+        v = pick()
+        if v == size:
+            mine_bits = sum(1 << u for u in range(size) if assignment[u])
+            seen["mine"] |= mine_bits
+            seen["empty"] |= everything ^ mine_bits
+            return True
+
+        for value in (0, 1):
+            mark = len(trail)
+            if assign(v, value) and search():
+                return True
+            undo(mark)
+        return False
+
+    # constraints without variables still have to hold.
+    consistent = not any(not ids and remaining for remaining, ids in constraints)
+    for remaining, ids in constraints:
+        if consistent and ids and remaining in (0, len(ids)):
+            consistent = all(assign(v, 1 if remaining else 0) for v in ids)
+
+    base = len(trail)
+    if not consistent or not search():
+        raise InconsistentComponentError(f"no consistent assignment for {constraints=}")
+    undo(base)
+
+    # a variable is forced if no assignment gives it the value not seen yet.
+    for v in range(size):
+        if assignment[v] != -1 or (seen["mine"] & seen["empty"]) >> v & 1:
+            continue
+        value = 0 if seen["mine"] >> v & 1 else 1
+        if assign(v, value):
+            search()
+        undo(base)
+
+    result = []
+    for v in range(size):
+        can_mine = seen["mine"] >> v & 1
+        can_empty = seen["empty"] >> v & 1
+        result.append(None if can_mine and can_empty else can_mine)
+    return tuple(result)
+
+
+def solve_frontier(row: int, col: int, board: Board) -> bool:
+    """Solve the component around a number exactly and mark the forced cells.
+
+    The component is bounded by `MAX_COMPONENT_VARIABLES` unmarked cells, and
+    components with the same constraints share a cached result.
+    """
+    if board[row][col].state != CellState.is_number:
+        return False
+
+    if not board.constraint(row, col).unknown:
+        return False
+
+    component = collect_component(board, row, col, MAX_COMPONENT_VARIABLES)
+    forced = solve_component(component.signature)
+
+    updated = False
+    for (r, c), value in zip(component.variables, forced):
+        if value is None:
+            continue
+        state = CellState.flag if value else CellState.empty
+        updated = board.set_state(r, c, state) or updated
+
+    return updated
+
+
+@lru_cache(maxsize=1024)
+def solve_component_by_count(
+    signature: tuple[int, tuple[tuple[int, tuple[int, ...]], ...]],
+) -> dict[int, tuple[int | None, ...]]:
+    """Solve a component once for each number of mines it can hold.
+
+    Args:
+        signature (tuple): `Component.signature`
+
+    Returns:
+        dict[int, tuple[int | None, ...]]: `solve_component` result of every
+            feasible mine count, the infeasible ones are left out.
+    """
+    size, constraints = signature
+    everything = tuple(range(size))
+    result = {}
+    for count in range(size + 1):
+        try:
+            result[count] = solve_component(
+                (size, constraints + ((count, everything),))
+            )
+        except InconsistentComponentError:
+            continue
+    return result
+
+
+def _mine_sums(counts: list[Iterable[int]]) -> set[int]:
+    """All totals made of one mine count from each component."""
+    sums = {0}
+    for options in counts:
+        sums = {total + count for total in sums for count in options}
+    return sums
+
+
+def solve_mine_count(board: Board) -> bool:
+    """Mark cells with the total mine count of the board, once the frontier is small.
+
+    Interior cells, unmarked cells next to no number, are interchangeable: only
+    how many of them are mines matters. The mines left are split between the
+    components, at one of their feasible counts, and the interior. Interior
+    cells are settled in bulk when all splits give them no mines or only mines,
+    and a frontier cell is marked when it is forced for every count its
+    component can take.
+
+    Raises:
+        Exception: if no split matches the mines left.
+
+    Returns:
+        bool: True if any cell was marked.
+    """
+    if board.total_mines is None:
+        return False
+
+    unmarked = board.get_all_cells_by_state(CellState.unmarked)
+    if not unmarked:
+        return False
+
+    components = find_components(board)
+    frontier = {cell for component in components for cell in component.variables}
+    if len(frontier) > MAX_MINE_COUNT_VARIABLES:
+        return False
+
+    mines_left = board.total_mines - len(board.get_all_cells_by_state(CellState.flag))
+    interior = [cell for cell in unmarked if cell not in frontier]
+    by_count = [solve_component_by_count(c.signature) for c in components]
+
+    interior_counts = {
+        mines_left - total
+        for total in _mine_sums(by_count)
+        if 0 <= mines_left - total <= len(interior)
+    }
+    if not interior_counts:
+        raise Exception(f"no split of {mines_left=} over the unmarked cells")
+
+    updated = False
+    if interior and max(interior_counts) == 0:
+        for r, c in interior:
+            updated = board.set_state(r, c, CellState.empty) or updated
+    elif interior and min(interior_counts) == len(interior):
+        for r, c in interior:
+            updated = board.set_state(r, c, CellState.flag) or updated
+
+    for i, component in enumerate(components):
+        others = _mine_sums(by_count[:i] + by_count[i + 1 :])
+        feasible = [
+            forced
+            for count, forced in by_count[i].items()
+            if any(0 <= mines_left - count - t <= len(interior) for t in others)
+        ]
+        for v, (r, c) in enumerate(component.variables):
+            values = {forced[v] for forced in feasible}
+            if len(values) != 1 or None in values:
+                continue
+            state = CellState.flag if values.pop() else CellState.empty
+            updated = board.set_state(r, c, state) or updated
+
+    return updated
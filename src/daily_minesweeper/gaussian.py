@@ -0,0 +1,147 @@
+"""Module to deduce cells by Gaussian elimination over the mine constraints.
+
+Every number gives a linear equation: the sum of its unmarked neighbors equals its
+remaining mines. The equations of a component are row reduced together with
+integer arithmetic, and each reduced row is checked against the 0/1 bounds of
+its cells. One pass covers the whole board at once.
+"""
+
+from collections import defaultdict
+from math import gcd
+
+from .data_model import CellState
+from .frontier import Component, collect_component, find_components
+from .solver import Board
+
+# bound the unmarked cells of the component reduced by `gaussian_elimination`.
+MAX_GAUSSIAN_VARIABLES = 120
+
+Row = tuple[dict[int, int], int]
+
+
+def build_rows(component: Component) -> list[Row]:
+    """Build one sparse row `({variable: coefficient}, remaining)` per number."""
+    return [
+        ({v: 1 for v in ids}, remaining) for remaining, ids in component.constraints
+    ]
+
+
+def _normalize(coefs: dict[int, int], rhs: int) -> Row:
+    """Divide a row by the gcd of its coefficients, first coefficient positive."""
+    if not coefs:
+        return coefs, rhs
+    divisor = gcd(*coefs.values(), rhs)
+    if coefs[min(coefs)] < 0:
+        divisor = -divisor
+    return {v: c // divisor for v, c in coefs.items()}, rhs // divisor
+
+
+def row_reduce(rows: list[Row]) -> list[Row]:
+    """Bring the rows to reduced row echelon form, without fractions.
+
+    Each row in turn takes its lowest variable as pivot and eliminates it from
+    every other row, `other * p - row * q`.
+
+    Raises:
+        Exception: if a row reduces to `0 = rhs` with `rhs != 0`.
+    """
+    rows = [_normalize(dict(coefs), rhs) for coefs, rhs in rows]
+    column: dict[int, set[int]] = defaultdict(set)
+    for i, (coefs, _) in enumerate(rows):
+        for v in coefs:
+            column[v].add(i)
+
+    for i in range(len(rows)):
+        coefs, rhs = rows[i]
+        if not coefs:
+            if rhs:
+                raise Exception(f"inconsistent constraints, 0 = {rhs}")
+            continue
+
+        pivot = min(coefs)
+        p = coefs[pivot]
+        for j in list(column[pivot]):
+            if j == i:
+                continue
+            other, other_rhs = rows[j]
+            q = other[pivot]
+            reduced = {v: c * p for v, c in other.items()}
+            for v, c in coefs.items():
+                value = reduced.get(v, 0) - c * q
+                if value:
+                    reduced[v] = value
+                else:
+                    reduced.pop(v, None)
+            reduced, reduced_rhs = _normalize(reduced, other_rhs * p - rhs * q)
+            if not reduced and reduced_rhs:
+                raise Exception(f"inconsistent constraints, 0 = {reduced_rhs}")
+
+            for v in other.keys() - reduced.keys():
+                column[v].discard(j)
+            for v in reduced.keys() - other.keys():
+                column[v].add(j)
+            rows[j] = (reduced, reduced_rhs)
+
+    return [row for row in rows if row[0]]
+
+
+def deduce_from_bounds(coefs: dict[int, int], rhs: int) -> dict[int, int]:
+    """Find variables of a row fixed by the 0/1 bounds of the others.
+
+    The row sum lies in `[low, high]`, the sums of its negative and positive
+    coefficients. A variable is 1 if the row cannot reach `rhs` without its
+    coefficient, and 0 if the row cannot reach `rhs` with it.
+    """
+    high = sum(c for c in coefs.values() if c > 0)
+    low = sum(c for c in coefs.values() if c < 0)
+    deduced = {}
+    for v, c in coefs.items():
+        if c > 0:
+            if high - c < rhs:
+                deduced[v] = 1
+            elif low + c > rhs:
+                deduced[v] = 0
+        else:
+            if high + c < rhs:
+                deduced[v] = 0
+            elif low - c > rhs:
+                deduced[v] = 1
+    return deduced
+
+
+def _apply(board: Board, component: Component) -> bool:
+    """Reduce a component and mark the cells fixed by any original or reduced row."""
+    rows = build_rows(component)
+    updated = False
+    for coefs, rhs in rows + row_reduce(rows):
+        for v, value in deduce_from_bounds(coefs, rhs).items():
+            r, c = component.variables[v]
+            state = CellState.flag if value else CellState.empty
+            updated = board.set_state(r, c, state) or updated
+    return updated
+
+
+def eliminate_board(board: Board) -> bool:
+    """Run one batched elimination pass over every component of the board.
+
+    Returns:
+        bool: True if any cell was marked.
+    """
+    updated = False
+    for component in find_components(board):
+        updated = _apply(board, component) or updated
+    return updated
+
+
+def gaussian_elimination(row: int, col: int, board: Board) -> bool:
+    """Eliminate over the component around a number, as a strategy.
+
+    The component is bounded by `MAX_GAUSSIAN_VARIABLES` unmarked cells.
+    """
+    if board[row][col].state != CellState.is_number:
+        return False
+
+    if not board.constraint(row, col).unknown:
+        return False
+
+    return _apply(board, collect_component(board, row, col, MAX_GAUSSIAN_VARIABLES))
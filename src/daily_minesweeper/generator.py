@@ -0,0 +1,173 @@
+"""Module to generate synthetic minesweeper puzzles for testing and benchmarks."""
+
+import random
+from dataclasses import dataclass
+
+from . import registry, scheduler
+from .data_model import CellState
+from .solver import Board
+
+# sound strategies used to check a puzzle is solvable without guessing. The exact
+# `frontier.solve_frontier` can be passed instead of the subset reasoning, it is
+# several times slower on the sparse boards of the first rounds.
+CHECK_STRATEGIES: list[scheduler.Strategy] = registry.select(
+    [
+        "flag_all_numbers",
+        "flag_remaining_unmarked",
+        "deduce_from_neighbors_and_flag",
+        "suspect_adjacent_candidates_and_mark_neighbor_empty",
+        "subset_reasoning",
+    ]
+)
+
+# cells revealed in the same round are at least this many rows or columns apart,
+# about one per stalled region.
+REVEAL_SPACING = 3
+
+
+@dataclass
+class Puzzle:
+    """Synthetic puzzle with its clue map and hidden mine positions."""
+
+    clues: list[list[str]]
+    mines: set[tuple[int, int]]
+
+    @property
+    def rows(self) -> int:
+        """Number of rows of the puzzle."""
+        return len(self.clues)
+
+    @property
+    def columns(self) -> int:
+        """Number of columns of the puzzle."""
+        return len(self.clues[0])
+
+
+def count_adjacent_mines(mines: set[tuple[int, int]], row: int, col: int) -> int:
+    """Count the mines around a single cell."""
+    return sum(
+        (row + dr, col + dc) in mines
+        for dr in (-1, 0, 1)
+        for dc in (-1, 0, 1)
+        if dr or dc
+    )
+
+
+def generate_puzzle(
+    rows: int,
+    columns: int,
+    mine_density: float = 0.2,
+    clue_density: float = 0.3,
+    seed: int | None = None,
+) -> Puzzle:
+    """Generate a random puzzle with numbers revealed on a share of the safe cells.
+
+    The puzzle is not guaranteed to be solvable by deduction only.
+
+    Args:
+        rows (int): number of rows
+        columns (int): number of columns
+        mine_density (float, optional): share of cells that are mines
+        clue_density (float, optional): share of safe cells that show their number
+        seed (int | None, optional): seed for reproducible puzzles
+
+    Returns:
+        Puzzle: clue map in the same format as `parser.parse_html_into_array`.
+    """
+    rng = random.Random(seed)
+    cells = [(r, c) for r in range(rows) for c in range(columns)]
+    mines = set(rng.sample(cells, int(len(cells) * mine_density)))
+
+    clues = [["" for _ in range(columns)] for _ in range(rows)]
+    for r, c in cells:
+        if (r, c) not in mines and rng.random() < clue_density:
+            clues[r][c] = str(count_adjacent_mines(mines, r, c))
+
+    return Puzzle(clues=clues, mines=mines)
+
+
+def generate_solvable_puzzle(
+    rows: int,
+    columns: int,
+    mine_density: float = 0.2,
+    clue_density: float = 0.1,
+    seed: int | None = None,
+    strategies: list[scheduler.Strategy] | None = None,
+) -> Puzzle:
+    """Generate a random puzzle the solver clears by deduction only.
+
+    Starts from `generate_puzzle`, then while the solver stalls, reveals the
+    number of some safe unresolved cells, about one per stalled region, and solves
+    again. Cells already deduced stay marked, more numbers cannot unforce them.
+    The strategies only mark forced cells, so the solution is unique.
+
+    Args:
+        rows (int): number of rows
+        columns (int): number of columns
+        mine_density (float, optional): share of cells that are mines
+        clue_density (float, optional): share of safe cells shown before solving
+        seed (int | None, optional): seed for reproducible puzzles
+        strategies (list[Strategy] | None, optional): sound strategies used as the
+            uniqueness check, `CHECK_STRATEGIES` if None.
+
+    Raises:
+        Exception: if no safe cell is left to reveal.
+
+    Returns:
+        Puzzle: clue map solvable without guessing.
+    """
+    rng = random.Random(seed)
+    puzzle = generate_puzzle(
+        rows, columns, mine_density, clue_density, seed=rng.getrandbits(32)
+    )
+    strategies = CHECK_STRATEGIES if strategies is None else strategies
+    known: dict[tuple[int, int], CellState] = {}
+    # numbers near the cells revealed in the last round, the others are stalled.
+    start = None
+
+    while True:
+        board = Board(puzzle.clues)
+        for (r, c), state in known.items():
+            board.set_state(r, c, state)
+        scheduler.solve(board, strategies, start=start)
+
+        unmarked = board.get_all_cells_by_state(CellState.unmarked)
+        if not unmarked:
+            return puzzle
+
+        for state in (CellState.flag, CellState.empty):
+            known.update(dict.fromkeys(board.get_all_cells_by_state(state), state))
+
+        candidates = [cell for cell in unmarked if cell not in puzzle.mines]
+        if not candidates:
+            # only mines are left, reveal a deduced safe cell next to them.
+            candidates = sorted(
+                {
+                    cell
+                    for r, c in unmarked
+                    for cell in board.get_adjacent_cell_state(r, c, CellState.empty)
+                }
+            )
+        if not candidates:
+            raise Exception(f"no safe cell left to reveal next to {unmarked=}")
+
+        rng.shuffle(candidates)
+        blocked = set()
+        start = []
+        for r, c in candidates:
+            if (r, c) in blocked:
+                continue
+            puzzle.clues[r][c] = str(count_adjacent_mines(puzzle.mines, r, c))
+            known.pop((r, c), None)
+            start += [
+                i * columns + j
+                for i, j in board.get_nearby_cell_state(
+                    r, c, scheduler.RECHECK_RADIUS, CellState.is_number
+                )
+            ]
+            start.append(r * columns + c)
+            blocked.update(
+                (r + dr, c + dc)
+                for dr in range(-REVEAL_SPACING + 1, REVEAL_SPACING)
+                for dc in range(-REVEAL_SPACING + 1, REVEAL_SPACING)
+            )
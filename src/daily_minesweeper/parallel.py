@@ -0,0 +1,228 @@
+"""Module to solve the tiles of a large board in parallel worker processes.
+
+The board is split into tiles. Each worker builds a small board from its tile plus
+a halo around it, read from shared memory planes of values and states, runs the
+strategies and returns the cells it changed. The halo is the largest radius of the
+strategies, see `scheduler.strategy_radius`, so a number of the tile reads the same
+cells as on the whole board. Numbers on the cut edge of a halo see only part of
+their neighbors, so they are turned into empty cells first: every constraint left
+is complete, and every deduction holds on the whole board. Changes are merged into
+the board, and the tiles that see them are solved again, from the numbers within
+reach of the changes, until none changes. A last pass from the numbers near the
+tile edges catches strategies that read beyond their declared radius.
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import NamedTuple
+
+from . import scheduler
+from .data_model import CELL_STATE_CODES, CELL_STATES, CellState
+from .solver import STORAGE_CELLS, Board
+
+TILE_SIZE = 64
+
+_EMPTY_CODE = CELL_STATE_CODES[CellState.empty]
+
+# shared planes and strategies of a worker, set by `_attach`.
+_worker: dict = {}
+
+
+class Tile(NamedTuple):
+    """Rows and columns of a tile, without its halo."""
+
+    top: int
+    left: int
+    bottom: int
+    right: int
+
+
+class ParallelStats(NamedTuple):
+    """Counters of a parallel solve."""
+
+    rounds: int
+    tiles_solved: int
+    cells_changed: int
+    # cells changed by the last pass on the whole board.
+    final_changes: int
+
+
+def make_tiles(rows: int, columns: int, tile_size: int = TILE_SIZE) -> list[Tile]:
+    """Split the board into tiles of at most `tile_size` x `tile_size` cells."""
+    return [
+        Tile(top, left, min(top + tile_size, rows), min(left + tile_size, columns))
+        for top in range(0, rows, tile_size)
+        for left in range(0, columns, tile_size)
+    ]
+
+
+def _attach(
+    values_name: str,
+    states_name: str,
+    rows: int,
+    columns: int,
+    strategies: list[scheduler.Strategy],
+) -> None:
+    """Open the shared planes in a worker."""
+    values = shared_memory.SharedMemory(values_name)
+    states = shared_memory.SharedMemory(states_name)
+    _worker.update(
+        values=values,
+        states=states,
+        rows=rows,
+        columns=columns,
+        strategies=strategies,
+        halo=max(map(scheduler.strategy_radius, strategies), default=0),
+    )
+
+
+def solve_tile(tile: Tile, changed: list[int] | None = None) -> list[tuple[int, int]]:
+    """Solve a tile with its halo from the shared planes, in a worker.
+
+    Args:
+        tile (Tile): rows and columns of the tile
+        changed (list[int] | None, optional): linear indices on the whole board of
+            the cells changed since the tile was last solved, only the numbers
+            within the halo of them are queued. None queues every number.
+
+    Returns:
+        list[tuple[int, int]]: linear index on the whole board and state code of
+            every cell changed.
+    """
+    rows, columns, halo = _worker["rows"], _worker["columns"], _worker["halo"]
+    top, left = max(tile.top - halo, 0), max(tile.left - halo, 0)
+    bottom, right = min(tile.bottom + halo, rows), min(tile.right + halo, columns)
+    width = right - left
+
+    values = array("b")
+    states = bytearray()
+    values_buf, states_buf = _worker["values"].buf, _worker["states"].buf
+    for r in range(top, bottom):
+        start = r * columns + left
+        values.frombytes(values_buf[start : start + width])
+        states += states_buf[start : start + width]
+
+    # numbers on an edge cut out of the board miss neighbors, drop them.
+    cut_rows = [
+        r for r, cut in ((0, top > 0), (bottom - top - 1, bottom < rows)) if cut
+    ]
+    cut_columns = [c for c, cut in ((0, left > 0), (width - 1, right < columns)) if cut]
+    edge = {r * width + c for r in cut_rows for c in range(width)}
+    edge |= {r * width + c for c in cut_columns for r in range(bottom - top)}
+    for index in edge:
+        if values[index] >= 0:
+            values[index] = -1
+            states[index] = _EMPTY_CODE
+
+    before = bytes(states)
+    board = Board.from_values(
+        bottom - top, width, values, states=states, storage=STORAGE_CELLS
+    )
+    start = None
+    if changed is not None:
+        # the numbers whose strategies read a changed cell.
+        start = []
+        for index in changed:
+            r, c = divmod(index, columns)
+            for i in range(max(r - halo, top), min(r + halo + 1, bottom)):
+                for j in range(max(c - halo, left), min(c + halo + 1, right)):
+                    start.append((i - top) * width + j - left)
+    scheduler.solve(board, _worker["strategies"], start=start)
+
+    changes = []
+    for index, (old, new) in enumerate(zip(before, board.snapshot())):
+        if old != new:
+            r, c = divmod(index, width)
+            changes.append(((top + r) * columns + left + c, new))
+    return changes
+
+
+def solve_parallel(
+    board: Board,
+    strategies: list[scheduler.Strategy],
+    workers: int | None = None,
+    tile_size: int = TILE_SIZE,
+) -> ParallelStats:
+    """Solve the board by tiles across a process pool, then finish on the whole board.
+
+    Args:
+        board (Board): board to solve, updated in place
+        strategies (list[Strategy]): module level strategies, sent to the workers
+        workers (int | None, optional): number of processes, all cores if None
+        tile_size (int, optional): rows and columns of a tile, without halo
+
+    Returns:
+        ParallelStats: counters of the run
+    """
+    rows, columns = board.rows, board.columns
+    size = rows * columns
+    tiles = make_tiles(rows, columns, tile_size)
+    tile_columns = -(-columns // tile_size)
+    halo = max(map(scheduler.strategy_radius, strategies), default=0)
+
+    values = shared_memory.SharedMemory(create=True, size=size)
+    states = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        values.buf[:size] = array("b", (cell.value for cell in board._cells)).tobytes()
+
+        rounds = tiles_solved = cells_changed = 0
+        # tiles to solve, with the cells changed near them since their last solve.
+        dirty: dict[int, list[int] | None] = dict.fromkeys(range(len(tiles)))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach,
+            initargs=(values.name, states.name, rows, columns, strategies),
+        ) as pool:
+            while dirty:
+                rounds += 1
+                tiles_solved += len(dirty)
+                states.buf[:size] = board.snapshot()
+
+                # tiles that found each change, they are at a fixpoint with it.
+                found: dict[int, list[int]] = {}
+                results = pool.map(
+                    solve_tile, [tiles[k] for k in dirty], list(dirty.values())
+                )
+                for k, changes in zip(dirty, results):
+                    for index, code in changes:
+                        found.setdefault(index, []).append(k)
+                        r, c = divmod(index, columns)
+                        board.set_state(r, c, CELL_STATES[code])
+                cells_changed += len(found)
+
+                # tiles that see a changed cell in their halo.
+                dirty = {}
+                for index, finders in found.items():
+                    r, c = divmod(index, columns)
+                    for tr in range(
+                        max(r - halo, 0) // tile_size,
+                        min(r + halo, rows - 1) // tile_size + 1,
+                    ):
+                        for tc in range(
+                            max(c - halo, 0) // tile_size,
+                            min(c + halo, columns - 1) // tile_size + 1,
+                        ):
+                            k = tr * tile_columns + tc
+                            if k not in finders:
+                                dirty.setdefault(k, []).append(index)
+    finally:
+        values.close()
+        values.unlink()
+        states.close()
+        states.unlink()
+
+    # every number read the same cells as on the whole board, so this finds
+    # nothing unless a strategy reads beyond its radius, e.g. `solve_frontier`
+    # reads its whole component.
+    band = halo + 1
+    near_edge = [
+        r * columns + c
+        for r in range(rows)
+        for c in range(columns)
+        if min(r % tile_size, c % tile_size) < band
+        or max(r % tile_size, c % tile_size) >= tile_size - band
+    ]
+    board.drain_changes()
+    final = scheduler.solve(board, strategies, start=near_edge)
+    return ParallelStats(rounds, tiles_solved, cells_changed, final.cells_changed)
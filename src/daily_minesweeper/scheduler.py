@@ -0,0 +1,250 @@
+"""Module to schedule solving strategies over the board."""
+
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .data_model import CellState
+from .solver import Board
+
+Strategy = Callable[[int, int, Board], bool]
+
+# a strategy on a number cell reads cells up to 3 steps away, e.g.
+# `suspect_adjacent_candidates_and_mark_neighbor_empty` reads the unmarked cells
+# of numbers next to its own unmarked cells. A change can only affect the
+# outcome of strategies on number cells within this radius. Strategies without a
+# declared radius use it.
+RECHECK_RADIUS = 3
+
+
+@dataclass(frozen=True, slots=True)
+class StrategySpec:
+    """Strategy with the metadata used to schedule it, see `registry`.
+
+    Attributes:
+        name (str): name used on the command line and in profiles
+        function (Strategy): the strategy itself
+        cost (int): relative cost of one call, strategies are run cheapest first
+        radius (int): farthest cell, in rows or columns from the number, the
+            strategy reads or changes. After a change, the strategy only runs
+            again on the numbers within this radius.
+    """
+
+    name: str
+    function: Strategy
+    cost: int = 1
+    radius: int = RECHECK_RADIUS
+
+    @property
+    def __name__(self) -> str:
+        """Name of the strategy, as for a plain function."""
+        return self.name
+
+    def __call__(self, row: int, col: int, board: Board) -> bool:
+        """Run the strategy on a number cell."""
+        return self.function(row, col, board)
+
+
+def strategy_radius(strategy: Strategy) -> int:
+    """Declared radius of a strategy, `RECHECK_RADIUS` for a plain function."""
+    return getattr(strategy, "radius", RECHECK_RADIUS)
+
+
+@dataclass
+class SolveStats:
+    """Counters collected while solving a board."""
+
+    number_cells: int = 0
+    invocations: int = 0
+    deductions: int = 0
+    cells_changed: int = 0
+    # upper bound of the calls of `solve_naive`, every strategy on every number
+    # once per deduction plus a last pass. The naive loop stops at the first
+    # success, so it runs fewer, `solve_naive` counts them exactly.
+    rescan_upper_bound: int = 0
+    # updates of the board, one per deduction, or one per pass when batched.
+    commits: int = 0
+
+    @property
+    def skipped_upper_bound(self) -> int:
+        """Upper bound of the invocations saved compared with `solve_naive`.
+
+        Only an estimate from `rescan_upper_bound`, the real saving is the
+        difference with the invocations of `solve_naive` on the same board.
+        """
+        return self.rescan_upper_bound - self.invocations
+
+    def add(self, other: "SolveStats") -> None:
+        """Accumulate the counters of a later run on the same board."""
+        self.invocations += other.invocations
+        self.deductions += other.deductions
+        self.cells_changed += other.cells_changed
+        self.rescan_upper_bound += other.rescan_upper_bound
+        self.commits += other.commits
+
+
+def solve(
+    board: Board,
+    strategies: list[Strategy],
+    on_update: Callable[[list[int]], None] | None = None,
+    start: list[int] | None = None,
+    batched: bool = False,
+) -> SolveStats:
+    """Apply strategies on number cells from a worklist until nothing changes.
+
+    Every number cell is queued once with all its strategies pending. When a
+    strategy changes the board, each strategy is pending again only on the number
+    cells within its radius of the changed cells, `StrategySpec.radius` or
+    `RECHECK_RADIUS` for a plain function.
+
+    With `batched`, the queue is run in passes: the cells queued at the start of a
+    pass all read the same board, their deductions are collected, checked for
+    conflicts and applied together at the end of the pass, see
+    `Board.begin_batch`. The number of passes follows the depth of the chain of
+    deductions instead of their count.
+
+    Args:
+        board (Board): board to solve, updated in place
+        strategies (list[Strategy]): strategies to try on each cell, in order
+        on_update (Callable[[list[int]], None], optional): called with the changed
+            linear indices after each successful strategy, or each pass when
+            batched.
+        start (list[int] | None, optional): linear indices of the number cells to
+            queue first, all of them if None. Cells left out must be known to be
+            stalled, e.g. far from anything changed since a previous run.
+        batched (bool, optional): apply the deductions of a pass together.
+
+    Raises:
+        Exception: if two deductions of a pass conflict, the clues contradict.
+
+    Returns:
+        SolveStats: counters of the run.
+    """
+    rows, columns = board.rows, board.columns
+    number_cells = [
+        r * columns + c for r, c in board.get_all_cells_by_state(CellState.is_number)
+    ]
+    is_number = bytearray(rows * columns)
+    for index in number_cells:
+        is_number[index] = 1
+
+    functions = [getattr(strategy, "function", strategy) for strategy in strategies]
+    radii = [strategy_radius(strategy) for strategy in strategies]
+    reach = max(radii, default=0)
+    # strategies pending on a number at each distance from a changed cell.
+    reach_mask = [
+        sum(1 << k for k, radius in enumerate(radii) if radius >= distance)
+        for distance in range(reach + 1)
+    ]
+    all_pending = reach_mask[0]
+
+    stats = SolveStats(number_cells=len(number_cells))
+    # bits of the strategies still to run on each number, queued when not 0.
+    pending = [0] * (rows * columns)
+    queue = deque()
+    for index in number_cells if start is None else start:
+        if is_number[index] and not pending[index]:
+            pending[index] = all_pending
+            queue.append(index)
+    board.drain_changes()
+
+    while queue:
+        if batched:
+            # cells queued during the pass wait for the next one.
+            cells = [queue.popleft() for _ in range(len(queue))]
+            board.begin_batch()
+        else:
+            cells = [queue.popleft()]
+
+        for index in cells:
+            mask = pending[index]
+            pending[index] = 0
+            row, col = divmod(index, columns)
+            before = board.pending_changes()
+
+            for k, strategy in enumerate(functions):
+                if not mask >> k & 1:
+                    continue
+                stats.invocations += 1
+                if not strategy(row, col, board):
+                    continue
+                if board.pending_changes() > before:
+                    stats.deductions += 1
+                elif not batched:
+                    continue
+                # when batched, deductions already collected from other cells also
+                # end the cell. Strategies after this one were not run, keep them
+                # pending.
+                rest = mask >> (k + 1) << (k + 1)
+                if rest:
+                    if not pending[index]:
+                        queue.append(index)
+                    pending[index] |= rest
+                break
+
+        if batched:
+            board.commit_batch()
+        changes = board.drain_changes()
+        if not changes:
+            continue
+
+        stats.commits += 1
+        stats.cells_changed += len(changes)
+        for changed in changes:
+            r, c = divmod(changed, columns)
+            for i in range(max(r - reach, 0), min(r + reach, rows - 1) + 1):
+                row_distance = abs(i - r)
+                row_start = i * columns
+                for j in range(
+                    row_start + max(c - reach, 0),
+                    row_start + min(c + reach, columns - 1) + 1,
+                ):
+                    if not is_number[j]:
+                        continue
+                    bits = reach_mask[max(row_distance, abs(j - row_start - c))]
+                    if bits & ~pending[j]:
+                        if not pending[j]:
+                            queue.append(j)
+                        pending[j] |= bits
+
+        if on_update is not None:
+            on_update(changes)
+
+    stats.rescan_upper_bound = (
+        (stats.deductions + 1) * len(strategies) * len(number_cells)
+    )
+    return stats
+
+
+def solve_naive(board: Board, strategies: list[Strategy]) -> SolveStats:
+    """Restart from the first strategy and cell after every change, as a reference.
+
+    Args:
+        board (Board): board to solve, updated in place
+        strategies (list[Strategy]): strategies to try on each cell, in order
+
+    Returns:
+        SolveStats: counters of the run, `invocations` is the exact count.
+    """
+    number_cells = board.get_all_cells_by_state(CellState.is_number)
+    stats = SolveStats(number_cells=len(number_cells))
+    board.drain_changes()
+
+    def step() -> bool:
+        """Run strategies until the first one that updates the board."""
+        for strategy in strategies:
+            for r, c in number_cells:
+                stats.invocations += 1
+                if strategy(r, c, board):
+                    return True
+        return False
+
+    while step():
+        stats.deductions += 1
+        stats.commits += 1
+        stats.cells_changed += len(board.drain_changes())
+
+    stats.rescan_upper_bound = (
+        (stats.deductions + 1) * len(strategies) * len(number_cells)
+    )
+    return stats
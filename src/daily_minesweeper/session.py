@@ -0,0 +1,150 @@
+"""Module to keep browser sessions warm across solves.
+
+Starting Firefox takes seconds, much longer than reading and solving a board. A
+`DriverPool` hands out idle sessions again once they are released, checks each one
+still responds before reuse and quits them all on close. It can be shared by
+threads, the browser calls run outside of its lock.
+"""
+
+import atexit
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+_default_pool: "DriverPool | None" = None
+
+
+def new_firefox(headless: bool = False) -> WebDriver:
+    """Start a Firefox session."""
+    options = webdriver.FirefoxOptions()
+    if headless:
+        options.add_argument("-headless")
+    return webdriver.Firefox(options=options)
+
+
+def is_alive(driver: WebDriver) -> bool:
+    """Whether the session still answers a script call."""
+    try:
+        return driver.execute_script("return 1;") == 1
+    except WebDriverException:
+        return False
+
+
+def quit_driver(driver: WebDriver) -> None:
+    """Quit a session, ignoring errors from one that is already gone."""
+    try:
+        driver.quit()
+    except WebDriverException:
+        pass
+
+
+class DriverPool:
+    """Pool of browser sessions, reused until they fail a health check.
+
+    Use as a context manager to quit every session on exit.
+
+    Example:
+        with DriverPool() as pool:
+            for url in urls:
+                with pool.session() as driver:
+                    driver.get(url)
+    """
+
+    def __init__(
+        self, factory: Callable[[], WebDriver] = new_firefox, max_idle: int = 1
+    ) -> None:
+        """Start with no session.
+
+        Args:
+            factory (Callable[[], WebDriver], optional): starts a new session
+            max_idle (int, optional): sessions kept warm, extra ones are quit on
+                release
+        """
+        self.factory = factory
+        self.max_idle = max_idle
+        self._idle: list[WebDriver] = []
+        self._busy: list[WebDriver] = []
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def acquire(self) -> WebDriver:
+        """Return a healthy idle session, or start a new one."""
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                driver = self._idle.pop()
+            # only this thread holds the popped session, check it unlocked.
+            if is_alive(driver):
+                with self._lock:
+                    self.reused += 1
+                    self._busy.append(driver)
+                return driver
+            self._discard(driver)
+
+        driver = self.factory()
+        with self._lock:
+            self.created += 1
+            self._busy.append(driver)
+        return driver
+
+    def release(self, driver: WebDriver, healthy: bool = True) -> None:
+        """Give back a session, quit it if unhealthy or the pool is full or closed."""
+        with self._lock:
+            if driver in self._busy:
+                self._busy.remove(driver)
+                if healthy and len(self._idle) < self.max_idle:
+                    self._idle.append(driver)
+                    return
+        self._discard(driver)
+
+    @contextmanager
+    def session(self) -> Iterator[WebDriver]:
+        """Acquire a session for the block, it is quit if the driver raised."""
+        driver = self.acquire()
+        healthy = True
+        try:
+            yield driver
+        except WebDriverException:
+            healthy = False
+            raise
+        finally:
+            self.release(driver, healthy)
+
+    def close(self) -> None:
+        """Quit every session, idle or in use."""
+        with self._lock:
+            drivers = self._idle + self._busy
+            self._idle.clear()
+            self._busy.clear()
+        for driver in drivers:
+            self._discard(driver)
+
+    def _discard(self, driver: WebDriver) -> None:
+        """Quit a session that leaves the pool."""
+        quit_driver(driver)
+        with self._lock:
+            self.discarded += 1
+
+    def __enter__(self) -> "DriverPool":
+        """Use the pool for the block."""
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Quit every session."""
+        self.close()
+
+
+def default_pool() -> DriverPool:
+    """Pool shared by the whole process, closed when it exits."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = DriverPool()
+        atexit.register(_default_pool.close)
+    return _default_pool
@@ -1,58 +1,481 @@
 """Modules related to solving the puzzle."""
 
+from array import array
 from collections import defaultdict
-from .data_model import Cell, CellState
+from functools import lru_cache
+from typing import NamedTuple
+
+from .data_model import CELL_STATE_CODES, CELL_STATES, Cell, CellState, CellViews
+
+STORAGE_CELLS = "cells"
+STORAGE_COMPACT = "compact"
+
+
+# state code of every value byte, -1 (255) is unmarked and 0 - 8 are numbers.
+VALUE_STATE_CODES = bytes(
+    CELL_STATE_CODES[CellState.unmarked if value == 255 else CellState.is_number]
+    for value in range(256)
+)
+
+# positions of the set bits for every 8-bit neighbor mask.
+MASK_BITS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(k for k in range(8) if mask >> k & 1) for mask in range(256)
+)
+
+
+class Constraint(NamedTuple):
+    """Live constraint of a number cell."""
+
+    remaining: int
+    unknown: frozenset[tuple[int, int]]
+
+
+@lru_cache(maxsize=8)
+def build_neighbor_table(rows: int, columns: int) -> tuple[array, array, array]:
+    """Build a CSR style neighbor table for a board of `rows` x `columns`.
+
+    Cells are keyed by their linear index `row * columns + col`. The neighbors of
+    cell `i` are `indices[offsets[i] : offsets[i + 1]]`, in row-major order.
+    `slots[k]` is the position of cell `i` in the neighbor list of `indices[k]`.
+    Boards of the same dimensions share the same (read-only) table.
+
+    Args:
+        rows (int): number of rows of the board
+        columns (int): number of columns of the board
+
+    Returns:
+        tuple[array, array, array]: offsets, indices and slots arrays.
+    """
+    offsets = array("i", [0])
+    indices = array("i")
+    for row in range(rows):
+        min_height = max(row - 1, 0)
+        max_height = min(row + 1, rows - 1)
+        for col in range(columns):
+            min_width = max(col - 1, 0)
+            max_width = min(col + 1, columns - 1)
+            for i in range(min_height, max_height + 1):
+                for j in range(min_width, max_width + 1):
+                    if i == row and j == col:
+                        continue
+                    indices.append(i * columns + j)
+            offsets.append(len(indices))
+
+    # cell `i` shows up in the neighbor lists of higher cells in increasing order.
+    slots = array("i", bytes(4 * len(indices)))
+    seen = array("i", bytes(4 * rows * columns))
+    for k, j in enumerate(indices):
+        slots[k] = seen[j]
+        seen[j] += 1
+
+    return offsets, indices, slots
 
 
 class Board:
     """Board class to store the minesweeper data and includes methods to search within the board."""
 
-    def __init__(self, initial_map: list[list[str]]) -> None:
-        """Initialization to set board and dimensions."""
+    def __init__(
+        self,
+        initial_map: list[list[str]],
+        storage: str = STORAGE_CELLS,
+        total_mines: int | None = None,
+    ) -> None:
+        """Initialization to set board and dimensions.
+
+        Args:
+            initial_map (list[list[str]]): 2d array from `parser`, numbers or "".
+            storage (str, optional): `STORAGE_CELLS` keeps a `Cell` per position,
+                `STORAGE_COMPACT` keeps states and values in two flat arrays and
+                hands out `CellView` instead, using far less memory on large boards.
+            total_mines (int | None, optional): number of mines of the whole board,
+                None if unknown.
+        """
         self.rows = len(initial_map)
         self.columns = len(initial_map[0])
-        self.board = self.initialize_board(initial_map)
+        self.storage = storage
+        self.total_mines = total_mines
+        self._states: bytearray | None = None
+        self._values: array | None = None
+
+        if storage == STORAGE_CELLS:
+            self.board = self.initialize_board(initial_map)
+            self._cells = [cell for board_row in self.board for cell in board_row]
+        elif storage == STORAGE_COMPACT:
+            self._set_compact(*self.initialize_compact_board(initial_map))
+        else:
+            raise Exception(
+                f"expecting storage {STORAGE_CELLS} or {STORAGE_COMPACT}, "
+                f"received {storage}"
+            )
+        self._init_tracking()
+
+    @classmethod
+    def from_values(
+        cls,
+        rows: int,
+        columns: int,
+        values: array,
+        total_mines: int | None = None,
+        states: bytearray | None = None,
+        storage: str = STORAGE_COMPACT,
+    ) -> "Board":
+        """Create a board straight from flat values, -1 for no number.
+
+        With `STORAGE_COMPACT`, `values` becomes the value array of the board as is,
+        without going through strings, e.g. the clue plane of
+        `archive.ArchivedPuzzleView`. The states are derived from it in one pass,
+        unless `states` gives the state codes of a board being solved, see
+        `snapshot`. `STORAGE_CELLS` builds a `Cell` from each value and state.
+
+        Raises:
+            Exception: if a size does not match or a value is not -1 to 8.
+        """
+        if len(values) != rows * columns:
+            raise Exception(
+                f"expecting {rows * columns} values, received {len(values)}"
+            )
+        if values and (min(values) < -1 or max(values) > 8):
+            raise Exception(
+                f"expecting values -1 to 8, received {min(values)=} {max(values)=}"
+            )
+
+        board = cls.__new__(cls)
+        board.rows = rows
+        board.columns = columns
+        board.storage = storage
+        board.total_mines = total_mines
+        board._states = board._values = None
+        if states is None:
+            states = bytearray(values.tobytes().translate(VALUE_STATE_CODES))
+        elif len(states) != len(values):
+            raise Exception(f"expecting {len(values)} states, received {len(states)}")
+
+        if storage == STORAGE_CELLS:
+            board._cells = [
+                Cell(
+                    state=CELL_STATES[code], value=value, x=i % columns, y=i // columns
+                )
+                for i, (code, value) in enumerate(zip(states, values))
+            ]
+            board.board = [
+                board._cells[r * columns : (r + 1) * columns] for r in range(rows)
+            ]
+        elif storage == STORAGE_COMPACT:
+            board._set_compact(states, values)
+        else:
+            raise Exception(
+                f"expecting storage {STORAGE_CELLS} or {STORAGE_COMPACT}, "
+                f"received {storage}"
+            )
+        board._init_tracking()
+        return board
+
+    def _set_compact(self, states: bytearray, values: array) -> None:
+        """Use flat state codes and values, handing out `CellView`."""
+        self._states, self._values = states, values
+        self.board = [
+            CellViews(self, r * self.columns, self.columns) for r in range(self.rows)
+        ]
+        self._cells = CellViews(self, 0, self.rows * self.columns)
+
+    def _init_tracking(self) -> None:
+        """Build the neighbor table and empty change records."""
+        self._neighbor_offsets, self._neighbor_indices, self._neighbor_slots = (
+            build_neighbor_table(self.rows, self.columns)
+        )
+        # linear indices of cells changed through `set_state`, see `drain_changes`.
+        self._changes: list[int] = []
+        # states applied or collected by `set_state`, see `change_count`.
+        self._change_count = 0
+        # rows with a cell changed through `set_state`, see `drain_dirty_rows`.
+        self._dirty_rows = bytearray(self.rows)
+        # constraint records, built on first use by `constraint`.
+        self._remaining: array | None = None
+        self._unknown: bytearray | None = None
+        # states collected by `set_state` between `begin_batch` and `commit_batch`.
+        self._batch: dict[int, CellState] | None = None
+
+    @classmethod
+    def from_clues(
+        cls, rows: int, columns: int, clues: str, **kwargs: object
+    ) -> "Board":
+        """Create a board from one character per cell in row-major order.
+
+        A digit is a number, any other character a cell without number, e.g. the
+        clue string of `dom.GridPayload`. Other arguments go to `Board`.
+        """
+        if len(clues) != rows * columns:
+            raise Exception(f"expecting {rows * columns} clues, received {len(clues)}")
+
+        initial_map = [
+            [
+                value if value.isdigit() else ""
+                for value in clues[r * columns : (r + 1) * columns]
+            ]
+            for r in range(rows)
+        ]
+        return cls(initial_map, **kwargs)
 
     def __getitem__(self, idx: int) -> list[Cell]:
         """Return the row index of the board."""
         return self.board[idx]
 
-    def get_adjacent_cells(self, row: int, col: int) -> list[tuple[int, int]]:
-        """Get the adjacent cell including itself based on `self.board` size.
+    def set_state(self, row: int, col: int, state: CellState) -> bool:
+        """Set the state of a cell and record the change.
 
-        9 cells if in the middle.
-        6 cells if at the edge but in the middle.
-        4 cells if at the corner.
+        All strategies update the board through this method, so that schedulers
+        can find out which cells changed. Between `begin_batch` and `commit_batch`
+        the state is only collected, the board is not changed.
+
+        Raises:
+            Exception: if a batch already holds another state for the cell, the
+                batch is dropped.
+
+        Returns:
+            bool: True if the state of the cell changed, or was collected.
         """
-        result = []
-        max_height = min(row + 1, self.rows - 1)
-        min_height = max(row - 1, 0)
-        max_width = min(col + 1, self.columns - 1)
-        min_width = max(col - 1, 0)
+        index = row * self.columns + col
+        if self._batch is not None:
+            collected = self._batch.get(index)
+            if collected is None:
+                if self._states is not None:
+                    current = CELL_STATES[self._states[index]]
+                else:
+                    current = self._cells[index].state
+                if current == state:
+                    return False
+                self._batch[index] = state
+                self._change_count += 1
+                return True
+            if collected != state:
+                self._batch = None
+                raise Exception(
+                    f"conflicting deductions on {row, col}, {collected} and {state}"
+                )
+            return True
+
+        if self._states is not None:
+            code = CELL_STATE_CODES[state]
+            previous = self._states[index]
+            if previous == code:
+                return False
+            self._states[index] = code
+            previous = CELL_STATES[previous]
+        else:
+            cell = self._cells[index]
+            previous = cell.state
+            if previous == state:
+                return False
+            cell.state = state
+
+        if self._remaining is not None:
+            self._update_constraints(index, previous, state)
+
+        self._changes.append(index)
+        self._change_count += 1
+        self._dirty_rows[row] = 1
+        return True
+
+    def constraint(self, row: int, col: int) -> Constraint:
+        """Get the remaining mines and the unmarked neighbors of a cell.
+
+        Records are kept for every cell and updated in `set_state`. For a number
+        `remaining` is its value minus the flagged neighbors.
+
+        Cells of the default storage changed directly (`board[r][c].state = ...`)
+        after the first call are not seen, call `refresh_constraints` after them.
+        """
+        columns = self.columns
+        remaining, unmarked = self.constraint_at(row * columns + col)
+        return Constraint(
+            remaining, frozenset(divmod(index, columns) for index in unmarked)
+        )
+
+    def constraint_at(self, index: int) -> tuple[int, list[int]]:
+        """Get the remaining mines and the unmarked neighbors of a cell by index.
+
+        The same record as `constraint`, with linear indices instead of cells.
+        """
+        if self._remaining is None:
+            self.refresh_constraints()
+
+        indices = self._neighbor_indices
+        start = self._neighbor_offsets[index]
+        return self._remaining[index], [
+            indices[start + k] for k in MASK_BITS[self._unknown[index]]
+        ]
+
+    def refresh_constraints(self) -> None:
+        """Rebuild the constraint records of every cell from the current states."""
+        size = self.rows * self.columns
+        offsets, indices = self._neighbor_offsets, self._neighbor_indices
+        if self._states is not None:
+            states, values = self._states, self._values
+        else:
+            states = bytearray(CELL_STATE_CODES[cell.state] for cell in self._cells)
+            values = [cell.value for cell in self._cells]
+
+        unmarked_code = CELL_STATE_CODES[CellState.unmarked]
+        flag_code = CELL_STATE_CODES[CellState.flag]
+        remaining = array("b", bytes(size))
+        unknown = bytearray(size)
+        for index in range(size):
+            value = values[index]
+            mask = 0
+            start = offsets[index]
+            for k in range(start, offsets[index + 1]):
+                code = states[indices[k]]
+                if code == unmarked_code:
+                    mask |= 1 << (k - start)
+                elif code == flag_code:
+                    value -= 1
+            remaining[index] = value
+            unknown[index] = mask
+
+        self._remaining, self._unknown = remaining, unknown
+
+    def _update_constraints(
+        self, index: int, previous: CellState, state: CellState
+    ) -> None:
+        """Update the records of the neighbors of a cell that changed state."""
+        remaining, unknown = self._remaining, self._unknown
+        indices, slots = self._neighbor_indices, self._neighbor_slots
+        for k in range(
+            self._neighbor_offsets[index], self._neighbor_offsets[index + 1]
+        ):
+            neighbor = indices[k]
+            if previous == CellState.unmarked:
+                unknown[neighbor] &= ~(1 << slots[k])
+            elif state == CellState.unmarked:
+                unknown[neighbor] |= 1 << slots[k]
+            if previous == CellState.flag:
+                remaining[neighbor] += 1
+            elif state == CellState.flag:
+                remaining[neighbor] -= 1
+
+    @property
+    def change_count(self) -> int:
+        """Number of states applied or collected by `set_state` so far.
+
+        It only grows, the difference between two reads is the number of cells
+        changed in between. A state collected by a batch counts once when collected
+        and once more when `commit_batch` applies it.
+        """
+        return self._change_count
+
+    def pending_changes(self) -> int:
+        """Number of changes recorded since the last `drain_changes`.
+
+        States collected by a batch count as changes.
+        """
+        if self._batch is not None:
+            return len(self._changes) + len(self._batch)
+        return len(self._changes)
+
+    def begin_batch(self) -> None:
+        """Collect the states given to `set_state` instead of applying them.
+
+        Strategies keep reading the board as it is, so every deduction of the
+        batch comes from the same board, see `commit_batch`.
+        """
+        self._batch = {}
+
+    def commit_batch(self) -> list[int]:
+        """Apply the states collected since `begin_batch`, in order.
+
+        Conflicts are checked as the states are collected, see `set_state`.
+
+        Returns:
+            list[int]: linear indices of the changed cells, also recorded for
+                `drain_changes`.
+        """
+        batch, self._batch = self._batch or {}, None
+        columns = self.columns
+        return [
+            index
+            for index, state in batch.items()
+            if self.set_state(*divmod(index, columns), state)
+        ]
+
+    def snapshot(self) -> bytes:
+        """Copy of the state codes of every cell, see `CELL_STATE_CODES`."""
+        if self._states is not None:
+            return bytes(self._states)
+        return bytes(CELL_STATE_CODES[cell.state] for cell in self._cells)
+
+    def drain_dirty_rows(self) -> list[int]:
+        """Return the rows changed since the last call, and reset them.
 
-        for i in range(min_height, max_height + 1):
-            for j in range(min_width, max_width + 1):
-                if i == row and j == col:
-                    continue
-                result.append((i, j))
+        Unlike `drain_changes`, this is meant for a display reading the board from
+        another thread. Flags are cleared before the caller reads the rows, so a
+        change made meanwhile is reported again on the next call.
+        """
+        dirty = self._dirty_rows
+        rows = [r for r in range(self.rows) if dirty[r]]
+        for r in rows:
+            dirty[r] = 0
+        return rows
+
+    def drain_changes(self) -> list[int]:
+        """Return the linear indices changed since the last call, and reset them."""
+        changes, self._changes = self._changes, []
+        return changes
 
-        return result
+    def get_adjacent_cells(self, row: int, col: int) -> list[tuple[int, int]]:
+        """Get the adjacent cells, excluding itself, based on `self.board` size.
+
+        8 cells if in the middle.
+        5 cells if at the edge but in the middle.
+        3 cells if at the corner.
+        """
+        columns = self.columns
+        return [divmod(i, columns) for i in self.adjacent_indices(row * columns + col)]
+
+    def adjacent_indices(self, index: int) -> array:
+        """Get the linear indices of the cells adjacent to linear `index`."""
+        offsets = self._neighbor_offsets
+        return self._neighbor_indices[offsets[index] : offsets[index + 1]]
 
     def get_adjacent_cell_state(
         self, row: int, col: int, state: CellState
     ) -> list[tuple[int, int]]:
         """Filters get_adjacent_cells with certain cell state."""
-        neighbors = self.get_adjacent_cells(row, col)
-        neighbors_w_state = [(r, c) for r, c in neighbors if self[r][c].state == state]
-        return neighbors_w_state
+        columns = self.columns
+        neighbors = self.adjacent_indices(row * columns + col)
+        if self._states is not None:
+            states, code = self._states, CELL_STATE_CODES[state]
+            return [divmod(i, columns) for i in neighbors if states[i] == code]
+
+        cells = self._cells
+        return [divmod(i, columns) for i in neighbors if cells[i].state == state]
+
+    def get_nearby_cell_state(
+        self, row: int, col: int, radius: int, state: CellState
+    ) -> list[tuple[int, int]]:
+        """Get cells with certain state up to `radius` rows and columns away, excluding itself."""
+        columns = self.columns
+        nearby = [
+            r * columns + c
+            for r in range(max(row - radius, 0), min(row + radius, self.rows - 1) + 1)
+            for c in range(max(col - radius, 0), min(col + radius, columns - 1) + 1)
+            if r != row or c != col
+        ]
+        if self._states is not None:
+            states, code = self._states, CELL_STATE_CODES[state]
+            return [divmod(i, columns) for i in nearby if states[i] == code]
+
+        cells = self._cells
+        return [divmod(i, columns) for i in nearby if cells[i].state == state]
 
     def get_all_cells_by_state(self, state: CellState) -> list[Cell]:
         """Get all cells in board filtered by cell state."""
+        columns = self.columns
+        if self._states is not None:
+            code = CELL_STATE_CODES[state]
+            return [divmod(i, columns) for i, s in enumerate(self._states) if s == code]
+
         return [
-            (r, c)
-            for r in range(self.rows)
-            for c in range(self.columns)
-            if self[r][c].state == state
+            divmod(i, columns) for i, c in enumerate(self._cells) if c.state == state
         ]
 
     def initialize_board(self, array: list[list[str]]) -> list[list[int]]:
@@ -73,6 +496,18 @@ class Board:
             board.append(board_row)
         return board
 
+    def initialize_compact_board(
+        self, array_map: list[list[str]]
+    ) -> tuple[bytearray, array]:
+        """Create the flat state codes and values of a compact board."""
+        values = array(
+            "b", [self.validate_value(value) for row in array_map for value in row]
+        )
+        states = bytearray(
+            CELL_STATE_CODES[self._initial_cell_state(value)] for value in values
+        )
+        return states, values
+
     @staticmethod
     def validate_value(value: str) -> int:
         """Check and validate value received."""
@@ -133,24 +568,24 @@ def flag_all_numbers(row: int, col: int, board: Board) -> bool:
         return False
 
     number = curr.value
-    unmarked = board.get_adjacent_cell_state(row, col, CellState.unmarked)
-    flagged = board.get_adjacent_cell_state(row, col, CellState.flag)
+    remaining, unmarked = board.constraint(row, col)
+    flagged = number - remaining
     if len(unmarked) == 0:
         # if there are no unmarked space, ignore it.
         return updated
 
-    if len(flagged) and len(flagged) == number:
+    if flagged and flagged == number:
         # if a number (2) has 2 flagged, ignore remaining empty space.
         return updated
 
     if number == 0:
         for r, c in unmarked:
-            board[r][c].state = CellState.empty
+            board.set_state(r, c, CellState.empty)
             updated = True
 
-    if number != 0 and number == (len(unmarked) + len(flagged)):
+    if number != 0 and number == (len(unmarked) + flagged):
         for r, c in unmarked:
-            board[r][c].state = CellState.flag
+            board.set_state(r, c, CellState.flag)
             updated = True
 
     return updated
@@ -164,17 +599,16 @@ def flag_remaining_unmarked(row: int, col: int, board: Board) -> bool:
     if curr.value == 0:
         return False
 
-    flagged = board.get_adjacent_cell_state(row, col, CellState.flag)
-    unmarked = board.get_adjacent_cell_state(row, col, CellState.unmarked)
+    remaining, unmarked = board.constraint(row, col)
 
-    if curr.value < len(flagged):
+    if remaining < 0:
         raise Exception(
-            f"flagged more than the value {curr.value}, flagged {len(flagged)}, on {row, col}"
+            f"flagged more than the value {curr.value}, flagged {curr.value - remaining}, on {row, col}"
         )
 
-    if curr.value == len(flagged) and len(unmarked) > 0:
+    if remaining == 0 and len(unmarked) > 0:
         for r, c in unmarked:
-            board[r][c].state = CellState.empty
+            board.set_state(r, c, CellState.empty)
             updated = True
 
     return updated
@@ -199,39 +633,33 @@ def deduce_from_neighbors_and_flag(row: int, col: int, board: Board) -> bool:
     e e e
     """
     updated = False
-    curr: Cell = board[row][col]
-    unmarked = board.get_adjacent_cell_state(row, col, CellState.unmarked)
-    flagged = board.get_adjacent_cell_state(row, col, CellState.flag)
+    remaining_value, unmarked = board.constraint(row, col)
     neighbor_number = board.get_adjacent_cell_state(row, col, CellState.is_number)
-    remaining_value = curr.value - len(flagged)
 
     if len(unmarked) == 0:
         return updated
 
     for r, c in neighbor_number:
-        neighbor_value = board[r][c].value
-        neighbor_unmarked = board.get_adjacent_cell_state(r, c, CellState.unmarked)
-        neighbor_flagged = board.get_adjacent_cell_state(r, c, CellState.flag)
+        remaining_neighbor_value, neighbor_unmarked = board.constraint(r, c)
 
-        to_mark = [c for c in unmarked if c not in neighbor_unmarked]
-        to_empty = [c for c in neighbor_unmarked if c not in unmarked]
+        to_mark = unmarked - neighbor_unmarked
+        to_empty = neighbor_unmarked - unmarked
 
         if len(to_mark) == 0 and len(to_empty) == 0:
             continue
 
-        remaining_neighbor_value = neighbor_value - len(neighbor_flagged)
         if len(to_mark) and (remaining_value - remaining_neighbor_value) == len(
             to_mark
         ):
             for mr, mc in to_mark:
-                board[mr][mc].state = CellState.flag
+                board.set_state(mr, mc, CellState.flag)
             for nr, nc in to_empty:
-                board[nr][nc].state = CellState.empty
+                board.set_state(nr, nc, CellState.empty)
             updated = True
             break
         elif len(to_mark) == 0 and (remaining_value - remaining_neighbor_value) == 0:
             for nr, nc in to_empty:
-                board[nr][nc].state = CellState.empty
+                board.set_state(nr, nc, CellState.empty)
             updated = True
             break
     return updated
@@ -260,14 +688,11 @@ def suspect_adjacent_candidates_and_mark_neighbor_empty(
     e e e
     """
     updated = False
-    curr: Cell = board[row][col]
-    unmarked = board.get_adjacent_cell_state(row, col, CellState.unmarked)
-    flagged = board.get_adjacent_cell_state(row, col, CellState.flag)
-    remaining_value = curr.value - len(flagged)
+    remaining_value, unmarked = board.constraint(row, col)
 
     # for each adjacent unmarked cell, get its other number neighbor.
     suspect_neighbor_hash = defaultdict(set)
-    for r, c in unmarked:
+    for r, c in sorted(unmarked):
         neighbor_num = board.get_adjacent_cell_state(r, c, CellState.is_number)
         for n in neighbor_num:
             if n == (row, col):
@@ -278,16 +703,10 @@ def suspect_adjacent_candidates_and_mark_neighbor_empty(
         return updated
 
     for k in suspect_neighbor_hash:
-        k_value = board[k[0]][k[1]].value
-        k_neighbor_unmarked = board.get_adjacent_cell_state(
-            k[0], k[1], CellState.unmarked
-        )
-        k_neighbor_flagged = board.get_adjacent_cell_state(k[0], k[1], CellState.flag)
-
-        to_mark = [c for c in unmarked if c not in k_neighbor_unmarked]
-        to_empty = [c for c in k_neighbor_unmarked if c not in unmarked]
+        remaining_neighbor_value, k_neighbor_unmarked = board.constraint(*k)
 
-        remaining_neighbor_value = k_value - len(k_neighbor_flagged)
+        to_mark = unmarked - k_neighbor_unmarked
+        to_empty = k_neighbor_unmarked - unmarked
 
         if len(to_mark) == 0 and len(to_empty) == 0:
             continue
@@ -296,19 +715,101 @@ def suspect_adjacent_candidates_and_mark_neighbor_empty(
             to_mark
         ):
             for mr, mc in to_mark:
-                board[mr][mc].state = CellState.flag
+                board.set_state(mr, mc, CellState.flag)
             for nr, nc in to_empty:
-                board[nr][nc].state = CellState.empty
+                board.set_state(nr, nc, CellState.empty)
             updated = True
             break
         elif len(to_mark) == 0 and (remaining_value - remaining_neighbor_value) == 0:
             for nr, nc in to_empty:
-                board[nr][nc].state = CellState.empty
+                board.set_state(nr, nc, CellState.empty)
             updated = True
             break
 
     return updated
 
 
+# the window covers the unmarked cells of numbers up to 2 cells away.
+WINDOW_RADIUS = 3
+WINDOW_WIDTH = 2 * WINDOW_RADIUS + 1
+
+
+def _window_constraint(board: Board, row: int, col: int, shift: int) -> tuple[int, int]:
+    """Get the remaining mines and the unmarked neighbors of a cell as window bits.
+
+    Cell (r, c) maps to bit `r * WINDOW_WIDTH + c + shift`.
+    """
+    columns = board.columns
+    remaining, unmarked = board.constraint_at(row * columns + col)
+    mask = 0
+    for index in unmarked:
+        r, c = divmod(index, columns)
+        mask |= 1 << (r * WINDOW_WIDTH + c + shift)
+    return remaining, mask
+
+
+def _from_window_mask(mask: int, row: int, col: int) -> list[tuple[int, int]]:
+    """Decode the bits of a 7x7 window centered on (row, col) into cells."""
+    cells = []
+    while mask:
+        bit = (mask & -mask).bit_length() - 1
+        mask &= mask - 1
+        r, c = divmod(bit, WINDOW_WIDTH)
+        cells.append((row + r - WINDOW_RADIUS, col + c - WINDOW_RADIUS))
+    return cells
+
+
+def subset_reasoning(row: int, col: int, board: Board) -> bool:
+    """Compare the number with every number up to 2 cells away using bitmasks.
+
+    Each constraint is a bitmask of unmarked cells over a local window and its
+    remaining mines. For two constraints A and B, with `d = remaining(A) - remaining(B)`:
+
+    - if `d` equals the size of A - B, then A - B are mines and B - A are empty.
+    - so if A is a subset of B, B - A holds `remaining(B) - remaining(A)` mines,
+      empty when the difference is 0 and all mines when it is the size of B - A.
+
+    Pairing with an empty constraint also covers `flag_all_numbers` and
+    `flag_remaining_unmarked`, and the 2 cells reach covers both
+    `deduce_from_neighbors_and_flag` and
+    `suspect_adjacent_candidates_and_mark_neighbor_empty`.
+    """
+    if board[row][col].state != CellState.is_number:
+        return False
+
+    # (row, col) is the center of the window.
+    shift = (WINDOW_RADIUS - row) * WINDOW_WIDTH + WINDOW_RADIUS - col
+    remaining, own = _window_constraint(board, row, col, shift)
+    if not own:
+        return False
+
+    others = [(0, 0)]
+    for r, c in board.get_nearby_cell_state(row, col, 2, CellState.is_number):
+        other_remaining, other = _window_constraint(board, r, c, shift)
+        if other:
+            others.append((other, other_remaining))
+
+    for other, other_remaining in others:
+        for a, remaining_a, b, remaining_b in (
+            (own, remaining, other, other_remaining),
+            (other, other_remaining, own, remaining),
+        ):
+            only_a = a & ~b
+            if (remaining_a - remaining_b) != only_a.bit_count():
+                continue
+
+            only_b = b & ~a
+            if not only_a and not only_b:
+                continue
+
+            for r, c in _from_window_mask(only_a, row, col):
+                board.set_state(r, c, CellState.flag)
+            for r, c in _from_window_mask(only_b, row, col):
+                board.set_state(r, c, CellState.empty)
+            return True
+
+    return False
+
+
 if __name__ == "__main__":
     ...
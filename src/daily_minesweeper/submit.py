@@ -0,0 +1,215 @@
+"""Module to flag the solved cells on the web page.
+
+The script backend dispatches the right click events of many cells from a single
+`execute_script` call, the ActionChains backend clicks one element at a time like a
+user would and is kept as a fallback.
+"""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from . import constants
+
+# cells flagged by one script call, keeps each call well under the driver timeout.
+CHUNK_SIZE = 200
+
+WEBPAGE_CLICK_SPEED = 100  # in milliseconds
+SCROLL_WAIT_TIME = 100  # in milliseconds
+
+BACKEND_SCRIPT = "script"
+BACKEND_ACTIONS = "actions"
+
+# the same event sequence as a right click of the mouse. The cells are flagged in
+# order and each one is marked once its events are sent, marks of an earlier call
+# are cleared first, so a chunk failing part-way leaves a known prefix flagged.
+# Returns the number of cells flagged, stopping at the first missing or failing cell.
+FLAG_SCRIPT = """
+const game = document.getElementById(arguments[0]);
+if (!game) {
+    return 0;
+}
+const cells = game.querySelectorAll(".cell");
+for (const position of arguments[1]) {
+    if (cells[position]) {
+        delete cells[position].dataset.solverFlagged;
+    }
+}
+let flagged = 0;
+for (const position of arguments[1]) {
+    const cell = cells[position];
+    if (!cell) {
+        break;
+    }
+    const rect = cell.getBoundingClientRect();
+    const init = {
+        bubbles: true,
+        cancelable: true,
+        view: window,
+        button: 2,
+        buttons: 2,
+        clientX: rect.left + rect.width / 2,
+        clientY: rect.top + rect.height / 2,
+    };
+    try {
+        cell.dispatchEvent(new MouseEvent("mousedown", init));
+        cell.dispatchEvent(new MouseEvent("mouseup", {...init, buttons: 0}));
+        cell.dispatchEvent(new MouseEvent("contextmenu", {...init, buttons: 0}));
+    } catch (error) {
+        break;
+    }
+    cell.dataset.solverFlagged = "1";
+    flagged++;
+}
+return flagged;
+"""
+
+# number of leading cells marked by `FLAG_SCRIPT`, read again when its call raised
+# so a cell right clicked before the error is not clicked, and unflagged, twice.
+FLAGGED_SCRIPT = """
+const game = document.getElementById(arguments[0]);
+if (!game) {
+    return 0;
+}
+const cells = game.querySelectorAll(".cell");
+let flagged = 0;
+for (const position of arguments[1]) {
+    const cell = cells[position];
+    if (!cell || cell.dataset.solverFlagged !== "1") {
+        break;
+    }
+    flagged++;
+}
+return flagged;
+"""
+
+
+@dataclass
+class SubmitReport:
+    """Outcome of flagging the cells on the page."""
+
+    backend: str
+    flags: int = 0
+    round_trips: int = 0
+    seconds: float = 0.0
+
+    def add(self, other: "SubmitReport") -> None:
+        """Accumulate the counters of a fallback run."""
+        self.flags += other.flags
+        self.round_trips += other.round_trips
+        self.seconds += other.seconds
+
+
+def flagged_prefix(driver: WebDriver, positions: list[int], game_id: str) -> int:
+    """Number of leading positions already flagged by `FLAG_SCRIPT`, 0 if unknown."""
+    try:
+        return driver.execute_script(FLAGGED_SCRIPT, game_id, positions)
+    except WebDriverException:
+        return 0
+
+
+def submit_flags_by_script(
+    driver: WebDriver,
+    positions: list[int],
+    game_id: str = constants.GAME_ID,
+    chunk_size: int = CHUNK_SIZE,
+) -> SubmitReport:
+    """Flag cells with one script call per chunk.
+
+    Args:
+        driver (WebDriver): browser with the game loaded
+        positions (list[int]): document order of the cells to flag, see
+            `dom.GridPayload.element_positions`
+        game_id (str, optional): id of the game element
+        chunk_size (int, optional): cells flagged by each call
+
+    Returns:
+        SubmitReport: counters of the calls, stops at the first cell that fails so
+            `flags` is the number of leading positions flagged
+    """
+    report = SubmitReport(BACKEND_SCRIPT)
+    start = time.perf_counter()
+    for i in range(0, len(positions), chunk_size):
+        chunk = positions[i : i + chunk_size]
+        report.round_trips += 1
+        try:
+            flagged = driver.execute_script(FLAG_SCRIPT, game_id, chunk)
+        except WebDriverException:
+            flagged = flagged_prefix(driver, chunk, game_id)
+            report.round_trips += 1
+        report.flags += flagged
+        if flagged != len(chunk):
+            break
+
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def submit_flags_by_actions(
+    driver: WebDriver, elements: list[WebElement]
+) -> SubmitReport:
+    """Right click each element with ActionChains, scrolling it into view first."""
+    report = SubmitReport(BACKEND_ACTIONS)
+    start = time.perf_counter()
+    vh = driver.get_window_size()["height"] - 100
+    report.round_trips += 1
+    for p in elements:
+        scroll_position = driver.execute_script("return window.pageYOffset;")
+        scroll_y = max((p.location["y"] - (vh + scroll_position)), 0)
+        report.round_trips += 2
+        if scroll_y:
+            scroll_action = ActionChains(driver, duration=100)
+            scroll_action.scroll_by_amount(delta_x=0, delta_y=scroll_y).perform()
+            time.sleep(SCROLL_WAIT_TIME / 1000)
+            report.round_trips += 1
+
+        actions = ActionChains(driver, duration=WEBPAGE_CLICK_SPEED)
+        actions.context_click(p).perform()
+        report.round_trips += 1
+        report.flags += 1
+
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def submit_flags(
+    driver: WebDriver,
+    positions: list[int],
+    find_elements: Callable[[], list[WebElement]],
+    game_id: str = constants.GAME_ID,
+    chunk_size: int = CHUNK_SIZE,
+) -> SubmitReport:
+    """Flag cells with the script backend, falling back to ActionChains.
+
+    When a chunk fails, the cells after the last one flagged by script are clicked
+    with ActionChains, so no cell is right clicked twice.
+
+    Args:
+        driver (WebDriver): browser with the game loaded
+        positions (list[int]): document order of the cells to flag
+        find_elements (Callable[[], list[WebElement]]): all cell elements in
+            document order, only called for the fallback
+        game_id (str, optional): id of the game element
+        chunk_size (int, optional): cells flagged by each script call
+
+    Returns:
+        SubmitReport: counters of both backends, `backend` names the last one used
+    """
+    report = submit_flags_by_script(driver, positions, game_id, chunk_size)
+    if report.flags == len(positions):
+        return report
+
+    elements = find_elements()
+    report.round_trips += 1
+    report.add(
+        submit_flags_by_actions(
+            driver, [elements[p] for p in positions[report.flags :]]
+        )
+    )
+    report.backend = BACKEND_ACTIONS
+    return report
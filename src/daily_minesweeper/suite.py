@@ -0,0 +1,191 @@
+"""Offline benchmark suite on generated puzzles, run with `python -m daily_minesweeper.suite`.
+
+Every case is a puzzle from `generator.generate_solvable_puzzle`, so it is solved
+without guessing and needs neither Selenium nor the website. Results are compared
+with a baseline file to flag drops in throughput, `--save` writes the baseline.
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from . import generator, profiling, scheduler
+from .data_model import CellState
+from .solver import Board
+
+console = Console()
+
+DEFAULT_SIZES = (5, 20, 60, 120)
+DEFAULT_CLUE_DENSITY = 0.1
+BASELINE_PATH = "benchmark_baseline.json"
+# throughput drops larger than this share of the baseline are flagged, runs on a
+# busy machine easily vary by 10 - 20%.
+TOLERANCE = 0.25
+
+
+def case_name(size: int, clue_density: float) -> str:
+    """Key of a case in the results and the baseline."""
+    return f"{size}x{size}@{clue_density}"
+
+
+def run_case(
+    size: int, clue_density: float = DEFAULT_CLUE_DENSITY, repeat: int = 5
+) -> dict:
+    """Generate a puzzle, then time building the board, solving it and each strategy.
+
+    Times are the best of `repeat` runs, strategy times come from a separate run
+    with every call timed.
+
+    Raises:
+        Exception: if the solver does not find the generated solution.
+
+    Returns:
+        dict: timings in milliseconds and throughput in cells solved per second.
+    """
+    puzzle = generator.generate_solvable_puzzle(
+        size, size, clue_density=clue_density, seed=size
+    )
+    strategies = generator.CHECK_STRATEGIES
+
+    construct = min(timeit.repeat(lambda: Board(puzzle.clues), number=1, repeat=repeat))
+
+    solve_times = []
+    for _ in range(repeat):
+        board = Board(puzzle.clues)
+        cells = len(board.get_all_cells_by_state(CellState.unmarked))
+        start = timeit.default_timer()
+        scheduler.solve(board, strategies)
+        solve_times.append(timeit.default_timer() - start)
+
+    flags = set(board.get_all_cells_by_state(CellState.flag))
+    if board.get_all_cells_by_state(CellState.unmarked) or flags != puzzle.mines:
+        raise Exception(f"solver did not find the solution of {size}x{size}")
+
+    profiler = profiling.StrategyProfiler(sample_every=1)
+    scheduler.solve(Board(puzzle.clues), profiler.wrap_all(strategies))
+
+    solve = min(solve_times)
+    return {
+        "cells": cells,
+        "construct_ms": construct * 1000,
+        "solve_ms": solve * 1000,
+        "cells_per_second": cells / solve,
+        "strategies": {
+            name: {
+                "invocations": profile.invocations,
+                "deductions": profile.deductions,
+                "time_ms": profile.time_ns / 1e6,
+            }
+            for name, profile in profiler.profiles.items()
+        },
+    }
+
+
+def run_suite(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    clue_density: float = DEFAULT_CLUE_DENSITY,
+    repeat: int = 5,
+) -> dict[str, dict]:
+    """Run a case for every size."""
+    return {
+        case_name(size, clue_density): run_case(size, clue_density, repeat)
+        for size in sizes
+    }
+
+
+def find_regressions(
+    results: dict[str, dict], baseline: dict[str, dict], tolerance: float = TOLERANCE
+) -> dict[str, float]:
+    """Compare throughput with the baseline, for the cases found in both.
+
+    Returns:
+        dict[str, float]: ratio of the current to the baseline throughput, for each
+            case below `1 - tolerance`.
+    """
+    regressions = {}
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result["cells_per_second"] / baseline[name]["cells_per_second"]
+        if ratio < 1 - tolerance:
+            regressions[name] = ratio
+    return regressions
+
+
+def draw_results(results: dict[str, dict], baseline: dict[str, dict]) -> Table:
+    """Draw table with the results of each case against the baseline."""
+    table = Table(title="benchmark suite")
+    for column in ("case", "construct (ms)", "solve (ms)", "cells/s", "baseline"):
+        table.add_column(column, justify="right")
+
+    for name, result in results.items():
+        reference = baseline.get(name)
+        ratio = (
+            f"{result['cells_per_second'] / reference['cells_per_second']:.2f}x"
+            if reference
+            else "-"
+        )
+        table.add_row(
+            name,
+            f"{result['construct_ms']:.1f}",
+            f"{result['solve_ms']:.1f}",
+            f"{result['cells_per_second']:.0f}",
+            ratio,
+        )
+    return table
+
+
+def load_baseline(path: str | Path) -> dict[str, dict]:
+    """Read a baseline file, empty if there is none yet."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path: str | Path, results: dict[str, dict]) -> None:
+    """Merge the results into the baseline file."""
+    baseline = load_baseline(path)
+    baseline.update(results)
+    with Path(path).open("w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2)
+
+
+def main(args: list[str]) -> int:
+    """Run the suite, print the results and flag regressions.
+
+    Returns:
+        int: exit code, 1 if any case regressed.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    arg_parser.add_argument("--clue-density", type=float, default=DEFAULT_CLUE_DENSITY)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--baseline", default=BASELINE_PATH)
+    arg_parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    arg_parser.add_argument("--save", action="store_true", help="update the baseline")
+    options = arg_parser.parse_args(args[1:])
+
+    baseline = load_baseline(options.baseline)
+    results = run_suite(tuple(options.sizes), options.clue_density, options.repeat)
+    console.print(draw_results(results, baseline))
+
+    regressions = find_regressions(results, baseline, options.tolerance)
+    for name, ratio in regressions.items():
+        console.print(f"[red]regression[/red] {name}: {ratio:.2f}x of the baseline")
+
+    if options.save:
+        save_baseline(options.baseline, results)
+        console.print(f"baseline written to {options.baseline}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
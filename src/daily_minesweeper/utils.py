@@ -1,16 +1,20 @@
 """Utilities module."""
 
 from bs4 import BeautifulSoup
-from selenium import webdriver
 
 from . import constants as c
+from . import session
 
 
-def get_sample_minesweeper_game(url_address: str = None) -> str:
+def get_sample_minesweeper_game(
+    url_address: str = None, pool: session.DriverPool | None = None
+) -> str:
     """Get retrieve sample minesweeper game for testing purpose.
 
     Args:
         url_address (str, optional): url with difficulty
+        pool (session.DriverPool | None, optional): pool to take the browser from,
+            the process wide `session.default_pool` if None
 
     Returns:
         str: html page of the minesweeper
@@ -18,14 +22,14 @@ def get_sample_minesweeper_game(url_address: str = None) -> str:
     if url_address is None:
         url_address = c.BASE_URL + c.EASY_5
 
-    driver = webdriver.Firefox()
-    driver.get(url_address)
+    pool = pool or session.default_pool()
+    with pool.session() as driver:
+        driver.get(url_address)
+        page_source = driver.page_source
 
-    bs = BeautifulSoup(driver.page_source, "html.parser")
+    bs = BeautifulSoup(page_source, "html.parser")
     result = bs.find(id=c.GAME_ID)
 
-    driver.quit()
-
     return str(result)
 
 
@@ -33,6 +37,7 @@ def parse_sysargv_difficulty(args: list[str]) -> str:
     """Get the difficulty from command line.
 
     Expects from a list of difficulty in constants.py, defaults to daily if none entered.
+    Options starting with `--` are skipped.
 
     Args:
         args (list[str]): from sys.argv
@@ -43,6 +48,7 @@ def parse_sysargv_difficulty(args: list[str]) -> str:
     Returns:
         str: one of the constants predefined.
     """
+    args = [arg for arg in args if not arg.startswith("--")]
     if len(args) == 1:
         return c.DAILY
 
@@ -2,105 +2,193 @@
 
 import sys
 import time
+from contextlib import nullcontext
 from typing import Callable
 
-from bs4 import BeautifulSoup
 from rich.console import Console
-from rich.live import Live
-from selenium import webdriver
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 
-from daily_minesweeper import constants, display, parser, solver, utils
+from daily_minesweeper import (
+    cache,
+    constants,
+    display,
+    dom,
+    parallel,
+    parser,
+    planner,
+    profiling,
+    registry,
+    sat,
+    scheduler,
+    session,
+    solver,
+    submit,
+    utils,
+)
 from daily_minesweeper.data_model import CellState
 
 DIFFICULTY = utils.parse_sysargv_difficulty(sys.argv)
-
-WEBPAGE_CLICK_SPEED = 100  # in milliseconds
-CONSOLE_CLICK_SPEED = 10  # in milliseconds
-SCROLL_WAIT_TIME = 100  # in milliseconds
+SHOW_DISPLAY = "--no-display" not in sys.argv
+# solve large boards by tiles across all cores first, see `parallel`.
+USE_PARALLEL = "--parallel" in sys.argv
+# read the grid from page_source instead of one script call.
+USE_PAGE_SOURCE = "--page-source" in sys.argv
+# click every flag with ActionChains instead of one script call per chunk.
+USE_ACTIONS = "--actions" in sys.argv
+# solve again instead of reading the flags of a solved puzzle from the cache.
+USE_CACHE = "--no-cache" not in sys.argv
+# apply the deductions of each pass over the worklist together.
+USE_BATCHED = "--batched" in sys.argv
 
 console = Console()
 
-## Main strategies for solving the puzzle, in order.
-logical_strategy = [
-    solver.flag_all_numbers,
-    solver.flag_remaining_unmarked,
-    solver.deduce_from_neighbors_and_flag,
-    solver.suspect_adjacent_candidates_and_mark_neighbor_empty,
-]
+## Main strategies for solving the puzzle, cheapest first. `--strategies=NAME,NAME`
+## picks others from `registry.REGISTRY`. The exact but expensive
+## `solve_frontier` is only reached when the local patterns fail on a cell.
+logical_strategy = registry.parse_sysargv_strategies(sys.argv)
 
 
 def solve(
-    board: solver.Board, strategies: list[Callable[[int, int, solver.Board], bool],]
-) -> None:
-    """Loop through each solving strategy on the board and try to clear as much as possible."""
-    number_cells = board.get_all_cells_by_state(CellState.is_number)
-
-    def step() -> bool:
-        """Continuously loop all strategies to apply. Stops when none of the strategy works further."""
-        return any(
-            strategy(r, c, board) for strategy in strategies for r, c in number_cells
-        )
-
-    # render the board after each pass of all strategies.
-    with Live(display.draw_board(board), console=console, refresh_per_second=4) as live:
-        while step():
-            time.sleep(CONSOLE_CLICK_SPEED / 1000)
-            live.update(display.draw_board(board))
-            pass
-
-
-def main() -> None:
+    board: solver.Board,
+    strategies: list[Callable[[int, int, solver.Board], bool],],
+    sat_fallback: bool = True,
+    show_display: bool = True,
+    batched: bool = False,
+) -> scheduler.SolveStats:
+    """Loop through each solving strategy on the board and try to clear as much as possible.
+
+    Once the strategies stall with unmarked cells left, the SAT backend marks the
+    cells forced by the whole board, and the strategies run again. The page does
+    not show the total mine count, so `frontier.solve_mine_count` is not used.
+
+    The board is drawn from a render thread at `display.FRAMES_PER_SECOND`, the
+    solver never waits on it. `show_display=False` skips rendering entirely.
+    `batched` applies the deductions of each pass together, see `scheduler.solve`.
+    """
+    phase_time = {"strategies": 0.0, "sat": 0.0}
+    profiler = profiling.StrategyProfiler()
+    strategies = profiler.wrap_all(strategies)
+    renderer = display.BoardRenderer(board, console) if show_display else None
+    on_update = renderer.publish if renderer else None
+
+    with renderer or nullcontext():
+        start = time.perf_counter()
+        stats = scheduler.solve(board, strategies, on_update=on_update, batched=batched)
+        phase_time["strategies"] += time.perf_counter() - start
+
+        while board.get_all_cells_by_state(CellState.unmarked):
+            if not sat_fallback:
+                break
+            start = time.perf_counter()
+            updated = sat.solve_board(board)
+            phase_time["sat"] += time.perf_counter() - start
+            if not updated:
+                break
+
+            if renderer:
+                renderer.publish()
+            start = time.perf_counter()
+            stats.add(
+                scheduler.solve(board, strategies, on_update=on_update, batched=batched)
+            )
+            phase_time["strategies"] += time.perf_counter() - start
+
+    console.print(
+        f"{stats.deductions} deductions in {stats.commits} updates "
+        f"with {stats.invocations} strategy calls "
+        f"(upper bound of calls skipped: {stats.skipped_upper_bound}, "
+        "`benchmark` measures the saving against `solve_naive`)"
+    )
+    console.print(
+        f"solved in {sum(phase_time.values()):.3f}s ("
+        + ", ".join(f"{phase} {seconds:.3f}s" for phase, seconds in phase_time.items())
+        + ")"
+        + (f", {renderer.frames} frames drawn" if renderer else "")
+    )
+    console.print(display.draw_profile(profiler.ranked()))
+    return stats
+
+
+def main(pool: session.DriverPool | None = None) -> None:
     """Main function for solving.
 
     1. Opens up the minesweeper website of selected difficulty.
     2. Wait for the html to load properly.
-    3. Parse the html into 2D array.
-    4. Apply the series of functions as strategy to solve the board.
-    5. Translate the flagged cell into positions to click for website.
+    3. Read the grid with one script call, or parse the html into 2D array.
+    4. Apply the series of functions as strategy to solve the board, or read the
+       flags from the cache when the same grid was solved before.
+    5. Plan a click on the element of every flagged cell, sorted by scroll position.
+    6. Flag them from one script call per chunk, or ActionChains as a fallback.
+
+    The browser comes from `pool`, the process wide `session.default_pool` if None,
+    so repeated calls in one process reuse the same session.
     """
     console.print(f"[bold blue]💣 Solving for difficulty {DIFFICULTY} 💣[/]")
-    ## OPEN THE WEB BROWSER
-    driver = webdriver.Firefox()
-    driver.get(constants.BASE_URL + DIFFICULTY + "/")
-    driver.find_element(By.ID, "SideClose").click()
-
-    bs = BeautifulSoup(driver.page_source, "html.parser")
-    result = bs.find(id=constants.GAME_ID)
-
-    ## LOAD THE HTML INTO 2D ARRAY
-    array_board = parser.parse_html_into_array(str(result))
-
-    ## INITIALIZE THE BOARD
-    board = solver.Board(array_board)
-    clickable = board.get_all_cells_by_state(CellState.unmarked)
-
-    ## SOLVE THE BOARD WITH DISPLAY
-    solve(board, logical_strategy)
-
-    ## RECORD THE COORDINATE POSITION
-    flags = board.get_all_cells_by_state(CellState.flag)
-
-    ## UPDATE THE WEBPAGE
-    web_clickable = driver.find_elements(By.CLASS_NAME, "cell-off")
-    if len(clickable) != len(web_clickable):
-        raise Exception(
-            f"expect clickable cells not same len.{len(clickable)=}=={len(web_clickable)=}"
+    ## OPEN THE WEB BROWSER, A WARM SESSION WHEN THE POOL HAS ONE
+    pool = pool or session.default_pool()
+    with pool.session() as driver:
+        driver.get(constants.BASE_URL + DIFFICULTY + "/")
+        driver.find_element(By.ID, "SideClose").click()
+
+        if USE_PAGE_SOURCE:
+            ## LOAD THE HTML INTO 2D ARRAY
+            page_source = driver.page_source
+            array_board = parser.parse_page_into_array(page_source, constants.GAME_ID)
+            board = solver.Board(array_board)
+            order = parser.parse_page_order(page_source, constants.GAME_ID)
+        else:
+            ## READ THE GRID WITH ONE SCRIPT CALL
+            grid = dom.extract_grid(driver)
+            array_board = grid.to_array()
+            board = solver.Board.from_clues(grid.rows, grid.columns, grid.clues)
+            order = grid.order
+
+        ## SOLVE THE BOARD WITH DISPLAY, UNLESS IT WAS SOLVED BEFORE
+        key = cache.solve_key(
+            array_board, (spec.name for spec in logical_strategy), True
+        )
+        with cache.SolveCache() if USE_CACHE else nullcontext() as solve_cache:
+            cached = solve_cache.get(key) if solve_cache is not None else None
+            if cached:
+                cached.apply(board)
+                console.print(f"solution read from the cache ({cached.stats})")
+            else:
+                if USE_PARALLEL:
+                    parallel.solve_parallel(board, logical_strategy)
+                stats = solve(
+                    board,
+                    logical_strategy,
+                    show_display=SHOW_DISPLAY,
+                    batched=USE_BATCHED,
+                )
+                if solve_cache is not None:
+                    solve_cache.store(
+                        key,
+                        board,
+                        {
+                            "invocations": stats.invocations,
+                            "deductions": stats.deductions,
+                        },
+                    )
+
+        ## PLAN THE CLICKS ON THE FLAGGED CELLS
+        plan = planner.plan_clicks(board, order)
+
+        ## UPDATE THE WEBPAGE
+        if USE_ACTIONS:
+            elements = dom.find_cell_elements(driver)
+            report = submit.submit_flags_by_actions(
+                driver, [elements[p] for p in plan.positions()]
+            )
+        else:
+            report = submit.submit_flags(
+                driver, plan.positions(), lambda: dom.find_cell_elements(driver)
+            )
+
+        console.print(
+            f"{report.flags} flags submitted in {report.seconds:.3f}s with "
+            f"{report.round_trips} driver round-trips ({report.backend})"
         )
-
-    vh = driver.get_window_size()["height"] - 100
-    for p, c in zip(web_clickable, clickable):
-        if c in flags:
-            scroll_position = driver.execute_script("return window.pageYOffset;")
-            scroll_y = max((p.location["y"] - (vh + scroll_position)), 0)
-            if scroll_y:
-                scroll_action = ActionChains(driver, duration=100)
-                scroll_action.scroll_by_amount(delta_x=0, delta_y=scroll_y).perform()
-                time.sleep(SCROLL_WAIT_TIME / 1000)
-
-            actions = ActionChains(driver, duration=WEBPAGE_CLICK_SPEED)
-            actions.context_click(p).perform()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,11 @@
+"""Entry for solving a directory of saved puzzles without display.
+
+Usage: `uv run python src/solve_batch.py DIRECTORY [-o records.jsonl] [-j WORKERS]`
+"""
+
+import sys
+
+from daily_minesweeper import batch
+
+if __name__ == "__main__":
+    sys.exit(batch.main(sys.argv))
@@ -0,0 +1,125 @@
+"""Unit test for archive module."""
+
+from array import array
+
+import pytest
+
+from daily_minesweeper import archive, generator, parser, solver
+
+
+@pytest.fixture
+def puzzles():
+    """Generated puzzles, with odd sizes so the planes end mid byte."""
+    return [
+        generator.generate_puzzle(rows, columns, seed=seed)
+        for seed, (rows, columns) in enumerate([(5, 5), (7, 9), (1, 3), (20, 30)])
+    ]
+
+
+@pytest.fixture
+def archive_path(tmp_path, puzzles):
+    """Archive of the puzzles, the second one without solution."""
+    path = tmp_path / f"corpus{archive.SUFFIX}"
+    entries = [
+        archive.ArchiveEntry(p.clues, None if i == 1 else p.mines, {"seed": i})
+        for i, p in enumerate(puzzles)
+    ]
+    assert archive.write_archive(path, entries) == len(puzzles)
+    return path
+
+
+def test_round_trip(archive_path, puzzles):
+    """Test clues, mines and metadata are read back."""
+    with archive.PuzzleArchive(archive_path) as corpus:
+        assert len(corpus) == len(puzzles)
+        for i, (view, puzzle) in enumerate(zip(corpus, puzzles, strict=True)):
+            assert (view.rows, view.columns) == (puzzle.rows, puzzle.columns)
+            assert view.to_array() == puzzle.clues
+            assert view.metadata == {"seed": i}
+            assert view.mines() == (None if i == 1 else puzzle.mines)
+        assert corpus[2].to_array() == puzzles[2].clues
+
+
+def test_board_matches_parsed_board(archive_path, puzzles):
+    """Test boards decoded from the archive match boards built from the clues."""
+    with archive.PuzzleArchive(archive_path) as corpus:
+        boards = [view.board() for view in corpus]
+
+    for board, puzzle in zip(boards, puzzles, strict=True):
+        expected = solver.Board(puzzle.clues, storage=solver.STORAGE_COMPACT)
+        assert board.snapshot() == expected.snapshot()
+        assert list(board._values) == list(expected._values)
+
+
+def test_board_knows_mine_count(archive_path, puzzles):
+    """Test boards of puzzles with a solution know their total mine count."""
+    with archive.PuzzleArchive(archive_path) as corpus:
+        counts = [view.board().total_mines for view in corpus]
+        assert corpus[0].board(total_mines=3).total_mines == 3
+    assert counts[1] is None
+    assert counts[3] == len(puzzles[3].mines)
+
+
+def test_planes_are_compact(archive_path, puzzles):
+    """Test the clue plane takes 4 bits and the solution plane 2 bits per cell."""
+    with archive.PuzzleArchive(archive_path) as corpus:
+        view = corpus[3]
+        assert len(view.clue_plane) == 20 * 30 // 2
+        assert len(view.solution_plane) == 20 * 30 // 4
+        assert corpus[1].solution_plane is None
+
+
+def test_close_releases_views(archive_path):
+    """Test the file is unmapped while views are referenced, they are released."""
+    corpus = archive.PuzzleArchive(archive_path)
+    view = corpus[0]
+    views = list(corpus)
+    corpus.close()
+    with pytest.raises(ValueError):
+        view.to_array()
+    with pytest.raises(ValueError):
+        views[-1].mines()
+
+    corpus = archive.PuzzleArchive(archive_path)
+    plane = corpus[0].clue_plane[1:]
+    with pytest.raises(BufferError):
+        corpus.close()
+    plane.release()
+    corpus.close()
+
+
+def test_not_an_archive(tmp_path):
+    """Test a file without the magic raises."""
+    path = tmp_path / "page.html"
+    path.write_text(parser.format_array_as_html([["1", ""]]), encoding="utf-8")
+    with pytest.raises(Exception):
+        archive.PuzzleArchive(path)
+
+
+def test_board_from_values():
+    """Test the board built from flat values, and invalid values."""
+    board = solver.Board.from_values(2, 2, array("b", [1, -1, -1, 2]))
+    assert (
+        board.snapshot() == solver.Board([["1", ""], ["", "2"]], "compact").snapshot()
+    )
+
+    with pytest.raises(Exception):
+        solver.Board.from_values(2, 2, array("b", [1, -1, -1]))
+    with pytest.raises(Exception):
+        solver.Board.from_values(1, 2, array("b", [9, -1]))
+
+
+def test_main_pack_and_info(tmp_path, puzzles):
+    """Test saved html and grid files are packed from the command line."""
+    for i, puzzle in enumerate(puzzles[:2]):
+        page = tmp_path / f"{i}.html"
+        page.write_text(parser.format_array_as_html(puzzle.clues), encoding="utf-8")
+    grid = tmp_path / "2.grid"
+    grid.write_text(parser.format_array_as_grid(puzzles[2].clues), encoding="utf-8")
+
+    output = str(tmp_path / f"saved{archive.SUFFIX}")
+    assert archive.main(["archive", "pack", output, str(tmp_path)]) == 0
+    assert archive.main(["archive", "info", output]) == 0
+    with archive.PuzzleArchive(output) as corpus:
+        assert [view.to_array() for view in corpus] == [p.clues for p in puzzles[:3]]
+        assert corpus[2].metadata == {"name": "2.grid"}
@@ -0,0 +1,129 @@
+"""Unit test for batch module."""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from daily_minesweeper import batch, cache, generator, parser, solver
+
+DATA_FOLDER = "./src/tests/data"
+
+
+@pytest.fixture
+def puzzle_folder(tmp_path):
+    """Folder with the saved html games and generated grid puzzles."""
+    for path in Path(DATA_FOLDER).glob("*.html"):
+        shutil.copy(path, tmp_path)
+    for seed in range(4):
+        puzzle = generator.generate_solvable_puzzle(12, 15, seed=seed)
+        grid = parser.format_array_as_grid(puzzle.clues)
+        (tmp_path / f"generated-{seed}.grid").write_text(grid, encoding="utf-8")
+    (tmp_path / "notes.md").write_text("not a puzzle", encoding="utf-8")
+    return tmp_path
+
+
+def test_find_puzzles(puzzle_folder):
+    """Test only html and grid files are picked, sorted by name."""
+    names = [path.name for path in batch.find_puzzles(puzzle_folder)]
+    assert names == [
+        "generated-0.grid",
+        "generated-1.grid",
+        "generated-2.grid",
+        "generated-3.grid",
+        "minesweeper-5x5-easy.html",
+        "minesweeper-5x5-hard.html",
+    ]
+
+
+def test_solve_file(puzzle_folder):
+    """Test a saved html game is fully solved."""
+    record = batch.solve_file(puzzle_folder / "minesweeper-5x5-hard.html")
+    assert (record["rows"], record["columns"]) == (5, 5)
+    assert record["solved_fraction"] == 1.0
+    assert record["solved"] == record["cells"]
+    assert "flag_all_numbers" in record["strategies"]
+
+
+def test_solve_file_error(tmp_path):
+    """Test a bad file is recorded with its error instead of raising."""
+    path = tmp_path / "broken.grid"
+    path.write_text("12.\n1.\n", encoding="utf-8")
+    record = batch.solve_file(path)
+    assert record["file"] == str(path)
+    assert "error" in record
+
+
+def test_run_batch_matches_single_process(puzzle_folder):
+    """Test the process pool gives the records of solving one file at a time."""
+    paths = batch.find_puzzles(puzzle_folder)
+    records = list(batch.run_batch(paths, workers=2))
+
+    assert [r["file"] for r in records] == [str(p) for p in paths]
+    assert all(r["solved_fraction"] == 1.0 for r in records)
+    for record, path in zip(records, paths):
+        single = batch.solve_file(path)
+        assert record["deductions"] == single["deductions"]
+
+
+def test_main_writes_jsonl(puzzle_folder, tmp_path):
+    """Test one JSON line is written per puzzle."""
+    output = tmp_path / "records.jsonl"
+    args = ["batch", str(puzzle_folder), "-o", str(output), "-j", "2"]
+    code = batch.main([*args, "--cache", str(tmp_path / "cache.sqlite")])
+    assert code == 0
+
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 6
+    assert {json.loads(line)["rows"] for line in lines} == {5, 12}
+
+
+def test_replay_from_cache(puzzle_folder, tmp_path):
+    """Test a second run gives back the records of solved puzzles, marked cached."""
+    cache_path = tmp_path / "cache.sqlite"
+    paths = batch.find_puzzles(puzzle_folder)
+    first = list(batch.run_batch(paths, workers=2, cache_path=cache_path))
+    second = list(batch.run_batch(paths, workers=2, cache_path=cache_path))
+
+    for before, after in zip(first, second, strict=True):
+        assert after["cached"] == (before["solved_fraction"] == 1.0)
+        assert set(after) == set(before)
+        if after["cached"]:
+            assert after == {**before, "cached": True}
+
+
+def test_cache_shared_with_main(puzzle_folder, tmp_path):
+    """Test a puzzle stored by `main` is read back with the same record fields."""
+    cache_path = tmp_path / "cache.sqlite"
+    path = batch.find_puzzles(puzzle_folder)[0]
+    array = batch.load_puzzle(path)
+    board = solver.Board(array)
+    batch.solve_headless(board, batch.BATCH_STRATEGIES)
+    key = cache.solve_key(
+        array, (spec.name for spec in batch.BATCH_STRATEGIES), sat_fallback=True
+    )
+    with cache.SolveCache(cache_path) as solve_cache:
+        assert solve_cache.store(key, board, {"invocations": 7, "deductions": 3})
+
+    fresh = batch.solve_file(path)
+    record = batch.solve_file(path, cache_path=cache_path)
+    assert set(record) == set(fresh)
+    assert record["cached"] and record["invocations"] == 7
+    assert record["time_ms"] is None
+    assert (record["cells"], record["solved"]) == (fresh["cells"], fresh["solved"])
+
+
+def test_cache_keyed_by_settings(puzzle_folder, tmp_path):
+    """Test other strategies or SAT setting do not read the cached puzzles."""
+    cache_path = tmp_path / "cache.sqlite"
+    paths = batch.find_puzzles(puzzle_folder)
+    list(batch.run_batch(paths, workers=1, cache_path=cache_path))
+
+    for options in (
+        {"sat_fallback": False},
+        {"strategies": ["flag_all_numbers", "subset_reasoning"]},
+    ):
+        records = batch.run_batch(paths, workers=1, cache_path=cache_path, **options)
+        assert not any(record.get("cached") for record in records)
+    assert not any(record.get("cached") for record in batch.run_batch(paths, workers=1))
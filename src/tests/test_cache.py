@@ -0,0 +1,78 @@
+"""Unit test for cache module."""
+
+import pytest
+
+from daily_minesweeper import cache, generator, parser, scheduler, solver
+from daily_minesweeper.data_model import CellState
+
+
+@pytest.fixture
+def solve_cache(tmp_path):
+    """Empty cache in a temporary file."""
+    with cache.SolveCache(tmp_path / "cache.sqlite", max_entries=3) as solve_cache:
+        yield solve_cache
+
+
+def solved(seed: int) -> tuple[list[list[str]], solver.Board]:
+    """Generated puzzle and its solved board."""
+    puzzle = generator.generate_solvable_puzzle(8, 9, seed=seed)
+    board = solver.Board(puzzle.clues)
+    scheduler.solve(board, generator.CHECK_STRATEGIES)
+    return puzzle.clues, board
+
+
+def test_fingerprint_same_for_every_format():
+    """Test the html, grid and array of a puzzle give the same key."""
+    array, _ = solved(1)
+    html = parser.format_array_as_html(array)
+    grid = parser.format_array_as_grid(array)
+    keys = {
+        cache.fingerprint(array),
+        cache.fingerprint(parser.parse_page_into_array(html)),
+        cache.fingerprint(parser.parse_grid_into_array(grid)),
+    }
+    assert len(keys) == 1
+    assert cache.fingerprint(solved(2)[0]) not in keys
+
+
+def test_cached_flags_applied(solve_cache):
+    """Test the flags read back give the same board as the solve."""
+    array, board = solved(1)
+    key = cache.fingerprint(array)
+    assert solve_cache.get(key) is None
+    assert solve_cache.store(key, board, {"deductions": 3})
+
+    cached = solve_cache.get(key)
+    assert cached.stats == {"deductions": 3}
+    fresh = solver.Board(array)
+    cached.apply(fresh)
+    assert fresh.get_all_cells_by_state(CellState.flag) == (
+        board.get_all_cells_by_state(CellState.flag)
+    )
+    assert (solve_cache.hits, solve_cache.misses) == (1, 1)
+
+    with pytest.raises(Exception):
+        cached.apply(solver.Board([["1", ""]]))
+
+
+def test_unsolved_board_not_stored(solve_cache):
+    """Test a board with unmarked cells is not cached."""
+    array, _ = solved(1)
+    assert not solve_cache.store(cache.fingerprint(array), solver.Board(array), {})
+    assert len(solve_cache) == 0
+
+
+def test_least_recently_used_evicted(solve_cache):
+    """Test the least recently used puzzle is evicted beyond the limit."""
+    keys = []
+    for seed in range(4):
+        array, board = solved(seed)
+        keys.append(cache.fingerprint(array))
+        solve_cache.store(keys[-1], board, {})
+        if seed == 2:
+            # the oldest one is used again, the second oldest is evicted next.
+            assert solve_cache.get(keys[0]) is not None
+
+    assert len(solve_cache) == 3
+    assert solve_cache.get(keys[1]) is None
+    assert all(solve_cache.get(key) for key in (keys[0], keys[2], keys[3]))
@@ -0,0 +1,78 @@
+"""Unit test for display module."""
+
+import io
+import time
+
+import pytest
+from rich.console import Console
+
+from daily_minesweeper import data_model, display, generator, scheduler, solver
+
+STRATEGIES = [
+    solver.flag_all_numbers,
+    solver.flag_remaining_unmarked,
+    solver.deduce_from_neighbors_and_flag,
+    solver.suspect_adjacent_candidates_and_mark_neighbor_empty,
+]
+
+
+def render(table: object) -> str:
+    """Render a rich object into plain text."""
+    console = Console(file=io.StringIO(), width=200)
+    console.print(table)
+    return console.file.getvalue()
+
+
+def test_renderer_throttles_frames():
+    """Test frames are drawn at most `fps` times a second, plus first and last."""
+    puzzle = generator.generate_puzzle(30, 30, clue_density=0.5, seed=30)
+    board = solver.Board(puzzle.clues)
+    console = Console(file=io.StringIO(), width=200)
+
+    start = time.perf_counter()
+    with display.BoardRenderer(board, console, fps=10) as renderer:
+        stats = scheduler.solve(board, STRATEGIES, on_update=renderer.publish)
+    elapsed = time.perf_counter() - start
+
+    assert stats.deductions > renderer.frames
+    assert renderer.frames <= elapsed * 10 + 2
+    # the last frame shows the solved board.
+    assert renderer._drawn == renderer._version
+
+
+def test_board_view_matches_draw_board():
+    """Test the kept rows look like the full table, after partial updates."""
+    puzzle = generator.generate_puzzle(12, 9, clue_density=0.5, seed=12)
+    board = solver.Board(puzzle.clues)
+    board.drain_dirty_rows()
+    view = display.BoardView(board)
+    assert render(view) == render(display.draw_board(board))
+
+    scheduler.solve(board, STRATEGIES)
+    dirty = board.drain_dirty_rows()
+    assert 0 < len(dirty) <= board.rows
+    view.update(dirty)
+    assert render(view) == render(display.draw_board(board))
+
+
+def test_board_view_renders_dirty_rows_only():
+    """Test only the rows with a changed cell are rendered again."""
+    board = solver.Board([["1", "", ""], ["", "", ""], ["", "", "1"]])
+    board.drain_dirty_rows()
+    view = display.BoardView(board)
+    assert view.rows_rendered == 3
+
+    board.set_state(1, 0, data_model.CellState.flag)
+    board.set_state(1, 2, data_model.CellState.empty)
+    assert board.drain_dirty_rows() == [1]
+    assert board.drain_dirty_rows() == []
+
+    view.update([1])
+    assert view.rows_rendered == 4
+
+
+def test_format_cell_unknown_state():
+    """Test a state without markup raises."""
+    assert display.format_cell(data_model.CellState.flag, 0) == "[red]⬤[/red]"
+    with pytest.raises(Exception):
+        display.format_cell("x", 0)
@@ -0,0 +1,90 @@
+"""Unit test for dom module."""
+
+from pathlib import Path
+
+import pytest
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from daily_minesweeper import dom, parser, solver
+
+HARD_5_MAP = "./src/tests/data/minesweeper-5x5-hard.html"
+
+
+class FakeDriver:
+    """Driver returning a fixed script result, recording the calls."""
+
+    def __init__(self, result):
+        """Return `result` from every script call."""
+        self.result = result
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        """Record the call and return the fixed result."""
+        self.calls.append((script, args))
+        return self.result
+
+
+@pytest.fixture
+def payload():
+    """Script result for a 2x3 grid, with the cells in reverse document order."""
+    return {"rows": 2, "cols": 3, "clues": "1..2.3", "order": [5, 4, 3, 2, 1, 0]}
+
+
+def test_extract_grid(payload):
+    """Test the payload is read with one script call and converted."""
+    driver = FakeDriver(payload)
+    grid = dom.extract_grid(driver)
+
+    assert len(driver.calls) == 1
+    assert driver.calls[0][1] == ("game", ".")
+    assert grid.to_array() == [["1", "", ""], ["2", "", "3"]]
+    assert grid.element_positions()[0] == 5
+
+
+def test_extract_grid_invalid(payload):
+    """Test a missing game or missing cells raise."""
+    with pytest.raises(Exception):
+        dom.extract_grid(FakeDriver(None))
+
+    payload["order"] = payload["order"][:-1]
+    with pytest.raises(Exception):
+        dom.extract_grid(FakeDriver(payload))
+
+
+def test_board_from_clues(payload):
+    """Test the board built from the clue string matches the one from the array."""
+    grid = dom.GridPayload.from_script(payload)
+    board = solver.Board.from_clues(grid.rows, grid.columns, grid.clues)
+    expected = solver.Board(grid.to_array())
+    assert [(c.state, c.value) for c in board._cells] == [
+        (c.state, c.value) for c in expected._cells
+    ]
+
+    with pytest.raises(Exception):
+        solver.Board.from_clues(2, 2, "1..")
+
+
+@pytest.fixture
+def browser():
+    """Headless Firefox, skipped when no browser or driver is installed."""
+    options = webdriver.FirefoxOptions()
+    options.add_argument("-headless")
+    try:
+        driver = webdriver.Firefox(options=options)
+    except WebDriverException as e:
+        pytest.skip(f"firefox not available: {e.msg}")
+    yield driver
+    driver.quit()
+
+
+def test_extract_grid_from_page(browser, tmp_path):
+    """Test the script on a local stand-in page gives the parsed grid."""
+    html = Path(HARD_5_MAP).read_text(encoding="utf-8")
+    page = tmp_path / "page.html"
+    page.write_text(f"<html><body>{html}</body></html>", encoding="utf-8")
+    browser.get(page.as_uri())
+
+    grid = dom.extract_grid(browser)
+    assert grid.to_array() == parser.parse_html_into_array(html)
+    assert len(dom.find_cell_elements(browser)) == grid.rows * grid.columns
@@ -0,0 +1,169 @@
+"""Unit test for frontier module."""
+
+import pytest
+
+from daily_minesweeper import data_model, frontier, generator, scheduler, solver
+
+PATTERN_STRATEGIES = [
+    solver.flag_all_numbers,
+    solver.flag_remaining_unmarked,
+    solver.deduce_from_neighbors_and_flag,
+    solver.suspect_adjacent_candidates_and_mark_neighbor_empty,
+]
+
+
+def test_solve_component_forced_values():
+    """Test variables are only forced when every assignment agrees."""
+    # x0 + x1 = 1, x1 = 1
+    assert frontier.solve_component((2, ((1, (0, 1)), (1, (1,))))) == (0, 1)
+
+    # x0 + x1 = 1, x1 + x2 = 1, nothing forced
+    assert frontier.solve_component((3, ((1, (0, 1)), (1, (1, 2))))) == (
+        None,
+        None,
+        None,
+    )
+
+    # x0 + x1 + x2 = 2, x0 + x1 = 1, x2 = 1
+    assert frontier.solve_component((3, ((2, (0, 1, 2)), (1, (0, 1))))) == (
+        None,
+        None,
+        1,
+    )
+
+
+def test_solve_component_inconsistent():
+    """Test constraints without any assignment raise."""
+    with pytest.raises(frontier.InconsistentComponentError):
+        frontier.solve_component((2, ((2, (0, 1)), (0, (1,)))))
+
+
+def test_solve_component_by_count():
+    """Test infeasible counts are left out, other errors are raised."""
+    # one mine in two cells.
+    result = frontier.solve_component_by_count((2, ((1, (0, 1)),)))
+    assert set(result) == {1}
+    assert result[1] == (None, None)
+
+    with pytest.raises(IndexError):
+        # a constraint on a variable out of the component.
+        frontier.solve_component_by_count((1, ((1, (0, 5)),)))
+
+
+def test_collect_component_bounded():
+    """Test the component stops growing at the variable bound."""
+    sample_board = [
+        ["", "", "", "", "", ""],
+        ["", "1", "", "1", "", ""],
+        ["", "", "", "", "", ""],
+        ["", "", "", "", "1", ""],
+    ]
+    board = solver.Board(sample_board)
+
+    component = frontier.collect_component(board, 1, 1)
+    assert len(component.constraints) == 3
+    assert len(component.variables) == 16
+
+    component = frontier.collect_component(board, 1, 1, max_variables=8)
+    assert len(component.constraints) == 1
+    assert component.signature == (8, ((1, (0, 1, 2, 3, 4, 5, 6, 7)),))
+
+
+def test_find_components_independent():
+    """Test numbers far apart end up in different components."""
+    sample_board = [
+        ["1", "", "", "", "", "1"],
+        ["", "", "", "", "", ""],
+    ]
+    board = solver.Board(sample_board)
+
+    components = frontier.find_components(board)
+    assert [c.variables for c in components] == [
+        [(0, 1), (1, 0), (1, 1)],
+        [(0, 4), (1, 4), (1, 5)],
+    ]
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_solve_frontier_beyond_patterns(seed):
+    """Test the exact solver marks more cells than the pattern strategies, all correct."""
+    puzzle = generator.generate_puzzle(30, 30, clue_density=0.4, seed=seed)
+    patterns = solver.Board(puzzle.clues)
+    exact = solver.Board(puzzle.clues)
+
+    pattern_stats = scheduler.solve(patterns, PATTERN_STRATEGIES)
+    exact_stats = scheduler.solve(exact, PATTERN_STRATEGIES + [frontier.solve_frontier])
+
+    assert exact_stats.cells_changed > pattern_stats.cells_changed
+    for r, c in exact.get_all_cells_by_state(data_model.CellState.flag):
+        assert (r, c) in puzzle.mines
+    for r, c in exact.get_all_cells_by_state(data_model.CellState.empty):
+        assert (r, c) not in puzzle.mines
+
+
+def test_solve_mine_count_without_total():
+    """Test nothing is marked when the board does not know its mine count."""
+    board = solver.Board([["1", "", ""], ["", "", ""]])
+    assert not frontier.solve_mine_count(board)
+
+
+def test_solve_mine_count_interior():
+    """Test interior cells are settled in bulk once the frontier holds every mine."""
+    sample_board = [
+        ["1", "", "", "", ""],
+        ["", "", "", "", ""],
+        ["", "", "", "", ""],
+    ]
+    board = solver.Board(sample_board, total_mines=1)
+    assert frontier.solve_mine_count(board)
+
+    assert board.get_all_cells_by_state(data_model.CellState.unmarked) == [
+        (0, 1),
+        (1, 0),
+        (1, 1),
+    ]
+    assert len(board.get_all_cells_by_state(data_model.CellState.empty)) == 11
+
+    board = solver.Board(sample_board, total_mines=12)
+    assert frontier.solve_mine_count(board)
+    assert len(board.get_all_cells_by_state(data_model.CellState.flag)) == 11
+
+
+def test_solve_mine_count_frontier():
+    """Test frontier cells forced by the mines left once the interior is gone."""
+    # either one mine in the middle or one on each end.
+    sample_board = [["", "1", "", "1", ""]]
+    board = solver.Board(sample_board, total_mines=1)
+    assert frontier.solve_mine_count(board)
+    assert board.get_all_cells_by_state(data_model.CellState.flag) == [(0, 2)]
+    assert board.get_all_cells_by_state(data_model.CellState.empty) == [(0, 0), (0, 4)]
+
+    board = solver.Board(sample_board, total_mines=2)
+    assert frontier.solve_mine_count(board)
+    assert board.get_all_cells_by_state(data_model.CellState.flag) == [(0, 0), (0, 4)]
+
+
+def test_solve_mine_count_inconsistent():
+    """Test a mine count no split can reach raises."""
+    board = solver.Board([["1", "", ""]], total_mines=3)
+    with pytest.raises(Exception):
+        frontier.solve_mine_count(board)
+
+
+@pytest.mark.parametrize("seed", [4, 5, 8])
+def test_solve_mine_count_after_strategies(seed):
+    """Test the mine count marks more cells on a stalled board, all correct."""
+    puzzle = generator.generate_puzzle(8, 8, clue_density=0.4, seed=seed)
+    board = solver.Board(puzzle.clues, total_mines=len(puzzle.mines))
+    strategies = PATTERN_STRATEGIES + [frontier.solve_frontier]
+
+    scheduler.solve(board, strategies)
+    assert frontier.solve_mine_count(board)
+    scheduler.solve(board, strategies)
+    while frontier.solve_mine_count(board):
+        scheduler.solve(board, strategies)
+
+    for r, c in board.get_all_cells_by_state(data_model.CellState.flag):
+        assert (r, c) in puzzle.mines
+    for r, c in board.get_all_cells_by_state(data_model.CellState.empty):
+        assert (r, c) not in puzzle.mines
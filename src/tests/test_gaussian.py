@@ -0,0 +1,78 @@
+"""Unit test for gaussian module."""
+
+import pytest
+
+from daily_minesweeper import data_model, gaussian, generator, solver
+
+
+def test_row_reduce_difference():
+    """Test eliminating a subset row leaves the difference."""
+    # x0 + x1 + x2 = 2, x0 + x1 = 1
+    rows = [({0: 1, 1: 1, 2: 1}, 2), ({0: 1, 1: 1}, 1)]
+
+    reduced = gaussian.row_reduce(rows)
+
+    assert reduced == [({0: 1, 1: 1}, 1), ({2: 1}, 1)]
+
+
+def test_row_reduce_inconsistent():
+    """Test contradicting rows raise."""
+    with pytest.raises(Exception):
+        gaussian.row_reduce([({0: 1, 1: 1}, 2), ({0: 1, 1: 1}, 1)])
+
+
+def test_deduce_from_bounds():
+    """Test bounds reasoning on rows with negative coefficients."""
+    # x0 - x1 = 1, only x0 = 1 and x1 = 0
+    assert gaussian.deduce_from_bounds({0: 1, 1: -1}, 1) == {0: 1, 1: 0}
+
+    # x0 + x1 - x2 = 0, nothing fixed
+    assert gaussian.deduce_from_bounds({0: 1, 1: 1, 2: -1}, 0) == {}
+
+    # 2 x0 + x1 + x2 = 3, x0 must be a mine
+    assert gaussian.deduce_from_bounds({0: 2, 1: 1, 2: 1}, 3) == {0: 1}
+
+
+def test_eliminate_board_1_2_1():
+    """Test the 1 - 2 - 1 pattern against a wall."""
+    sample_board = [
+        ["", "", ""],
+        ["1", "2", "1"],
+    ]
+    board = solver.Board(sample_board)
+
+    assert gaussian.eliminate_board(board)
+
+    assert board[0][0].state == data_model.CellState.flag
+    assert board[0][1].state == data_model.CellState.empty
+    assert board[0][2].state == data_model.CellState.flag
+    assert not gaussian.eliminate_board(board)
+
+
+@pytest.mark.parametrize("seed", [3, 4])
+def test_eliminate_board_is_sound(seed):
+    """Test elimination passes only mark cells consistent with the hidden mines."""
+    puzzle = generator.generate_puzzle(25, 25, clue_density=0.5, seed=seed)
+    board = solver.Board(puzzle.clues)
+
+    while gaussian.eliminate_board(board):
+        pass
+
+    flags = board.get_all_cells_by_state(data_model.CellState.flag)
+    assert flags
+    assert all(cell in puzzle.mines for cell in flags)
+    for cell in board.get_all_cells_by_state(data_model.CellState.empty):
+        assert cell not in puzzle.mines
+
+
+def test_gaussian_elimination_strategy():
+    """Test the strategy form works on the component around a number."""
+    sample_board = [
+        ["", "", ""],
+        ["1", "2", "1"],
+    ]
+    board = solver.Board(sample_board)
+
+    assert gaussian.gaussian_elimination(1, 1, board)
+    assert not gaussian.gaussian_elimination(0, 1, board)
+    assert board.get_all_cells_by_state(data_model.CellState.flag) == [(0, 0), (0, 2)]
@@ -0,0 +1,40 @@
+"""Unit test for generator module."""
+
+import pytest
+
+from daily_minesweeper import data_model, generator, scheduler, solver
+
+
+def test_generate_puzzle_clues_match_mines():
+    """Test every revealed number counts the mines around it."""
+    puzzle = generator.generate_puzzle(10, 12, seed=3)
+    assert (puzzle.rows, puzzle.columns) == (10, 12)
+
+    for r in range(puzzle.rows):
+        for c in range(puzzle.columns):
+            if puzzle.clues[r][c] == "":
+                continue
+            assert (r, c) not in puzzle.mines
+            assert int(puzzle.clues[r][c]) == generator.count_adjacent_mines(
+                puzzle.mines, r, c
+            )
+
+
+@pytest.mark.parametrize("size", [5, 20, 40])
+def test_generate_solvable_puzzle(size):
+    """Test the generated puzzle is solved by deduction only, into its mines."""
+    puzzle = generator.generate_solvable_puzzle(size, size, seed=size)
+    board = solver.Board(puzzle.clues)
+    scheduler.solve(board, generator.CHECK_STRATEGIES)
+
+    assert not board.get_all_cells_by_state(data_model.CellState.unmarked)
+    assert set(board.get_all_cells_by_state(data_model.CellState.flag)) == (
+        puzzle.mines
+    )
+
+
+def test_generate_solvable_puzzle_reproducible():
+    """Test the same seed gives the same puzzle."""
+    first = generator.generate_solvable_puzzle(15, 15, seed=1)
+    second = generator.generate_solvable_puzzle(15, 15, seed=1)
+    assert first == second
@@ -0,0 +1,74 @@
+"""Unit test for parallel module."""
+
+from array import array
+
+import pytest
+
+from daily_minesweeper import frontier, generator, parallel, scheduler, solver
+from daily_minesweeper.data_model import CellState
+
+STRATEGIES = [*generator.CHECK_STRATEGIES, frontier.solve_frontier]
+
+
+@pytest.mark.parametrize(
+    ("rows", "columns", "tile_size"), [(40, 50, 16), (33, 20, 10), (12, 12, 64)]
+)
+def test_same_result_as_single_core(rows, columns, tile_size):
+    """Test solving by tiles gives the board solved on one core."""
+    puzzle = generator.generate_puzzle(rows, columns, clue_density=0.5, seed=rows)
+    expected = solver.Board(puzzle.clues)
+    scheduler.solve(expected, STRATEGIES)
+
+    board = solver.Board(puzzle.clues)
+    stats = parallel.solve_parallel(board, STRATEGIES, workers=2, tile_size=tile_size)
+
+    assert board.snapshot() == expected.snapshot()
+    assert stats.tiles_solved >= len(parallel.make_tiles(rows, columns, tile_size))
+
+
+def test_tiles_find_every_deduction():
+    """Test a halo of the largest radius leaves nothing to the last pass."""
+    puzzle = generator.generate_puzzle(40, 50, clue_density=0.5, seed=3)
+    expected = solver.Board(puzzle.clues)
+    scheduler.solve(expected, generator.CHECK_STRATEGIES)
+
+    board = solver.Board(puzzle.clues)
+    stats = parallel.solve_parallel(
+        board, generator.CHECK_STRATEGIES, workers=2, tile_size=12
+    )
+
+    assert board.snapshot() == expected.snapshot()
+    assert stats.cells_changed > 0
+    assert stats.final_changes == 0
+
+
+def test_make_tiles():
+    """Test tiles cover the board once, the last ones cut at the edge."""
+    tiles = parallel.make_tiles(5, 7, 3)
+    assert tiles[-1] == parallel.Tile(3, 6, 5, 7)
+    cells = {
+        (r, c)
+        for t in tiles
+        for r in range(t.top, t.bottom)
+        for c in range(t.left, t.right)
+    }
+    assert (
+        len(cells) == sum((t.bottom - t.top) * (t.right - t.left) for t in tiles) == 35
+    )
+
+
+def test_board_from_values_with_states():
+    """Test a board built from values and states keeps the states, in both storages."""
+    board = solver.Board([["1", "", ""], ["", "", "2"]])
+    board.set_state(0, 1, CellState.flag)
+    values = [cell.value for cell in board._cells]
+    for storage in (solver.STORAGE_CELLS, solver.STORAGE_COMPACT):
+        copy = solver.Board.from_values(
+            2,
+            3,
+            array("b", values),
+            states=bytearray(board.snapshot()),
+            storage=storage,
+        )
+        assert copy.snapshot() == board.snapshot()
+        assert copy.constraint(0, 0) == board.constraint(0, 0)
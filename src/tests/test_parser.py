@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from daily_minesweeper import parser
+from daily_minesweeper import constants, parser
 
 EASY_5_MAP = "./src/tests/data/minesweeper-5x5-easy.html"
 HARD_5_MAP = "./src/tests/data/minesweeper-5x5-hard.html"
@@ -52,3 +52,81 @@ def test_parse_hard_html_into_array(hard_5_html):
         ["", "", "", "", ""],
     ]
     assert result == expected
+
+
+def test_parse_grid_into_array():
+    """Test parsing a text grid, skipping blank lines."""
+    grid = "2...1\n..32.\n\n2.3..\n2.23.\n.....\n"
+    result = parser.parse_grid_into_array(grid)
+    expected = [
+        ["2", "", "", "", "1"],
+        ["", "", "3", "2", ""],
+        ["2", "", "3", "", ""],
+        ["2", "", "2", "3", ""],
+        ["", "", "", "", ""],
+    ]
+    assert result == expected
+    assert parser.format_array_as_grid(result) == grid.replace("\n\n", "\n")
+
+
+def test_parse_grid_uneven_rows():
+    """Test rows of different length raise."""
+    with pytest.raises(Exception):
+        parser.parse_grid_into_array("1..\n1.\n")
+
+
+@pytest.mark.parametrize("html_fixture", ["easy_5_html", "hard_5_html"])
+def test_parse_page_matches_beautifulsoup(html_fixture, request):
+    """Test the regex parser gives the same grid as the BeautifulSoup parser."""
+    html = request.getfixturevalue(html_fixture)
+    assert parser.parse_page_into_array(html) == parser.parse_html_into_array(html)
+
+
+def test_parse_page_full_source_any_order(hard_5_html):
+    """Test cells are found after the game id and placed by their top/left px."""
+    head, _, rest = hard_5_html.partition('<div class="cell ')
+    cells = ['<div class="cell ' + c for c in rest.split('<div class="cell ')]
+    shuffled = head + "".join(reversed(cells))
+    page = (
+        '<html><body><div class="cell other"><div class="number">9</div></div>'
+        + shuffled
+        + "</body></html>"
+    )
+    assert parser.parse_page_into_array(page) == parser.parse_html_into_array(
+        hard_5_html
+    )
+
+
+def test_parse_page_generated_html():
+    """Test html in the markup of the website round trips."""
+    array = [["1", "", "2"], ["", "", ""], ["3", "", ""], ["", "8", ""]]
+    html = parser.format_array_as_html(array)
+    assert parser.parse_page_into_array(html) == array
+    assert parser.parse_html_into_array(html) == array
+
+
+def test_parse_page_order(hard_5_html):
+    """Test the order maps each cell element to its linear index by top/left px."""
+    assert parser.parse_page_order(hard_5_html) == list(range(25))
+
+    head, _, rest = hard_5_html.partition('<div class="cell ')
+    cells = ['<div class="cell ' + c for c in rest.split('<div class="cell ')]
+    reversed_page = head + "".join(reversed(cells))
+    assert parser.parse_page_order(reversed_page) == list(range(24, -1, -1))
+
+
+def test_parse_page_missing_cells():
+    """Test a grid with missing cells raises."""
+    html = parser.format_array_as_html([["1", ""], ["", "2"]])
+    html = html.replace('<div class="cell selectable cell-off"', "<div", 1)
+    with pytest.raises(Exception):
+        parser.parse_page_into_array(html)
+
+
+def test_parse_page_missing_game():
+    """Test a page without the game element raises instead of reading other cells."""
+    html = parser.format_array_as_html([["1", ""], ["", "2"]])
+    html = html.replace(f'id="{constants.GAME_ID}"', 'id="other"')
+    with pytest.raises(Exception, match="expecting an element"):
+        parser.parse_page_into_array(html)
+    assert parser.parse_page_into_array(html, game_id=None) == [["1", ""], ["", "2"]]
@@ -0,0 +1,95 @@
+"""Unit test for pipeline module."""
+
+import asyncio
+import time
+
+import pytest
+
+from daily_minesweeper import generator, parser, pipeline, session
+from daily_minesweeper.data_model import CellState
+
+
+@pytest.fixture
+def puzzle_files(tmp_path):
+    """Generated puzzles saved as html and text grid, with their mines."""
+    mines = {}
+    for seed in range(3):
+        puzzle = generator.generate_solvable_puzzle(10, 12, seed=seed)
+        grid = tmp_path / f"{seed}.grid"
+        grid.write_text(parser.format_array_as_grid(puzzle.clues), encoding="utf-8")
+        page = tmp_path / f"{seed}.html"
+        page.write_text(parser.format_array_as_html(puzzle.clues), encoding="utf-8")
+        mines[str(grid)] = mines[str(page)] = puzzle.mines
+    return mines
+
+
+def test_file_pipeline(puzzle_files):
+    """Test saved puzzles go through every stage, in input order."""
+    names = sorted(puzzle_files)
+    result = asyncio.run(pipeline.run_pipeline(names, pipeline.file_stages()))
+
+    assert [job.name for job in result.jobs] == names
+    for job in result.jobs:
+        assert job.error is None
+        assert not job.board.get_all_cells_by_state(CellState.unmarked)
+        assert {(c.row, c.col) for c in job.plan.clicks} == puzzle_files[job.name]
+        assert list(job.latency) == ["fetch", "parse", "solve", "submit"]
+    assert all(m.count == len(names) for m in result.metrics.values())
+
+
+def test_stages_overlap():
+    """Test consecutive puzzles are in different stages at the same time."""
+
+    def wait(job):
+        time.sleep(0.05)
+
+    stages = [("fetch", wait), ("solve", wait), ("submit", wait)]
+    result = asyncio.run(pipeline.run_pipeline(range(6), stages))
+
+    # one stage at a time takes 6 x 3 x 0.05s, overlapped about (6 + 2) x 0.05s.
+    assert result.sequential_s >= 0.9
+    assert result.elapsed_s < 0.7
+    assert result.metrics["fetch"].mean_s >= 0.05
+
+
+def test_error_skips_later_stages():
+    """Test a failed puzzle keeps its error and the others still finish."""
+    done = []
+
+    def fetch(job):
+        if job.name == "bad":
+            raise ValueError("no such puzzle")
+
+    stages = [("fetch", fetch), ("submit", lambda job: done.append(job.name))]
+    result = asyncio.run(pipeline.run_pipeline(["a", "bad", "b"], stages))
+
+    assert done == ["a", "b"]
+    assert result.jobs[1].error == "fetch: ValueError: no such puzzle"
+    assert result.metrics["submit"].count == 2
+
+
+def test_main_files(puzzle_files, tmp_path):
+    """Test the command line runs the offline stages."""
+    assert pipeline.main(["pipeline", "--files", str(tmp_path)]) == 0
+    with pytest.raises(SystemExit):
+        pipeline.main(["pipeline", "weekly_100"])
+
+
+def test_failed_solve_releases_session():
+    """Test the session of a puzzle failing to solve goes back to the pool."""
+
+    class FakeDriver:
+        def execute_script(self, script, *args):
+            return 1
+
+        def quit(self):
+            pass
+
+    with session.DriverPool(factory=FakeDriver) as pool:
+        stages = pipeline.BrowserStages(pool)
+        job = pipeline.PuzzleJob("easy_5", driver=pool.acquire())
+        with pytest.raises(Exception):
+            stages.solve(job)
+        assert job.driver is None
+        assert pool.acquire() is not None
+        assert (pool.created, pool.reused) == (1, 1)
@@ -0,0 +1,68 @@
+"""Unit test for planner module."""
+
+import pytest
+
+from daily_minesweeper import generator, planner, scheduler, solver
+from daily_minesweeper.data_model import CellState
+
+
+@pytest.fixture
+def solved_board():
+    """Solved 12x9 generated puzzle, with its mines."""
+    puzzle = generator.generate_solvable_puzzle(12, 9, seed=3)
+    board = solver.Board(puzzle.clues)
+    scheduler.solve(board, generator.CHECK_STRATEGIES)
+    return board, puzzle.mines
+
+
+def test_plan_clicks_in_document_order(solved_board):
+    """Test every flag is mapped to its element, sorted by scroll position."""
+    board, mines = solved_board
+    size = board.rows * board.columns
+    order = list(range(size))
+
+    plan = planner.plan_clicks(board, order)
+    assert {(c.row, c.col) for c in plan.clicks} == mines
+    assert [(c.row, c.col) for c in plan.clicks] == sorted(mines)
+    assert plan.positions() == [c.row * board.columns + c.col for c in plan.clicks]
+
+
+def test_plan_clicks_maps_by_position(solved_board):
+    """Test elements are found by their linear index, not their order in the page."""
+    board, mines = solved_board
+    size = board.rows * board.columns
+    order = list(reversed(range(size)))
+
+    plan = planner.plan_clicks(board, order)
+    assert [(c.row, c.col) for c in plan.clicks] == sorted(mines)
+    assert all(order[c.position] == c.row * board.columns + c.col for c in plan.clicks)
+
+
+def test_plan_clicks_invalid_order(solved_board):
+    """Test an order missing or repeating cells raises."""
+    board, _ = solved_board
+    size = board.rows * board.columns
+    with pytest.raises(Exception):
+        planner.plan_clicks(board, list(range(size - 1)))
+    with pytest.raises(Exception):
+        planner.plan_clicks(board, [0] * size)
+
+
+def test_flag_bitmap(solved_board):
+    """Test the bitmap matches the flagged cells."""
+    board, _ = solved_board
+    bitmap = planner.flag_bitmap(board)
+    assert [divmod(i, board.columns) for i, f in enumerate(bitmap) if f] == (
+        board.get_all_cells_by_state(CellState.flag)
+    )
+
+
+def test_plan_round_trip(tmp_path, solved_board):
+    """Test the plan is written and read back as JSON."""
+    board, _ = solved_board
+    plan = planner.plan_clicks(board, list(range(board.rows * board.columns)))
+
+    path = tmp_path / "plan.json"
+    plan.dump(path)
+    assert planner.ClickPlan.load(path) == plan
+    assert planner.ClickPlan.from_dict(plan.to_dict()) == plan
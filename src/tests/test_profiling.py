@@ -0,0 +1,109 @@
+"""Unit test for profiling module."""
+
+import json
+
+import pytest
+
+from daily_minesweeper import generator, profiling, scheduler, solver
+
+STRATEGIES = [
+    solver.flag_all_numbers,
+    solver.flag_remaining_unmarked,
+    solver.deduce_from_neighbors_and_flag,
+    solver.suspect_adjacent_candidates_and_mark_neighbor_empty,
+]
+
+
+@pytest.fixture
+def puzzle():
+    """Synthetic 20x20 puzzle."""
+    return generator.generate_puzzle(20, 20, clue_density=0.5, seed=20)
+
+
+def test_profiled_counters_match_scheduler(puzzle):
+    """Test the profiles add up to the scheduler counters, with the same result."""
+    profiler = profiling.StrategyProfiler(sample_every=1)
+    board = solver.Board(puzzle.clues)
+    stats = scheduler.solve(board, profiler.wrap_all(STRATEGIES))
+
+    reference = solver.Board(puzzle.clues)
+    reference_stats = scheduler.solve(reference, STRATEGIES)
+
+    assert [c.state for c in board._cells] == [c.state for c in reference._cells]
+    assert list(profiler.profiles) == [s.__name__ for s in STRATEGIES]
+
+    profiles = profiler.profiles.values()
+    assert sum(p.invocations for p in profiles) == reference_stats.invocations
+    assert sum(p.deductions for p in profiles) == stats.deductions
+    assert sum(p.cells_changed for p in profiles) == stats.cells_changed
+    # the first call is timed apart.
+    assert all(p.timed_calls == p.invocations - 1 for p in profiles)
+    assert all(p.first_call_ns > 0 for p in profiles)
+
+
+def test_sampled_timing(puzzle):
+    """Test only one call in `sample_every` is timed."""
+    profiler = profiling.StrategyProfiler(sample_every=4)
+    scheduler.solve(solver.Board(puzzle.clues), profiler.wrap_all(STRATEGIES))
+
+    for profile in profiler.profiles.values():
+        assert profile.timed_calls == (profile.invocations - 1) // 4
+        assert profile.time_ns >= profile.timed_ns
+
+
+def test_rare_strategy_is_timed(puzzle):
+    """Test a strategy called fewer times than `sample_every` still gets a time."""
+    profiler = profiling.StrategyProfiler(sample_every=1000)
+    scheduler.solve(solver.Board(puzzle.clues), profiler.wrap_all(STRATEGIES))
+
+    rare = profiler.profiles[STRATEGIES[-1].__name__]
+    assert 0 < rare.invocations < 1000
+    assert rare.timed_calls == 0
+    assert rare.time_ns == rare.first_call_ns * rare.invocations > 0
+
+
+def test_order_by_yield():
+    """Test strategies are reordered by yield, unprofiled ones last."""
+    profiler = profiling.StrategyProfiler()
+    profiler.profiles = {
+        "flag_all_numbers": profiling.StrategyProfile(
+            "flag_all_numbers", 10, 2, 4, 10, 4000
+        ),
+        "flag_remaining_unmarked": profiling.StrategyProfile(
+            "flag_remaining_unmarked", 10, 2, 4, 10, 1000
+        ),
+    }
+    assert profiler.order_by_yield(STRATEGIES) == [
+        solver.flag_remaining_unmarked,
+        solver.flag_all_numbers,
+        solver.deduce_from_neighbors_and_flag,
+        solver.suspect_adjacent_candidates_and_mark_neighbor_empty,
+    ]
+    assert [p.name for p in profiler.ranked()] == [
+        "flag_remaining_unmarked",
+        "flag_all_numbers",
+    ]
+
+
+def test_dump_json(tmp_path, puzzle):
+    """Test the profiles are written as JSON with the derived rates."""
+    profiler = profiling.StrategyProfiler()
+    scheduler.solve(solver.Board(puzzle.clues), profiler.wrap_all(STRATEGIES))
+
+    path = tmp_path / "profile.json"
+    profiler.dump(path)
+    result = json.loads(path.read_text(encoding="utf-8"))
+
+    assert result == json.loads(json.dumps(profiler.to_dict()))
+    assert set(result["flag_all_numbers"]) == {
+        "name",
+        "invocations",
+        "deductions",
+        "cells_changed",
+        "timed_calls",
+        "timed_ns",
+        "first_call_ns",
+        "time_ns",
+        "hit_rate",
+        "cells_per_us",
+    }
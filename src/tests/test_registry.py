@@ -0,0 +1,94 @@
+"""Unit test for registry module."""
+
+import pytest
+
+from daily_minesweeper import (
+    data_model,
+    generator,
+    profiling,
+    registry,
+    scheduler,
+    solver,
+)
+
+PATTERNS = [
+    "suspect_adjacent_candidates_and_mark_neighbor_empty",
+    "deduce_from_neighbors_and_flag",
+    "flag_remaining_unmarked",
+    "flag_all_numbers",
+]
+
+
+def test_select_orders_by_cost():
+    """Test strategies are selected cheapest first, ties keep the given order."""
+    specs = registry.select(PATTERNS)
+    assert [spec.name for spec in specs] == [
+        "flag_remaining_unmarked",
+        "flag_all_numbers",
+        "deduce_from_neighbors_and_flag",
+        "suspect_adjacent_candidates_and_mark_neighbor_empty",
+    ]
+    assert [spec.radius for spec in specs] == [1, 1, 2, 3]
+    assert [spec.name for spec in registry.select()] == list(
+        registry.DEFAULT_STRATEGIES
+    )
+
+
+def test_select_gaussian_elimination():
+    """Test the elimination strategy is selected by name and solves like the others."""
+    specs = registry.select(["gaussian_elimination", "flag_all_numbers"])
+    assert [spec.name for spec in specs] == ["flag_all_numbers", "gaussian_elimination"]
+    assert specs[1].radius == 3
+
+    puzzle = generator.generate_solvable_puzzle(12, 12, seed=1)
+    board = solver.Board(puzzle.clues)
+    scheduler.solve(board, registry.select(["flag_remaining_unmarked"]) + specs)
+    flagged = board.get_all_cells_by_state(data_model.CellState.flag)
+    assert flagged and set(flagged) <= puzzle.mines
+
+
+def test_select_unknown_name():
+    """Test an unregistered name raises."""
+    with pytest.raises(Exception):
+        registry.select(["flag_all_numbers", "guess"])
+
+
+def test_register_twice():
+    """Test a name is registered only once."""
+    with pytest.raises(Exception):
+        registry.register(solver.flag_all_numbers, cost=1, radius=1)
+
+
+def test_parse_sysargv_strategies():
+    """Test the strategies are read from the command line, defaults otherwise."""
+    specs = registry.parse_sysargv_strategies(
+        ["main.py", "easy_5", "--strategies=subset_reasoning,flag_all_numbers"]
+    )
+    assert [spec.name for spec in specs] == ["flag_all_numbers", "subset_reasoning"]
+    assert registry.parse_sysargv_strategies(["main.py"]) == registry.select()
+
+
+def test_radius_skips_calls():
+    """Test declared radii give the same board with fewer strategy calls."""
+    puzzle = generator.generate_puzzle(40, 40, clue_density=0.5, seed=4)
+    specs = registry.select(PATTERNS)
+    board = solver.Board(puzzle.clues)
+    plain_board = solver.Board(puzzle.clues)
+
+    stats = scheduler.solve(board, specs)
+    plain_stats = scheduler.solve(plain_board, [spec.function for spec in specs])
+
+    assert board.snapshot() == plain_board.snapshot()
+    assert stats.invocations < plain_stats.invocations
+
+
+def test_profiler_keeps_spec():
+    """Test a wrapped spec keeps its cost and radius and records its profile."""
+    profiler = profiling.StrategyProfiler()
+    wrapped = profiler.wrap_all(registry.select(["flag_all_numbers"]))
+    assert isinstance(wrapped[0], scheduler.StrategySpec)
+    assert (wrapped[0].cost, wrapped[0].radius) == (1, 1)
+
+    board = solver.Board([["1", ""], ["", ""]])
+    scheduler.solve(board, wrapped)
+    assert profiler.profiles["flag_all_numbers"].invocations == 1
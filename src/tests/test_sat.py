@@ -0,0 +1,81 @@
+"""Unit test for sat module."""
+
+import itertools
+
+import pytest
+
+from daily_minesweeper import data_model, frontier, generator, sat, scheduler, solver
+
+
+def satisfies(bits: tuple[bool, ...], clauses: list[list[int]]) -> bool:
+    """Check an assignment of variables 1..n against clauses."""
+    return all(any(bits[abs(lit) - 1] == (lit > 0) for lit in c) for c in clauses)
+
+
+@pytest.mark.parametrize("n, k", [(3, 0), (3, 1), (4, 2), (5, 5)])
+def test_exactly_encoding(n, k):
+    """Test the binomial encoding accepts exactly the assignments with k true."""
+    clauses = sat.exactly(list(range(1, n + 1)), k)
+
+    for bits in itertools.product([False, True], repeat=n):
+        assert satisfies(bits, clauses) == (sum(bits) == k)
+
+
+def test_cdcl_solver_assumptions():
+    """Test the solver honors assumptions and keeps its clauses between calls."""
+    # (x1 or x2) and (not x1 or x3) and (not x2 or x3)
+    solver_ = sat.CdclSolver(3, [[1, 2], [-1, 3], [-2, 3]])
+
+    model = solver_.solve([])
+    assert model[3]
+    assert solver_.solve([-3]) is None
+    assert solver_.solve([1])[1]
+
+    solver_.add_clause([-1])
+    model = solver_.solve([])
+    assert not model[1]
+    assert model[2]
+
+
+def test_forced_literals():
+    """Test only the literals shared by all models are reported."""
+    # x1 + x2 = 1, x2 + x3 = 1, x3 = 1
+    clauses = sat.exactly([1, 2], 1) + sat.exactly([2, 3], 1) + [[3]]
+    assert sat.forced_literals(sat.CdclSolver(3, clauses), 3) == {
+        1: True,
+        2: False,
+        3: True,
+    }
+
+    clauses = sat.exactly([1, 2], 1)
+    assert sat.forced_literals(sat.CdclSolver(2, clauses), 2) == {}
+
+    with pytest.raises(Exception):
+        sat.forced_literals(sat.CdclSolver(2, sat.exactly([1, 2], 3)), 2)
+
+
+def test_make_backend_unknown():
+    """Test unknown backends are rejected."""
+    with pytest.raises(Exception):
+        sat.make_backend(1, [], backend="z3")
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_solve_board_matches_frontier(seed):
+    """Test the SAT fallback marks the same cells as the exact frontier solver."""
+    puzzle = generator.generate_puzzle(25, 25, clue_density=0.4, seed=seed)
+    strategies = [solver.flag_all_numbers, solver.flag_remaining_unmarked]
+    board = solver.Board(puzzle.clues)
+    exact = solver.Board(puzzle.clues)
+
+    scheduler.solve(board, strategies)
+    while sat.solve_board(board, backend=sat.BACKEND_CDCL):
+        scheduler.solve(board, strategies)
+    scheduler.solve(exact, strategies + [frontier.solve_frontier])
+
+    for state in (data_model.CellState.flag, data_model.CellState.empty):
+        assert board.get_all_cells_by_state(state) == exact.get_all_cells_by_state(
+            state
+        )
+    for cell in board.get_all_cells_by_state(data_model.CellState.flag):
+        assert cell in puzzle.mines
@@ -0,0 +1,147 @@
+"""Unit test for scheduler module."""
+
+import pytest
+
+from daily_minesweeper import data_model, generator, scheduler, solver
+
+STRATEGIES = [
+    solver.flag_all_numbers,
+    solver.flag_remaining_unmarked,
+    solver.deduce_from_neighbors_and_flag,
+    solver.suspect_adjacent_candidates_and_mark_neighbor_empty,
+]
+
+
+@pytest.fixture
+def sample_hard_board():
+    """Sample hard 5x5 board."""
+    return [
+        ["2", "", "", "", "1"],
+        ["", "", "3", "2", ""],
+        ["2", "", "3", "", ""],
+        ["2", "", "2", "3", ""],
+        ["", "", "", "", ""],
+    ]
+
+
+def board_states(board: solver.Board) -> list[list[data_model.CellState]]:
+    """Collect the state of every cell."""
+    return [[cell.state for cell in board[r]] for r in range(board.rows)]
+
+
+def test_set_state_records_changes(sample_hard_board):
+    """Test set_state only records cells that changed."""
+    board = solver.Board(sample_hard_board)
+
+    assert board.set_state(0, 1, data_model.CellState.flag)
+    assert not board.set_state(0, 1, data_model.CellState.flag)
+    assert board.set_state(4, 4, data_model.CellState.empty)
+
+    assert board.drain_changes() == [1, 24]
+    assert board.drain_changes() == []
+
+
+def test_solve_solves_hard_board(sample_hard_board):
+    """Test worklist solve clears the whole hard 5x5 board."""
+    board = solver.Board(sample_hard_board)
+
+    stats = scheduler.solve(board, STRATEGIES)
+
+    assert board.get_all_cells_by_state(data_model.CellState.unmarked) == []
+    assert stats.deductions > 0
+    assert stats.cells_changed == 16
+
+
+@pytest.mark.parametrize("storage", [solver.STORAGE_CELLS, solver.STORAGE_COMPACT])
+def test_solve_matches_naive(storage):
+    """Test worklist solve reaches the same board as restarting after each change."""
+    puzzle = generator.generate_puzzle(30, 30, clue_density=0.6, seed=7)
+    board = solver.Board(puzzle.clues, storage=storage)
+    naive_board = solver.Board(puzzle.clues, storage=storage)
+
+    stats = scheduler.solve(board, STRATEGIES)
+    naive_stats = scheduler.solve_naive(naive_board, STRATEGIES)
+
+    assert board_states(board) == board_states(naive_board)
+    assert stats.cells_changed == naive_stats.cells_changed
+    assert stats.invocations < naive_stats.invocations
+    # the estimate only bounds the real saving.
+    assert naive_stats.invocations <= naive_stats.rescan_upper_bound
+    assert naive_stats.invocations - stats.invocations <= stats.skipped_upper_bound
+
+
+def test_solve_reports_updates(sample_hard_board):
+    """Test on_update receives the cells changed by each deduction."""
+    board = solver.Board(sample_hard_board)
+    updates = []
+
+    stats = scheduler.solve(board, STRATEGIES, on_update=updates.append)
+
+    assert len(updates) == stats.deductions
+    assert sum(len(u) for u in updates) == stats.cells_changed
+
+
+def test_solve_start_cells(sample_hard_board):
+    """Test only the given number cells are queued first."""
+    board = solver.Board(sample_hard_board)
+    stats = scheduler.solve(board, STRATEGIES, start=[])
+    assert stats.invocations == 0
+    assert board_states(board) == board_states(solver.Board(sample_hard_board))
+
+    # unmarked cells are ignored.
+    start = [r * board.columns + c for r in range(board.rows) for c in range(5)]
+    scheduler.solve(board, STRATEGIES, start=start)
+    reference = solver.Board(sample_hard_board)
+    scheduler.solve(reference, STRATEGIES)
+    assert board_states(board) == board_states(reference)
+
+
+@pytest.mark.parametrize("storage", [solver.STORAGE_CELLS, solver.STORAGE_COMPACT])
+def test_batch_collects_then_commits(sample_hard_board, storage):
+    """Test set_state only collects states until the batch is committed."""
+    board = solver.Board(sample_hard_board, storage=storage)
+    board.begin_batch()
+
+    assert board.set_state(0, 1, data_model.CellState.flag)
+    assert board.set_state(0, 1, data_model.CellState.flag)
+    assert not board.set_state(0, 0, data_model.CellState.is_number)
+    assert board.set_state(4, 4, data_model.CellState.empty)
+    assert board[0][1].state == data_model.CellState.unmarked
+    assert board.pending_changes() == 2
+
+    assert board.commit_batch() == [1, 24]
+    assert board[0][1].state == data_model.CellState.flag
+    assert board.drain_changes() == [1, 24]
+    assert board.constraint(0, 0).remaining == 1
+
+
+def test_batch_conflict(sample_hard_board):
+    """Test two states for the same cell raise and drop the batch."""
+    board = solver.Board(sample_hard_board)
+    board.begin_batch()
+    board.set_state(0, 1, data_model.CellState.flag)
+
+    with pytest.raises(Exception):
+        board.set_state(0, 1, data_model.CellState.empty)
+    assert board.set_state(4, 4, data_model.CellState.empty)
+    assert board.drain_changes() == [24]
+
+
+@pytest.mark.parametrize("storage", [solver.STORAGE_CELLS, solver.STORAGE_COMPACT])
+def test_solve_batched(storage):
+    """Test batched solve reaches the same board with one update per pass."""
+    puzzle = generator.generate_puzzle(30, 30, clue_density=0.6, seed=7)
+    board = solver.Board(puzzle.clues, storage=storage)
+    batched_board = solver.Board(puzzle.clues, storage=storage)
+    updates = []
+
+    stats = scheduler.solve(board, STRATEGIES)
+    batched_stats = scheduler.solve(
+        batched_board, STRATEGIES, on_update=updates.append, batched=True
+    )
+
+    assert board_states(batched_board) == board_states(board)
+    assert batched_stats.cells_changed == stats.cells_changed
+    assert len(updates) == batched_stats.commits
+    assert batched_stats.commits < stats.commits == stats.deductions
+    assert sum(len(u) for u in updates) == stats.cells_changed
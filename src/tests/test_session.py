@@ -0,0 +1,148 @@
+"""Unit test for session module."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from daily_minesweeper import dom, parser, session, utils
+
+HARD_5_MAP = "./src/tests/data/minesweeper-5x5-hard.html"
+
+
+class FakeDriver:
+    """Session answering health checks until it is broken or quit."""
+
+    def __init__(self):
+        """Start alive."""
+        self.alive = True
+        self.quit_calls = 0
+
+    def execute_script(self, script, *args):
+        """Answer the health check of `session.is_alive`."""
+        if not self.alive:
+            raise WebDriverException("session deleted")
+        return 1
+
+    def quit(self):
+        """Record the quit, fail like a dead session."""
+        self.quit_calls += 1
+        if not self.alive:
+            raise WebDriverException("session deleted")
+        self.alive = False
+
+
+@pytest.fixture
+def pool():
+    """Pool of fake sessions."""
+    with session.DriverPool(factory=FakeDriver) as pool:
+        yield pool
+
+
+def test_session_is_reused(pool):
+    """Test a released session is handed out again."""
+    with pool.session() as first:
+        pass
+    with pool.session() as second:
+        pass
+
+    assert first is second
+    assert (pool.created, pool.reused, pool.discarded) == (1, 1, 0)
+
+
+def test_dead_session_is_replaced(pool):
+    """Test a session failing the health check is quit and replaced."""
+    with pool.session() as first:
+        pass
+    first.alive = False
+
+    with pool.session() as second:
+        pass
+
+    assert second is not first
+    assert first.quit_calls == 1
+    assert (pool.created, pool.discarded) == (2, 1)
+
+
+def test_session_quit_on_driver_error(pool):
+    """Test a session is not kept when the block raised a driver error."""
+    with pytest.raises(WebDriverException), pool.session() as first:
+        raise WebDriverException("timeout")
+    with pytest.raises(ValueError), pool.session() as second:
+        raise ValueError("not a driver error")
+
+    assert first is not second
+    assert first.quit_calls == 1
+    assert pool.acquire() is second
+
+
+def test_close_quits_every_session():
+    """Test closing quits idle and busy sessions, extra idle ones on release."""
+    pool = session.DriverPool(factory=FakeDriver, max_idle=1)
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+    assert second.quit_calls == 1
+
+    busy = pool.acquire()
+    pool.close()
+    assert first.quit_calls == busy.quit_calls == 1
+    pool.release(busy)
+    assert pool.discarded == 3
+
+
+def test_pool_shared_by_threads():
+    """Test a session is never handed to two threads at once."""
+    held = set()
+    lock = threading.Lock()
+
+    def use(pool):
+        with pool.session() as driver:
+            with lock:
+                assert driver not in held
+                held.add(driver)
+            time.sleep(0.001)
+            with lock:
+                held.remove(driver)
+
+    with session.DriverPool(factory=FakeDriver, max_idle=4) as pool:
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(lambda _: use(pool), range(200)))
+        assert pool.created + pool.reused == 200
+        assert not pool._busy
+        assert len(pool._idle) <= 4
+
+
+def test_sample_game_from_pool(pool, monkeypatch):
+    """Test sample games are read from one pooled session."""
+    html = Path(HARD_5_MAP).read_text(encoding="utf-8")
+    monkeypatch.setattr(FakeDriver, "get", lambda self, url: None, raising=False)
+    monkeypatch.setattr(FakeDriver, "page_source", html, raising=False)
+
+    for _ in range(3):
+        game = utils.get_sample_minesweeper_game("stand-in", pool)
+        assert parser.parse_page_into_array(game) == parser.parse_html_into_array(html)
+    assert (pool.created, pool.reused) == (1, 2)
+
+
+def test_browser_session_reused_on_local_page(tmp_path):
+    """Test a real browser session is reused across loads of a static page."""
+    html = Path(HARD_5_MAP).read_text(encoding="utf-8")
+    page = tmp_path / "page.html"
+    page.write_text(f"<html><body>{html}</body></html>", encoding="utf-8")
+
+    with session.DriverPool(factory=lambda: session.new_firefox(True)) as pool:
+        try:
+            driver = pool.acquire()
+        except WebDriverException as e:
+            pytest.skip(f"firefox not available: {e.msg}")
+        pool.release(driver)
+
+        for _ in range(2):
+            with pool.session() as browser:
+                browser.get(page.as_uri())
+                assert dom.extract_grid(browser).rows == 5
+        assert (pool.created, pool.reused) == (1, 2)
@@ -54,6 +54,19 @@ def test_get_adjacent_cells(sample_easy_board):
     assert (2, 2) in result
 
 
+def test_adjacent_indices_non_square():
+    """Test neighbor table on a board with more columns than rows."""
+    board = solver.Board(initial_map=[["", "", "1"], ["2", "", ""]])
+
+    assert list(board.adjacent_indices(0)) == [1, 3, 4]
+    assert list(board.adjacent_indices(4)) == [0, 1, 2, 3, 5]
+    assert board.get_adjacent_cells(1, 2) == [(0, 1), (0, 2), (1, 1)]
+    assert board.get_adjacent_cell_state(0, 1, data_model.CellState.is_number) == [
+        (0, 2),
+        (1, 0),
+    ]
+
+
 def test_getitem_board(sample_easy_board):
     """Test getitem dunder method."""
     board = solver.Board(initial_map=sample_easy_board)
@@ -262,3 +275,105 @@ def test_flag_remaining_unmarked_skip_zero():
     # ignore zero value
     result = solver.flag_remaining_unmarked(2, 2, board)
     assert not result
+
+
+def test_compact_board_matches_cells(sample_easy_board):
+    """Test compact storage exposes the same cells as the default storage."""
+    board = solver.Board(sample_easy_board)
+    compact = solver.Board(sample_easy_board, storage=solver.STORAGE_COMPACT)
+
+    for r in range(board.rows):
+        for c in range(board.columns):
+            assert compact[r][c] == board[r][c]
+            assert compact.board[r][c].x == c
+            assert compact.board[r][c].y == r
+
+    assert compact.get_adjacent_cell_state(
+        2, 1, data_model.CellState.is_number
+    ) == board.get_adjacent_cell_state(2, 1, data_model.CellState.is_number)
+
+    with pytest.raises(IndexError):
+        compact[0][5]
+
+
+def test_compact_board_strategies():
+    """Test strategies update a compact board through its cell views."""
+    sample_board = [
+        ["1", "", "1", "", ""],
+        ["", "", "", "1", ""],
+        ["1", "", "0", "", ""],
+        ["1", "", "1", "2", ""],
+        ["1", "", "", "", ""],
+    ]
+    board = solver.Board(sample_board, storage=solver.STORAGE_COMPACT)
+
+    assert solver.flag_all_numbers(2, 2, board)
+    assert solver.flag_all_numbers(2, 0, board)
+
+    assert board[1][0].state == data_model.CellState.flag
+    for r, c in [(1, 2), (1, 1), (2, 1), (3, 1), (2, 3)]:
+        assert board[r][c].state == data_model.CellState.empty
+
+    assert board.get_all_cells_by_state(data_model.CellState.flag) == [(1, 0)]
+
+
+def test_invalid_storage(sample_easy_board):
+    """Test unknown storage mode raises."""
+    with pytest.raises(Exception):
+        solver.Board(sample_easy_board, storage="numpy")
+
+
+@pytest.mark.parametrize("storage", [solver.STORAGE_CELLS, solver.STORAGE_COMPACT])
+def test_constraint_records_follow_set_state(sample_easy_board, storage):
+    """Test constraint records are updated when cells are flagged or emptied."""
+    board = solver.Board(sample_easy_board, storage=storage)
+
+    assert board.constraint(1, 2) == (
+        3,
+        frozenset([(0, 1), (0, 2), (0, 3), (1, 1), (2, 1), (2, 3)]),
+    )
+
+    board.set_state(0, 1, data_model.CellState.flag)
+    board.set_state(2, 3, data_model.CellState.empty)
+    assert board.constraint(1, 2) == (2, frozenset([(0, 2), (0, 3), (1, 1), (2, 1)]))
+    assert board.constraint(0, 0) == (1, frozenset([(1, 0), (1, 1)]))
+
+    board.set_state(0, 1, data_model.CellState.unmarked)
+    assert board.constraint(1, 2).remaining == 3
+    assert (0, 1) in board.constraint(1, 2).unknown
+
+
+def test_refresh_constraints_after_direct_change(sample_easy_board):
+    """Test records can be rebuilt after cells are changed without set_state."""
+    board = solver.Board(sample_easy_board)
+    assert board.constraint(0, 0).remaining == 2
+
+    board[1][0].state = data_model.CellState.flag
+    board.refresh_constraints()
+
+    assert board.constraint(0, 0) == (1, frozenset([(0, 1), (1, 1)]))
+
+
+def test_change_count(sample_easy_board):
+    """Test applied and collected states are counted."""
+    board = solver.Board(sample_easy_board)
+    assert board.change_count == 0
+    board.set_state(0, 1, data_model.CellState.flag)
+    board.set_state(0, 1, data_model.CellState.flag)
+    assert board.change_count == 1
+
+    board.begin_batch()
+    board.set_state(2, 3, data_model.CellState.empty)
+    assert board.change_count == 2
+    board.commit_batch()
+    assert board.change_count == 3
+
+
+def test_constraint_at(sample_easy_board):
+    """Test the record by index matches `constraint`."""
+    board = solver.Board(sample_easy_board)
+    remaining, unmarked = board.constraint_at(1 * board.columns + 2)
+    assert (
+        remaining,
+        {divmod(i, board.columns) for i in unmarked},
+    ) == board.constraint(1, 2)
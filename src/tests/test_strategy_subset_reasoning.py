@@ -0,0 +1,101 @@
+"""Test file for bitmask subset reasoning, against the neighbor pattern strategies."""
+
+import pytest
+
+from daily_minesweeper import data_model, generator, scheduler, solver
+
+
+def test_subset_reasoning_4_1():
+    """Test the 4 - 1 pattern flags the top row and empties the bottom row."""
+    sample_board = [
+        ["", "", "", "", ""],
+        ["", "", "4", "", ""],
+        ["", "", "1", "", ""],
+        ["", "", "", "", ""],
+        ["", "", "", "", ""],
+    ]
+    board = solver.Board(sample_board)
+
+    result = solver.subset_reasoning(1, 2, board)
+    assert result
+
+    for r, c in [(0, 1), (0, 2), (0, 3)]:
+        assert board[r][c].state == data_model.CellState.flag
+
+    for r, c in [(3, 1), (3, 2), (3, 3)]:
+        assert board[r][c].state == data_model.CellState.empty
+
+    result = solver.subset_reasoning(1, 2, board)
+    assert not result
+
+
+def test_subset_reasoning_4_2_two_cells_away():
+    """Test a number 2 cells away, same as suspect_adjacent_candidates 4 - 2."""
+    sample_board = [
+        ["", "", "", "", ""],
+        ["", "", "", "", ""],
+        ["4", "", "2", "", ""],
+        ["", "", "", "", ""],
+        ["", "", "", "", ""],
+    ]
+    board = solver.Board(sample_board)
+
+    result = solver.subset_reasoning(2, 0, board)
+    assert result
+
+    for r, c in [(1, 0), (3, 0)]:
+        assert board[r][c].state == data_model.CellState.flag
+
+    for r, c in [(1, 2), (1, 3), (2, 3), (3, 3), (3, 2)]:
+        assert board[r][c].state == data_model.CellState.empty
+
+
+def test_subset_reasoning_single_number():
+    """Test a number alone is flagged or emptied like flag_all_numbers."""
+    sample_board = [
+        ["3", "", "", ""],
+        ["", "", "", ""],
+        ["", "", "", ""],
+        ["", "", "", "0"],
+    ]
+    board = solver.Board(sample_board)
+
+    assert solver.subset_reasoning(0, 0, board)
+    assert board.get_all_cells_by_state(data_model.CellState.flag) == [
+        (0, 1),
+        (1, 0),
+        (1, 1),
+    ]
+
+    assert solver.subset_reasoning(3, 3, board)
+    assert board.get_all_cells_by_state(data_model.CellState.empty) == [
+        (2, 2),
+        (2, 3),
+        (3, 2),
+    ]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_subset_reasoning_finds_superset(seed):
+    """Test subset reasoning alone solves every cell the pattern strategies solve."""
+    puzzle = generator.generate_puzzle(25, 25, clue_density=0.5, seed=seed)
+    patterns = solver.Board(puzzle.clues)
+    subset = solver.Board(puzzle.clues)
+
+    scheduler.solve(
+        patterns,
+        [
+            solver.flag_all_numbers,
+            solver.flag_remaining_unmarked,
+            solver.deduce_from_neighbors_and_flag,
+            solver.suspect_adjacent_candidates_and_mark_neighbor_empty,
+        ],
+    )
+    scheduler.solve(subset, [solver.subset_reasoning])
+
+    for state in (data_model.CellState.flag, data_model.CellState.empty):
+        found = set(subset.get_all_cells_by_state(state))
+        assert set(patterns.get_all_cells_by_state(state)) <= found
+
+    for r, c in subset.get_all_cells_by_state(data_model.CellState.flag):
+        assert (r, c) in puzzle.mines
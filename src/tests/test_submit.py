@@ -0,0 +1,142 @@
+"""Unit test for submit module."""
+
+import pytest
+from selenium.common.exceptions import JavascriptException
+
+from daily_minesweeper import submit
+
+
+class FakeDriver:
+    """Driver flagging the cells of each script call like `submit.FLAG_SCRIPT`.
+
+    The call number `fail_at` flags `fail_after_cells` cells of its chunk, then
+    raises if `raises` or returns the count otherwise.
+    """
+
+    def __init__(
+        self,
+        cells: int,
+        fail_at: int | None = None,
+        fail_after_cells: int = 0,
+        raises: bool = True,
+    ):
+        """Page with `cells` cell elements."""
+        self.cells = cells
+        self.fail_at = fail_at
+        self.fail_after_cells = fail_after_cells
+        self.raises = raises
+        self.flagged = []
+        self.marked = set()
+        self.calls = 0
+
+    def execute_script(self, script, game_id, positions):
+        """Flag the positions, or count the leading ones marked."""
+        if script == submit.FLAGGED_SCRIPT:
+            count = 0
+            for p in positions:
+                if p not in self.marked:
+                    break
+                count += 1
+            return count
+
+        self.calls += 1
+        self.marked.difference_update(positions)
+        limit = len(positions)
+        if self.calls == self.fail_at:
+            limit = self.fail_after_cells
+        flagged = 0
+        for p in positions[:limit]:
+            if p >= self.cells:
+                break
+            self.flagged.append(p)
+            self.marked.add(p)
+            flagged += 1
+        if self.calls == self.fail_at and self.raises:
+            raise JavascriptException("script error")
+        return flagged
+
+
+@pytest.fixture
+def positions():
+    """Document order of 45 cells to flag."""
+    return list(range(0, 90, 2))
+
+
+def test_submit_by_script_in_chunks(positions):
+    """Test cells are flagged with one script call per chunk."""
+    driver = FakeDriver(100)
+    report = submit.submit_flags_by_script(driver, positions, chunk_size=20)
+
+    assert driver.flagged == positions
+    assert report.flags == len(positions)
+    assert report.round_trips == driver.calls == 3
+    assert report.backend == submit.BACKEND_SCRIPT
+
+
+def test_submit_by_script_stops_at_failed_chunk(positions):
+    """Test only the cells before the failed one are counted."""
+    driver = FakeDriver(100, fail_at=2)
+    report = submit.submit_flags_by_script(driver, positions, chunk_size=20)
+    assert report.flags == 20
+    # the failed call and the read of the flagged cells.
+    assert report.round_trips == 3
+
+    driver = FakeDriver(50)
+    report = submit.submit_flags_by_script(driver, positions, chunk_size=20)
+    assert report.flags == len(driver.flagged) == 25
+
+
+@pytest.mark.parametrize("raises", [True, False])
+def test_submit_by_script_counts_part_of_chunk(positions, raises):
+    """Test the cells flagged before a chunk fails are counted."""
+    driver = FakeDriver(100, fail_at=2, fail_after_cells=7, raises=raises)
+    report = submit.submit_flags_by_script(driver, positions, chunk_size=20)
+    assert report.flags == len(driver.flagged) == 27
+    assert report.round_trips == 2 + raises
+
+
+def test_submit_falls_back_to_actions(positions, monkeypatch):
+    """Test the cells left after a failed chunk are clicked with ActionChains."""
+    clicked = []
+
+    def submit_flags_by_actions(driver, elements):
+        clicked.extend(elements)
+        return submit.SubmitReport(
+            submit.BACKEND_ACTIONS, flags=len(elements), round_trips=len(elements)
+        )
+
+    monkeypatch.setattr(submit, "submit_flags_by_actions", submit_flags_by_actions)
+    elements = [f"cell {i}" for i in range(100)]
+
+    driver = FakeDriver(100, fail_at=2)
+    report = submit.submit_flags(driver, positions, lambda: elements, chunk_size=20)
+    assert driver.flagged + [int(e.split()[1]) for e in clicked] == positions
+    assert report.flags == len(positions)
+    assert report.backend == submit.BACKEND_ACTIONS
+    assert report.round_trips == 3 + 1 + 25
+
+    clicked.clear()
+    report = submit.submit_flags(
+        FakeDriver(100), positions, lambda: pytest.fail("no fallback expected")
+    )
+    assert report.backend == submit.BACKEND_SCRIPT
+    assert report.round_trips == 1
+    assert not clicked
+
+
+def test_submit_resumes_after_part_of_chunk(positions, monkeypatch):
+    """Test a cell flagged before its chunk fails is not clicked again."""
+    clicked = []
+
+    def submit_flags_by_actions(driver, elements):
+        clicked.extend(elements)
+        return submit.SubmitReport(submit.BACKEND_ACTIONS, flags=len(elements))
+
+    monkeypatch.setattr(submit, "submit_flags_by_actions", submit_flags_by_actions)
+    elements = list(range(100))
+
+    driver = FakeDriver(100, fail_at=2, fail_after_cells=7)
+    report = submit.submit_flags(driver, positions, lambda: elements, chunk_size=20)
+    assert driver.flagged + clicked == positions
+    assert not set(driver.flagged) & set(clicked)
+    assert report.flags == len(positions)
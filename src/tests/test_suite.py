@@ -0,0 +1,53 @@
+"""Unit test for suite module."""
+
+from daily_minesweeper import suite
+
+
+def test_run_suite():
+    """Test a small suite reports timings for the board and each strategy."""
+    results = suite.run_suite(sizes=(5, 10), repeat=1)
+    assert list(results) == ["5x5@0.1", "10x10@0.1"]
+
+    result = results["10x10@0.1"]
+    assert result["cells"] > 0
+    assert result["cells_per_second"] > 0
+    assert result["construct_ms"] > 0
+    assert "subset_reasoning" in result["strategies"]
+
+
+def test_find_regressions():
+    """Test only cases slower than the tolerance are flagged."""
+    baseline = {
+        "a": {"cells_per_second": 100.0},
+        "b": {"cells_per_second": 100.0},
+    }
+    results = {
+        "a": {"cells_per_second": 90.0},
+        "b": {"cells_per_second": 50.0},
+        "c": {"cells_per_second": 1.0},
+    }
+    assert suite.find_regressions(results, baseline, tolerance=0.2) == {"b": 0.5}
+
+
+def test_save_and_load_baseline(tmp_path):
+    """Test results are merged into the baseline file."""
+    path = tmp_path / "baseline.json"
+    assert suite.load_baseline(path) == {}
+
+    suite.save_baseline(path, {"a": {"cells_per_second": 1.0}})
+    suite.save_baseline(path, {"b": {"cells_per_second": 2.0}})
+    assert suite.load_baseline(path) == {
+        "a": {"cells_per_second": 1.0},
+        "b": {"cells_per_second": 2.0},
+    }
+
+
+def test_main_flags_regression(tmp_path):
+    """Test the exit code is 1 once throughput falls below the baseline."""
+    path = tmp_path / "baseline.json"
+    assert suite.main(["suite", "--sizes", "5", "--baseline", str(path), "--save"]) == 0
+
+    baseline = suite.load_baseline(path)
+    baseline["5x5@0.1"]["cells_per_second"] *= 100
+    suite.save_baseline(path, baseline)
+    assert suite.main(["suite", "--sizes", "5", "--baseline", str(path)]) == 1